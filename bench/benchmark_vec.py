@@ -4,17 +4,49 @@ SimVector Benchmark
 
 This script measures the throughput (sensor value updates per second) for a SimVector
 with 1,000 sensors running for 10 seconds.
+
+Run it as a script or as a module from the repository root:
+
+    python bench/benchmark_vec.py --sensors 1000 --duration 10 --json
+    python -m bench.benchmark_vec
 """
 
 import time
-import json
 import platform
-import argparse
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+
 from spaxiom import SimVector
 
+# Minimum number of sensor reads performed between two clock checks
+READS_PER_CLOCK_CHECK = 1024
+
+# Sensors per tile in the tiled benchmark; 128 sensor objects (~25 KB) fit in
+# a typical 32-48 KB L1 data cache
+TILE = 128
+
+# Number of times each tile is read before moving on to the next one
+TILE_REPEAT = 8
+
+
+def _passes_per_check(num_sensors: int) -> int:
+    """
+    Number of full passes over the sensors to run between clock checks.
+
+    Small sensor groups are read several times per check so that the cost of
+    querying the clock stays amortized over at least READS_PER_CLOCK_CHECK reads.
+
+    Args:
+        num_sensors: Number of sensors read in each pass
+
+    Returns:
+        Number of passes per clock check (at least 1)
+    """
+    return max(1, READS_PER_CLOCK_CHECK // max(num_sensors, 1))
+
 
 def track_updates(sim_vector, duration: float = 10.0) -> int:
     """
@@ -27,16 +59,88 @@ def track_updates(sim_vector, duration: float = 10.0) -> int:
     Returns:
         Total number of sensor reads completed
     """
-    start_time = time.time()
-    end_time = start_time + duration
+    # Bind hot names to locals so the loop body avoids attribute lookups,
+    # including each sensor's bound read method
+    perf_counter_ns = time.perf_counter_ns
+    reads = [sensor.read for sensor in sim_vector.sensors]
+    passes = range(_passes_per_check(len(reads)))
+    reads_per_check = len(reads) * len(passes)
+    end_ns = perf_counter_ns() + int(duration * 1e9)
+    total_reads = 0
+
+    # Track reads for the specified duration, checking the monotonic clock
+    # and updating the count once per batch of passes rather than per read
+    while perf_counter_ns() < end_ns:
+        for _ in passes:
+            for read in reads:
+                read()
+        total_reads += reads_per_check
+
+    return total_reads
+
+
+def track_tiled_updates(
+    sim_vector, duration: float = 10.0, tile: int = TILE, repeat: int = TILE_REPEAT
+) -> int:
+    """
+    Track how many sensor updates occur in the given duration when the sensors
+    are traversed in cache-sized tiles.
+
+    Each tile is read `repeat` times before moving on, so the sensor objects
+    stay resident in L1 instead of being evicted on every full pass. Compared
+    with track_updates() this shows how much of the per-read cost comes from
+    cache misses.
+
+    Args:
+        sim_vector: The SimVector instance to benchmark
+        duration: Duration of the benchmark in seconds
+        tile: Number of sensors per tile
+        repeat: Number of times each tile is read in a row
+
+    Returns:
+        Total number of sensor reads completed
+    """
+    perf_counter_ns = time.perf_counter_ns
+    reads = [sensor.read for sensor in sim_vector.sensors]
+    tiles = [reads[start : start + tile] for start in range(0, len(reads), tile)]
+    repeats = range(repeat)
+    passes = range(_passes_per_check(len(reads) * repeat))
+    reads_per_check = len(reads) * repeat * len(passes)
+    end_ns = perf_counter_ns() + int(duration * 1e9)
     total_reads = 0
 
-    # Track reads for the specified duration
-    while time.time() < end_time:
-        # Read all sensors to track how many reads can be done
-        for sensor in sim_vector.sensors:
-            sensor.read()
-            total_reads += 1
+    while perf_counter_ns() < end_ns:
+        for _ in passes:
+            for tile_reads in tiles:
+                for _ in repeats:
+                    for read in tile_reads:
+                        read()
+        total_reads += reads_per_check
+
+    return total_reads
+
+
+def track_vectorized_updates(sim_vector, duration: float = 10.0) -> int:
+    """
+    Track how many sensor values are computed in the given duration using
+    SimVector.read_all(), which evaluates every sensor in one NumPy call.
+
+    Args:
+        sim_vector: The SimVector instance to benchmark
+        duration: Duration of the benchmark in seconds
+
+    Returns:
+        Total number of sensor values computed
+    """
+    perf_counter_ns = time.perf_counter_ns
+    read_all = sim_vector.read_all
+    n = len(sim_vector)
+    end_ns = perf_counter_ns() + int(duration * 1e9)
+    total_reads = 0
+
+    while perf_counter_ns() < end_ns:
+        read_all()
+        total_reads += n
 
     return total_reads
 
@@ -54,15 +158,69 @@ def benchmark_single_thread(sim_vector, duration: float = 10.0) -> float:
     """
     print(f"Running single-threaded benchmark for {duration:.1f} seconds...")
 
+    start_ns = time.perf_counter_ns()
     total_reads = track_updates(sim_vector, duration)
+    elapsed_ns = time.perf_counter_ns() - start_ns
 
-    # Calculate throughput
-    throughput = total_reads / duration
+    # Calculate throughput over the measured run time, since the last batch
+    # may overrun the deadline
+    throughput = total_reads / (max(elapsed_ns, 1) / 1e9)
+    return throughput
+
+
+def benchmark_tiled(sim_vector, duration: float = 10.0) -> float:
+    """
+    Benchmark single-threaded read performance with an L1-resident working set.
+
+    Args:
+        sim_vector: The SimVector instance to benchmark
+        duration: Duration of the benchmark in seconds
+
+    Returns:
+        Updates per second (throughput)
+    """
+    print(
+        f"Running tiled benchmark ({TILE} sensors x {TILE_REPEAT}) for {duration:.1f} seconds..."
+    )
+
+    start_ns = time.perf_counter_ns()
+    total_reads = track_tiled_updates(sim_vector, duration)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+
+    # Calculate throughput over the measured run time, since the last batch
+    # may overrun the deadline
+    throughput = total_reads / (max(elapsed_ns, 1) / 1e9)
+    return throughput
+
+
+def benchmark_vectorized(sim_vector, duration: float = 10.0) -> float:
+    """
+    Benchmark vectorized read performance.
+
+    Args:
+        sim_vector: The SimVector instance to benchmark
+        duration: Duration of the benchmark in seconds
+
+    Returns:
+        Updates per second (throughput)
+    """
+    print(f"Running vectorized benchmark for {duration:.1f} seconds...")
+
+    start_ns = time.perf_counter_ns()
+    total_reads = track_vectorized_updates(sim_vector, duration)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+
+    # Calculate throughput over the measured run time, since the last batch
+    # may overrun the deadline
+    throughput = total_reads / (max(elapsed_ns, 1) / 1e9)
     return throughput
 
 
 def benchmark_multi_thread(
-    sim_vector, duration: float = 10.0, num_threads: int = 4
+    sim_vector,
+    duration: float = 10.0,
+    num_threads: int = 4,
+    vectorized: bool = False,
 ) -> float:
     """
     Benchmark multi-threaded read performance.
@@ -71,53 +229,99 @@ def benchmark_multi_thread(
         sim_vector: The SimVector instance to benchmark
         duration: Duration of the benchmark in seconds
         num_threads: Number of threads to use for reading sensors
+        vectorized: If True, each thread evaluates its share of the sensors with
+                    SimVector.read_slice(), which releases the GIL inside NumPy,
+                    instead of calling read() on every sensor
 
     Returns:
         Updates per second (throughput)
     """
+    mode = "vectorized " if vectorized else ""
     print(
-        f"Running multi-threaded benchmark ({num_threads} threads) for {duration:.1f} seconds..."
+        f"Running {mode}multi-threaded benchmark ({num_threads} threads) for {duration:.1f} seconds..."
     )
 
-    start_time = time.time()
-    total_reads = 0
+    duration_ns = int(duration * 1e9)
+    # Shared start time on the monotonic clock, set once every worker is ready
+    start = {}
 
-    # Divide sensors among threads
-    sensors_per_thread = len(sim_vector.sensors) // num_threads
+    def mark_start():
+        start["ns"] = time.perf_counter_ns()
 
     # Function for each thread to execute
     def thread_func(sensors):
-        nonlocal total_reads
         local_reads = 0
-        end_time = start_time + duration
-
-        while time.time() < end_time:
-            for sensor in sensors:
-                sensor.read()
-                local_reads += 1
-
-        return local_reads
-
-    # Create thread groups
-    sensor_groups = []
-    for i in range(num_threads):
-        start_idx = i * sensors_per_thread
-        end_idx = (
-            start_idx + sensors_per_thread
-            if i < num_threads - 1
-            else len(sim_vector.sensors)
-        )
-        sensor_groups.append(sim_vector.sensors[start_idx:end_idx])
+        perf_counter_ns = time.perf_counter_ns
+        reads = [sensor.read for sensor in sensors]
+        passes = range(_passes_per_check(len(reads)))
+        reads_per_check = len(reads) * len(passes)
+        start_barrier.wait()
+        end_ns = start["ns"] + duration_ns
+
+        while (now_ns := perf_counter_ns()) < end_ns:
+            for _ in passes:
+                for read in reads:
+                    read()
+            local_reads += reads_per_check
+
+        return local_reads, now_ns
+
+    # Function for each thread in vectorized mode
+    def vectorized_thread_func(bounds):
+        start_idx, end_idx = bounds
+        n = end_idx - start_idx
+        out = np.empty(n)
+        local_reads = 0
+        perf_counter_ns = time.perf_counter_ns
+        read_slice = sim_vector.read_slice
+        start_barrier.wait()
+        end_ns = start["ns"] + duration_ns
+
+        while (now_ns := perf_counter_ns()) < end_ns:
+            read_slice(start_idx, end_idx, out=out)
+            local_reads += n
+
+        return local_reads, now_ns
+
+    # Divide sensors among threads into contiguous groups whose sizes differ by
+    # at most one, skipping empty groups when there are more threads than sensors
+    n = len(sim_vector)
+    group_bounds = [
+        (int(group[0]), int(group[-1]) + 1)
+        for group in np.array_split(np.arange(n), num_threads)
+        if len(group)
+    ]
+
+    if not group_bounds:
+        return 0.0
+
+    # Workers wait at the barrier until all of them are running, so no thread
+    # gets a head start while the others are still being spawned; the start
+    # time is taken when the last one arrives, so thread startup is not
+    # counted against the duration
+    start_barrier = threading.Barrier(len(group_bounds), action=mark_start)
 
     # Run threads
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        results = list(executor.map(thread_func, sensor_groups))
+        if vectorized:
+            futures = [
+                executor.submit(vectorized_thread_func, bounds)
+                for bounds in group_bounds
+            ]
+        else:
+            futures = [
+                executor.submit(thread_func, sim_vector.sensors[start_idx:end_idx])
+                for start_idx, end_idx in group_bounds
+            ]
+        results = [future.result() for future in futures]
 
     # Sum up total reads
-    total_reads = sum(results)
+    total_reads = sum(reads for reads, _ in results)
 
-    # Calculate throughput
-    throughput = total_reads / duration
+    # Calculate throughput over the measured run time, since the last batch
+    # of each worker may overrun the deadline
+    elapsed_ns = max(finish_ns for _, finish_ns in results) - start["ns"]
+    throughput = total_reads / (max(elapsed_ns, 1) / 1e9)
     return throughput
 
 
@@ -192,16 +396,28 @@ def run_benchmark(
         # Run single-threaded benchmark
         throughput_single = benchmark_single_thread(sim, duration)
 
+        # Run the same reads with a cache-resident working set
+        throughput_tiled = benchmark_tiled(sim, duration)
+
         # Run multi-threaded benchmark
         throughput_multi = benchmark_multi_thread(sim, duration, num_threads)
 
+        # Run vectorized benchmarks
+        throughput_vectorized = benchmark_vectorized(sim, duration)
+        throughput_multi_vectorized = benchmark_multi_thread(
+            sim, duration, num_threads, vectorized=True
+        )
+
         # Store results
         benchmark_results = {
             "system_info": get_system_info(),
             "config": benchmark_config,
             "results": {
                 "single_thread_throughput": throughput_single,
+                "tile_resident_throughput": throughput_tiled,
                 "multi_thread_throughput": throughput_multi,
+                "vectorized_throughput": throughput_vectorized,
+                "multi_thread_vectorized_throughput": throughput_multi_vectorized,
                 "overall_events_per_second": throughput_multi,
                 "updates_per_sensor_per_second": throughput_multi / num_sensors,
                 "timestamp": time.time(),
@@ -214,9 +430,18 @@ def run_benchmark(
         print(
             f"  - Single-threaded throughput: {throughput_single:.2f} sensor reads/second"
         )
+        print(
+            f"  - Tile-resident throughput: {throughput_tiled:.2f} sensor reads/second"
+        )
         print(
             f"  - Multi-threaded throughput: {throughput_multi:.2f} sensor reads/second"
         )
+        print(
+            f"  - Vectorized throughput: {throughput_vectorized:.2f} sensor reads/second"
+        )
+        print(
+            f"  - Multi-threaded vectorized throughput: {throughput_multi_vectorized:.2f} sensor reads/second"
+        )
         print(f"  - Overall events: {throughput_multi:.2f} sensor updates/second")
         print(
             f"  - Per-sensor updates: {throughput_multi/num_sensors:.2f} updates/sensor/second"
@@ -224,6 +449,8 @@ def run_benchmark(
 
         # Output JSON if requested
         if output_json:
+            import json
+
             if json_file:
                 with open(json_file, "w") as f:
                     json.dump(benchmark_results, f, indent=2)
@@ -242,6 +469,9 @@ def run_benchmark(
 
 def parse_args():
     """Parse command-line arguments."""
+    # Only needed on the command-line path
+    import argparse
+
     parser = argparse.ArgumentParser(description="SimVector performance benchmark")
     parser.add_argument(
         "--sensors", type=int, default=1000, help="Number of sensors (default: 1000)"
@@ -13,7 +13,7 @@ This demonstrates:
 import asyncio
 from spaxiom import Condition, on, within
 from spaxiom.sensor import RandomSensor
-from spaxiom.runtime import start_runtime
+from spaxiom.runtime import start_runtime, use_uvloop
 
 
 def main():
@@ -47,7 +47,8 @@ def main():
     print("Press Ctrl+C to exit")
     print()
 
-    # Start the runtime asynchronously
+    # Start the runtime asynchronously (on uvloop when it is installed)
+    use_uvloop()
     asyncio.run(start_runtime(poll_ms=500))
 
 
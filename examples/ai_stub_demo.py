@@ -13,12 +13,13 @@ import os
 import sys
 import time
 import asyncio
+from collections import deque
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from spaxiom import on, exists, EntitySet, Entity, StubModel
-from spaxiom.runtime import start_runtime
+from spaxiom.runtime import start_runtime, on_tick, use_uvloop
 from spaxiom.sensor import RandomSensor
 
 
@@ -46,6 +47,10 @@ class PersonDetector:
         # Create an entity set to store detected persons
         self.persons = EntitySet("Persons")
 
+        # (timestamp, person) pairs ordered by detection time (oldest on the
+        # left), so expired detections can be dropped from the front
+        self._expiry = deque()
+
         # Track the last detection time to avoid too frequent detections
         self.last_detection_time = 0
 
@@ -76,6 +81,7 @@ class PersonDetector:
 
             # Add to the entity set
             self.persons.add(person)
+            self._expiry.append((current_time, person))
 
             # Update the last detection time
             self.last_detection_time = current_time
@@ -84,9 +90,10 @@ class PersonDetector:
             print(f"Person detected! Confidence: {person.attrs['confidence']:.2f}")
 
         # Remove old detections (older than 5 seconds)
-        for person in list(self.persons):
-            if current_time - person.attrs["timestamp"] > 5.0:
-                self.persons.remove(person)
+        expiry = self._expiry
+        while expiry and current_time - expiry[0][0] > 5.0:
+            _, person = expiry.popleft()
+            self.persons.discard(person)
 
 
 def main():
@@ -112,29 +119,15 @@ def main():
     print("Press Ctrl+C to exit")
     print()
 
-    # Define a custom update loop that updates our detector
-    async def custom_update_loop():
-        try:
-            while True:
-                detector.update()
-                await asyncio.sleep(0.1)  # Update at 10 Hz
-        except asyncio.CancelledError:
-            pass
-
-    # Start the custom update loop
-    update_task = None
+    # Update the detector once per runtime tick (10 Hz with poll_ms=100)
+    on_tick(detector.update)
 
     try:
-        # Start the runtime which processes events
-        loop = asyncio.get_event_loop()
-        update_task = loop.create_task(custom_update_loop())
+        # Start the runtime which processes events (on uvloop when installed)
+        use_uvloop()
         asyncio.run(start_runtime(poll_ms=100))
     except KeyboardInterrupt:
         print("\nDemo stopped by user")
-    finally:
-        # Make sure to clean up
-        if update_task and not update_task.done():
-            update_task.cancel()
 
 
 if __name__ == "__main__":
@@ -15,7 +15,7 @@ or:
 
 import logging
 import importlib
-from spaxiom import Condition, on, within, SensorRegistry
+from spaxiom import ThresholdCondition, on, within, SensorRegistry
 from spaxiom.runtime import start_blocking
 
 # Configure logging
@@ -55,8 +55,8 @@ def main():
         print(f"  - {bedroom_co2}")
 
         # Define CO2 level conditions
-        living_room_high = Condition(lambda: living_room_co2.read() > 800)
-        bedroom_high = Condition(lambda: bedroom_co2.read() > 800)
+        living_room_high = ThresholdCondition(living_room_co2, ">", 800)
+        bedroom_high = ThresholdCondition(bedroom_co2, ">", 800)
 
         # Define sustained conditions
         sustained_high_living = within(10.0, living_room_high)
@@ -93,8 +93,8 @@ def main():
                 f"[Warning] Living room CO2 has been high ({value:.0f} ppm) for over 10 seconds!"
             )
 
-        # Also use the custom is_high method to define another condition
-        very_high_bedroom = Condition(lambda: bedroom_co2.is_high(threshold=1200))
+        # Same check as bedroom_co2.is_high(threshold=1200), declared as a threshold
+        very_high_bedroom = ThresholdCondition(bedroom_co2, ">", 1200)
 
         @on(very_high_bedroom)
         def on_very_high_bedroom():
@@ -7,12 +7,17 @@ with a custom CO2 sensor type. The plugin is registered using the @register_plug
 decorator and will be automatically loaded and initialized at runtime.
 """
 
-import random
 import time
 from typing import Optional, Dict, Any, Tuple
 
+import numpy as np
+
 from spaxiom import register_plugin, Sensor
 from spaxiom.core import SensorRegistry
+from spaxiom.sensor import BufferedDraws
+
+# Shared random generator (PCG64) for the simulated CO2 drift
+_rng = np.random.default_rng()
 
 
 class CO2Sensor(Sensor):
@@ -23,8 +28,14 @@ class CO2Sensor(Sensor):
     - Baseline CO2 level with random fluctuations
     - Configurable sensor sensitivity and range
     - Simulates real-world CO2 concentration patterns
+
+    Drift noise is drawn in batches: each sensor keeps a buffer of unit noise
+    that is refilled with a single vectorized draw once it has been used up.
     """
 
+    # Number of noise samples drawn per refill
+    noise_buffer_size = 256
+
     def __init__(
         self,
         name: str,
@@ -57,9 +68,14 @@ class CO2Sensor(Sensor):
         self.baseline_ppm = baseline_ppm
         self.fluctuation = fluctuation
         self.max_ppm = max_ppm
-        self.last_reading_time = time.time()
+        self.last_reading_time = time.perf_counter()
         self.current_value = baseline_ppm
 
+        # Unit noise in [-1, 1), drawn in blocks on first use
+        self._noise = BufferedDraws(
+            lambda n: _rng.uniform(-1.0, 1.0, n), self.noise_buffer_size
+        )
+
     def _read_raw(self) -> float:
         """
         Generate a simulated CO2 reading in parts per million (ppm).
@@ -67,12 +83,13 @@ class CO2Sensor(Sensor):
         Returns:
             A CO2 concentration value in ppm
         """
-        now = time.time()
+        # Use the monotonic clock so wall-clock adjustments don't distort drift
+        now = time.perf_counter()
         time_diff = now - self.last_reading_time
         self.last_reading_time = now
 
         # Simulate CO2 fluctuations
-        drift = random.uniform(-self.fluctuation, self.fluctuation) * time_diff
+        drift = self._noise.take() * self.fluctuation * time_diff
         self.current_value += drift
 
         # Ensure values stay within reasonable bounds
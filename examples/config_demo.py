@@ -82,6 +82,7 @@ def main():
         print(f"Created sensor: {sensor}")
 
     # Method 2: Load sensors directly from YAML file
+    # (the file was parsed above, so this reuses load_yaml's cached result)
     print("\nMethod 2: Load sensors directly from YAML file")
     sensors = load_sensors_from_yaml(config_path)
     print(f"Loaded {len(sensors)} sensors from configuration file:")
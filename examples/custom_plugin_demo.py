@@ -16,22 +16,36 @@ starting the Spaxiom runtime.
 """
 
 import logging
+import math
 import random
+import time
 from typing import Optional, Dict, Any, Tuple
 
+import numpy as np
+
 from spaxiom import register_plugin, Sensor
 from spaxiom.core import SensorRegistry
+from spaxiom.sensor import BufferedDraws
 
 logger = logging.getLogger(__name__)
 
+# Shared random generator (PCG64) for the sensor noise
+_rng = np.random.default_rng()
+
 
 class CustomSensor(Sensor):
     """
     A custom sensor type that demonstrates how to extend Spaxiom with plugins.
 
     This sensor generates values following a sinusoidal pattern with random noise.
+
+    Noise is drawn in batches: each sensor keeps a buffer of unit noise that is
+    refilled with a single vectorized draw once it has been used up.
     """
 
+    # Number of noise samples drawn per refill
+    noise_buffer_size = 256
+
     def __init__(
         self,
         name: str,
@@ -76,6 +90,11 @@ class CustomSensor(Sensor):
         self.noise_level = noise_level
         self.time_offset = random.random() * 100  # Random starting point
 
+        # Unit noise in [-1, 1), drawn in blocks on first use
+        self._noise = BufferedDraws(
+            lambda n: _rng.uniform(-1.0, 1.0, n), self.noise_buffer_size
+        )
+
     def _read_raw(self) -> float:
         """
         Generate a value based on a sine wave with some random noise.
@@ -83,9 +102,6 @@ class CustomSensor(Sensor):
         Returns:
             A sensor value following a sinusoidal pattern with noise
         """
-        import time
-        import math
-
         # Get current time with offset to create different patterns for each sensor
         t = time.time() + self.time_offset
 
@@ -94,11 +110,8 @@ class CustomSensor(Sensor):
             2 * math.pi * self.frequency * t + self.phase
         )
 
-        # Add random noise
-        noise = random.uniform(-self.noise_level, self.noise_level)
-
         # Combine signal and noise
-        return base_value + noise
+        return base_value + self.noise_level * self._noise.take()
 
     def __repr__(self) -> str:
         """Return a string representation of the custom sensor."""
@@ -122,8 +135,17 @@ def setup_custom_sensor_type():
     # You could do any setup here needed for your custom components
     # For example, registering factory functions, adding custom validation, etc.
 
-    # Create a demonstration sensor
-    CustomSensor(
+    # Register a demonstration sensor; it is only created the first time it
+    # is looked up, so scripts that never use it don't pay for it
+    SensorRegistry().add_factory("demo_sine_sensor", _create_demo_sensor)
+
+    logger.info("CustomSensor plugin registered successfully")
+    print("[Plugin] CustomSensor type registered with a lazy demo_sine_sensor")
+
+
+def _create_demo_sensor() -> CustomSensor:
+    """Create the demonstration sensor on first use."""
+    return CustomSensor(
         name="demo_sine_sensor",
         location=(10.0, 10.0, 0.0),
         amplitude=5.0,
@@ -132,9 +154,6 @@ def setup_custom_sensor_type():
         metadata={"description": "Sine wave demonstration sensor"},
     )
 
-    logger.info("CustomSensor plugin registered successfully")
-    print("[Plugin] CustomSensor type registered and demo_sine_sensor created")
-
 
 # If this file is run directly, demonstrate the plugin functionality
 if __name__ == "__main__":
@@ -152,8 +171,6 @@ if __name__ == "__main__":
     for _ in range(5):
         value = sensor.read()
         print(f"  Value: {value:.4f}")
-        import time
-
         time.sleep(0.2)
 
     print("\nTo use this as a plugin, run a Spaxiom application with:")
@@ -7,6 +7,7 @@ This demonstrates:
 2. Processing each reading and printing the values
 """
 
+import argparse
 import os
 import sys
 import csv
@@ -18,6 +19,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from spaxiom import FileSensor
 
+# Seconds between rows when pacing the output for readability
+ROW_PERIOD_S = 0.5
+
 
 def create_temperature_csv():
     """Create a sample temperature CSV file for demonstration."""
@@ -45,8 +49,14 @@ def create_temperature_csv():
     return filepath
 
 
-def main():
-    """Run the file feed demo that reads temperature data."""
+def main(paced: bool = True):
+    """
+    Run the file feed demo that reads temperature data.
+
+    Args:
+        paced: Whether to print one row every ROW_PERIOD_S seconds; if False,
+               rows are processed as fast as possible
+    """
     # Create a sample temperature CSV file
     csv_path = create_temperature_csv()
     print(f"Created temperature CSV file at: {csv_path}")
@@ -74,6 +84,7 @@ def main():
         print("-----------------------------")
 
         reading_num = 1
+        next_deadline = time.monotonic() + ROW_PERIOD_S
         while True:
             # Read temperature with unit
             temp_value = temp_sensor.read(unit="degC")
@@ -88,8 +99,11 @@ def main():
             # Increment reading counter
             reading_num += 1
 
-            # Pause for readability
-            time.sleep(0.5)
+            # Pause for readability, keeping to a fixed schedule so the time
+            # spent processing a row doesn't add to the interval
+            if paced:
+                time.sleep(max(0.0, next_deadline - time.monotonic()))
+                next_deadline += ROW_PERIOD_S
 
         print("\nEnd of temperature data reached")
 
@@ -100,4 +114,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--no-pace",
+        dest="paced",
+        action="store_false",
+        help="process rows as fast as possible instead of one every 0.5 s",
+    )
+    main(paced=parser.parse_args().paced)
@@ -3,11 +3,12 @@
 File Sensor Demo for Spaxiom DSL.
 
 This demonstrates:
-1. Creating a FileSensor that reads data from a CSV file
+1. Creating FileSensors that read data from the columns of a CSV file
 2. Reading values one at a time, simulating a real-time stream
 3. Using the FileSensor with conditions and event handlers
 """
 
+import argparse
 import os
 import sys
 import csv
@@ -17,7 +18,11 @@ import tempfile
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from spaxiom import FileSensor, Condition, on, within
+from spaxiom import MultiColumnFileSensor, Condition, on, within
+from spaxiom.events import process_events
+
+# Seconds between rows when pacing the output for readability
+ROW_PERIOD_S = 0.5
 
 
 def create_sample_csv():
@@ -44,8 +49,14 @@ def create_sample_csv():
     return filepath
 
 
-def main():
-    """Run the file sensor demo."""
+def main(paced: bool = True):
+    """
+    Run the file sensor demo.
+
+    Args:
+        paced: Whether to print one row every ROW_PERIOD_S seconds; if False,
+               rows are processed as fast as possible
+    """
     # Create a sample CSV file
     csv_path = create_sample_csv()
 
@@ -55,22 +66,13 @@ def main():
         print(f"Reading from: {csv_path}")
         print()
 
-        # Create temperature and humidity sensors
-        temp_sensor = FileSensor(
-            name="temperature",
-            file_path=csv_path,
-            column_name="temperature",
-            unit="degC",  # Specify the unit for temperature
-            location=(0, 0, 0),
-        )
-
-        humidity_sensor = FileSensor(
-            name="humidity",
+        # Create temperature and humidity sensors, parsing the file only once
+        temp_sensor, humidity_sensor = MultiColumnFileSensor(
             file_path=csv_path,
-            column_name="humidity",
-            unit="%",  # Specify the unit for humidity
+            columns=["temperature", "humidity"],
+            units={"temperature": "degC", "humidity": "%"},
             location=(0, 0, 0),
-        )
+        ).views()
 
         # Define conditions that handle None values
         high_temp = Condition(
@@ -111,9 +113,8 @@ def main():
         print("----------------------")
         print()
 
-        from spaxiom.events import process_events
-
         row = 0
+        next_deadline = time.monotonic() + ROW_PERIOD_S
         while True:
             # Read temperature and humidity with units
             temp_value = temp_sensor.read(unit="degC")
@@ -136,8 +137,11 @@ def main():
             # Increment row counter
             row += 1
 
-            # Pause for readability
-            time.sleep(0.5)
+            # Pause for readability, keeping to a fixed schedule so the time
+            # spent processing a row doesn't add to the interval
+            if paced:
+                time.sleep(max(0.0, next_deadline - time.monotonic()))
+                next_deadline += ROW_PERIOD_S
 
         print("\nEnd of data reached")
 
@@ -147,4 +151,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--no-pace",
+        dest="paced",
+        action="store_false",
+        help="process rows as fast as possible instead of one every 0.5 s",
+    )
+    main(paced=parser.parse_args().paced)
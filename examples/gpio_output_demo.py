@@ -20,6 +20,7 @@ import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from spaxiom import Condition, on
+from spaxiom.events import process_events
 
 # Check if we're on Linux and if GPIO support is available
 GPIOZERO_AVAILABLE = False
@@ -112,13 +113,13 @@ def main():
 
             # Start monitoring loop
             print("\nPress the button to toggle the LED (press Ctrl+C to exit)...")
-            from spaxiom.events import process_events
-
             try:
                 while True:
-                    # Process events
+                    # Sleep until the button changes state, rather than
+                    # polling it; the timeout keeps time-based conditions
+                    # ticking while the button is idle
+                    button.wait_for_edge(timeout=1.0)
                     process_events()
-                    time.sleep(0.1)
             except KeyboardInterrupt:
                 print("\n\nExiting GPIO output demo.")
 
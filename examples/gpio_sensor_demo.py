@@ -14,12 +14,12 @@ For Raspberry Pi, make sure you have RPi.GPIO or pigpio installed.
 
 import os
 import sys
-import time
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from spaxiom import Condition, on
+from spaxiom.events import process_events
 
 # Check if we're on Linux and if GPIO support is available
 GPIOZERO_AVAILABLE = False
@@ -78,22 +78,21 @@ def main():
         def on_button_press():
             print("\033[1;32mButton pressed!\033[0m")
 
-        # Process events in a loop
-        from spaxiom.events import process_events
+        # Show the button state whenever it changes; gpiozero reports edges
+        # from its own thread, so nothing has to poll the pin
+        @gpio_sensor.on_edge
+        def show_state(active):
+            print(f"Button state: {'PRESSED' if active else 'released'}", end="\r")
+
+        show_state(gpio_sensor.read())
 
         # Start monitoring loop
         try:
             while True:
-                # Read the current state
-                state = gpio_sensor.read()
-                print(f"Button state: {'PRESSED' if state else 'released'}", end="\r")
-
-                # Process events
+                # Sleep until the button changes state, then process events
+                gpio_sensor.wait_for_edge()
                 process_events()
 
-                # Wait before next read
-                time.sleep(0.1)
-
         except KeyboardInterrupt:
             print("\n\nExiting GPIO demo.")
 
@@ -10,16 +10,29 @@ This demonstrates:
 5. Triggering events when occupancy conditions are met
 """
 
+import asyncio
 import os
 import sys
 import time
-import random
+
+import numpy as np
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from spaxiom import Condition, on, within, Zone
+from spaxiom.events import process_events
 from spaxiom.sensor import RandomSensor
+from spaxiom.temporal import time_until_deadline
+
+# Shared random generator (PCG64) for the simulated readings
+_rng = np.random.default_rng()
+
+# Number of readings each sensor draws from the generator at a time
+DRAW_BLOCK_SIZE = 1024
+
+# Rate at which the status line is refreshed
+STATUS_HZ = 5.0
 
 
 class OccupancySensor(RandomSensor):
@@ -28,7 +41,7 @@ class OccupancySensor(RandomSensor):
     This allows more control over the randomness than the standard RandomSensor.
     """
 
-    def __init__(self, name, sensor_type, location, active_probability=0.8):
+    def __init__(self, name, sensor_type, location, active_probability=0.8, hz=5.0):
         """
         Initialize the occupancy sensor.
 
@@ -37,22 +50,111 @@ class OccupancySensor(RandomSensor):
             sensor_type: Type of sensor ("pressure" or "thermal")
             location: (x, y, z) coordinates
             active_probability: Probability of detecting presence (0.0-1.0)
+            hz: Rate at which tick() samples a new reading
         """
-        super().__init__(name=name, location=location)
+        super().__init__(name=name, location=location, hz=hz)
         self.sensor_type = sensor_type
         self.active_probability = active_probability
+        # Pre-drawn readings, consumed one per sample
+        self._draws = []
+        self._next_draw = 0
+        # Most recent sample taken by tick()
+        self._latest = 0.0
+
+    async def tick(self, changed):
+        """
+        Sample a new reading every sample period.
+
+        Args:
+            changed: asyncio.Event set whenever the reading changes
+        """
+        while True:
+            value = self._sample()
+            if value != self._latest:
+                self._latest = value
+                changed.set()
+            await asyncio.sleep(self.sample_period_s)
 
     def _read_raw(self):
+        """
+        Return the most recent simulated occupancy reading.
+
+        Returns:
+            1.0 if the sensor detects presence, 0.0 otherwise
+        """
+        return self._latest
+
+    def _sample(self):
         """
         Generate a simulated occupancy reading.
 
         Returns:
             1.0 if the sensor detects presence (based on probability), 0.0 otherwise
         """
-        # Use a biased random generator to simulate occupancy
-        if random.random() < self.active_probability:
-            return 1.0
-        return 0.0
+        # Draw a block of biased readings at once and hand them out one by one
+        if self._next_draw >= len(self._draws):
+            block = _rng.random(DRAW_BLOCK_SIZE) < self.active_probability
+            self._draws = block.astype(float).tolist()
+            self._next_draw = 0
+
+        value = self._draws[self._next_draw]
+        self._next_draw += 1
+        return value
+
+
+async def _process_on_change(changed):
+    """
+    Evaluate conditions only after a sensor reading has changed.
+
+    Evaluation also happens when a within() window is due to complete, so a
+    sustained condition fires without waiting for further changes.
+
+    Args:
+        changed: asyncio.Event set by the sensors' tick() coroutines
+    """
+    while True:
+        try:
+            # within() evaluates without a `now`, so its windows use time.time()
+            await asyncio.wait_for(changed.wait(), time_until_deadline(time.time()))
+        except asyncio.TimeoutError:
+            pass
+        changed.clear()
+        process_events()
+
+
+async def _print_status(pressure_a, thermal_a, pressure_b):
+    """Refresh the sensor status line at STATUS_HZ."""
+    while True:
+        p_a = pressure_a.read() > 0.5
+        t_a = thermal_a.read() > 0.5
+        p_b = pressure_b.read() > 0.5
+
+        print(
+            f"Pressure A: {'ON' if p_a else 'off'} | "
+            f"Thermal A: {'ON' if t_a else 'off'} | "
+            f"Pressure B: {'ON' if p_b else 'off'} | "
+            f"Occupancy Condition: {'TRUE' if p_a and t_a and not p_b else 'false'}",
+            end="\r",
+        )
+        await asyncio.sleep(1.0 / STATUS_HZ)
+
+
+async def run(sensors):
+    """
+    Run the sensors, condition evaluation and status line as coroutines.
+
+    Each sensor samples at its own rate and conditions are re-evaluated only
+    when one of the readings changes, rather than on a fixed polling tick.
+
+    Args:
+        sensors: The pressure A, thermal A and pressure B sensors, in that order
+    """
+    changed = asyncio.Event()
+    await asyncio.gather(
+        *(sensor.tick(changed) for sensor in sensors),
+        _process_on_change(changed),
+        _print_status(*sensors),
+    )
 
 
 def main():
@@ -105,7 +207,8 @@ def main():
     # Define complex condition: person_in_A = pressureA & thermalA & ~pressureB
     # This indicates someone is in zone A (both pressure and thermal detect)
     # but not in zone B (no pressure detected in B)
-    person_in_a = pressure_a_active & thermal_a_active & ~pressure_b_active
+    # compile() fuses the expression into a single function of the three reads
+    person_in_a = (pressure_a_active & thermal_a_active & ~pressure_b_active).compile()
 
     # Create a temporal condition - must be true for at least 1 second
     person_in_a_sustained = within(1.0, person_in_a)
@@ -126,31 +229,8 @@ def main():
     print("Press Ctrl+C to exit")
     print()
 
-    # Start the event loop
     try:
-        while True:
-            # Manually evaluate the conditions and print sensor states
-            p_a = pressure_a.read() > 0.5
-            t_a = thermal_a.read() > 0.5
-            p_b = pressure_b.read() > 0.5
-
-            # Print current sensor states
-            print(
-                f"Pressure A: {'ON' if p_a else 'off'} | "
-                f"Thermal A: {'ON' if t_a else 'off'} | "
-                f"Pressure B: {'ON' if p_b else 'off'} | "
-                f"Occupancy Condition: {'TRUE' if p_a and t_a and not p_b else 'false'}",
-                end="\r",
-            )
-
-            # Process events
-            from spaxiom.events import process_events
-
-            process_events()
-
-            # Wait before next update
-            time.sleep(0.2)
-
+        asyncio.run(run([pressure_a, thermal_a, pressure_b]))
     except KeyboardInterrupt:
         print("\n\nExiting occupancy detection demo.")
 
@@ -10,6 +10,7 @@ This demonstrates:
 5. Triggering events when a person is detected
 """
 
+import logging
 import os
 import sys
 import time
@@ -19,6 +20,15 @@ import numpy as np
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from spaxiom import Sensor, Condition, on, OnnxModel
+from spaxiom.events import process_events
+
+# Number of frames captured and run through the model together
+BATCH_SIZE = 4
+
+# First-pixel value marking frames in which a person is simulated
+PERSON_MARKER = 1.0
+
+logger = logging.getLogger(__name__)
 
 
 class ImageSensor(Sensor):
@@ -26,7 +36,9 @@ class ImageSensor(Sensor):
     A sensor that simulates camera input by generating random image data.
     """
 
-    def __init__(self, name, location=(0, 0, 0), image_shape=(1, 3, 224, 224)):
+    def __init__(
+        self, name, location=(0, 0, 0), image_shape=(1, 3, 224, 224), log_every=5
+    ):
         """
         Initialize the image sensor.
 
@@ -34,10 +46,18 @@ class ImageSensor(Sensor):
             name: Unique name for the sensor
             location: (x, y, z) coordinates
             image_shape: Shape of the image tensor (batch, channels, height, width)
+            log_every: Log every Nth frame at INFO level; the others are only
+                logged at DEBUG level
         """
         super().__init__(name=name, sensor_type="camera", location=location)
         self.image_shape = image_shape
         self.frame_count = 0
+        self.log_every = log_every
+
+        # Frames are generated in place into preallocated float32 buffers,
+        # one per batch size, instead of allocating every frame
+        self._rng = np.random.default_rng()
+        self._buffers = {}
 
         # Simulate a person appearing every 5 frames
         self.person_frequency = 5
@@ -52,27 +72,68 @@ class ImageSensor(Sensor):
         Returns:
             A numpy array representing an image with the configured shape
         """
-        # Increment frame counter
-        self.frame_count += 1
+        return self.read_batch(1)
 
-        # Generate random image data (normalized between 0-1)
-        image = np.random.random(self.image_shape).astype(np.float32)
+    def read_batch(self, n):
+        """
+        Capture several consecutive frames at once.
+
+        Args:
+            n: Number of frames to capture
 
-        # For demonstration purposes, print frame information
-        person_present = self.frame_count % self.person_frequency == 0
-        print(
-            f"Frame {self.frame_count}: {'Person simulated' if person_present else 'No person'}"
-        )
+        Returns:
+            A numpy array of shape (n, channels, height, width). The array is
+            reused by the next read of the same size; copy it to keep it.
+        """
+        images = self._buffers.get(n)
+        if images is None:
+            shape = (n,) + tuple(self.image_shape[1:])
+            images = self._buffers[n] = np.empty(shape, dtype=np.float32)
 
-        return image
+        # Generate random image data (normalized between 0-1)
+        self._rng.random(out=images, dtype=np.float32)
+
+        for i in range(n):
+            # Increment frame counter
+            self.frame_count += 1
+
+            # Mark frames with a simulated person in the first pixel, which
+            # the mock model uses as its ground truth
+            person_present = self.frame_count % self.person_frequency == 0
+            images[i, 0, 0, 0] = PERSON_MARKER if person_present else 0.0
+
+            # For demonstration purposes, log a sample of the frames
+            if self.frame_count % self.log_every == 0:
+                level = logging.INFO
+            else:
+                level = logging.DEBUG
+            if logger.isEnabledFor(level):
+                logger.log(
+                    level,
+                    "Frame %d: %s",
+                    self.frame_count,
+                    "Person simulated" if person_present else "No person",
+                )
+
+        self.last_value = images
+        return images
 
 
 class MockPersonDetectionModel(OnnxModel):
     """
     A mock ONNX model for person detection that pretends to load from a file
     but actually generates simulated results.
+
+    A real model can be exported with float16 inputs to halve the bytes moved
+    per frame; OnnxModel converts the float32 frames to the precision the
+    model declares.
     """
 
+    # Simulated detections as [class_id, confidence, x1, y1, x2, y2]: a person
+    # with high confidence, and no person / low confidence
+    _DET_YES = np.array([1, 0.92, 0.2, 0.3, 0.5, 0.7])
+    _DET_NO = np.array([0, 0.15, 0, 0, 0, 0])
+
     def __init__(self, name="person_detection", path="persondet.onnx"):
         """
         Initialize the mock person detection model.
@@ -104,9 +165,10 @@ class MockPersonDetectionModel(OnnxModel):
             **named_arrays: Input tensors as numpy arrays
 
         Returns:
-            A simulated detection result where:
-            - [0] = no person detected
-            - [1] = person detected
+            One simulated detection per image in the batch, shaped (B, 6) as
+            [class_id, confidence, x1, y1, x2, y2], where class_id is:
+            - 0 = no person detected
+            - 1 = person detected
         """
         # Ensure 'image' input is provided
         if "image" not in named_arrays:
@@ -115,26 +177,16 @@ class MockPersonDetectionModel(OnnxModel):
         # Simulate session loading if needed
         self._ensure_session()
 
-        # For this demo, we'll simulate a person detection based on the
-        # frame count of our image sensor (known via closure)
-        frame_number = image_sensor.frame_count
-
-        # Simulate detecting a person every X frames
-        person_detected = frame_number % image_sensor.person_frequency == 0
+        # For this demo, a person is "detected" in the frames the image
+        # sensor marked in their first pixel
+        person_detected = named_arrays["image"][:, 0, 0, 0] == PERSON_MARKER
 
-        # Create and return a simulated confidence score
-        # [class_id, confidence, x1, y1, x2, y2]
-        if person_detected:
-            # Person detected with high confidence
-            return np.array([[1, 0.92, 0.2, 0.3, 0.5, 0.7]])
-        else:
-            # No person or low confidence
-            return np.array([[0, 0.15, 0, 0, 0, 0]])
+        return np.where(person_detected[:, None], self._DET_YES, self._DET_NO)
 
 
 def main():
     """Run the person detection demo."""
-    global image_sensor
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     print("\nSpaxiom ONNX Person Detection Demo")
     print("===================================")
@@ -151,15 +203,21 @@ def main():
 
     # Define a condition based on model prediction
     # A person is detected if the confidence score is > 0.5
+    # Frames are captured and run through the model in batches, so the model
+    # is called once per BATCH_SIZE frames; each evaluation consumes one
+    # frame's detection
+    pending = []
+
     def detect_person():
-        # Read the image from the sensor
-        image = image_sensor.read()
+        if not pending:
+            # Read a batch of images from the sensor and run the model once
+            images = image_sensor.read_batch(BATCH_SIZE)
+            pending.extend(person_model.predict(image=images))
 
-        # Run the model
-        detections = person_model.predict(image=image)
+        detection = pending.pop(0)
 
-        # Check if any detection has confidence > 0.5
-        return len(detections) > 0 and detections[0][1] > 0.5
+        # Check if the detection has confidence > 0.5
+        return detection[1] > 0.5
 
     # Create a condition from the detection function
     person_detected = Condition(detect_person)
@@ -177,8 +235,6 @@ def main():
     try:
         while True:
             # Process events
-            from spaxiom.events import process_events
-
             process_events()
 
             # Wait before next frame
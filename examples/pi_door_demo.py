@@ -17,15 +17,14 @@ Note: This example will only work on Raspberry Pi or similar Linux systems with
 
 import os
 import sys
-import time
 import signal
-import threading
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import required Spaxiom components
 from spaxiom import Condition, on, within
+from spaxiom.events import cancel, process_events, schedule, time_until_scheduled
 
 # Check if we're on Linux and if GPIO support is available
 GPIOZERO_AVAILABLE = False
@@ -91,52 +90,58 @@ def main():
         # Create a temporal condition that is true when the door has been open for at least 1 second
         door_open_sustained = within(1.0, door_open)
 
-        # Function to turn off the alert after 3 seconds
-        def turn_off_alert_after_delay(seconds=3.0):
-            time.sleep(seconds)
+        # Pending call that turns the alert off again
+        alert_off = None
+
+        def turn_off_alert():
             alert_output.set_low()
             print("Alert deactivated")
 
         # Register the callback for when the door is open for more than 1 second
         @on(door_open_sustained)
         def handle_door_open():
+            nonlocal alert_off
             print("\033[1;31mALERT: Door has been open for more than 1 second!\033[0m")
 
             # Activate the alert output
             alert_output.set_high()
             print("Alert activated")
 
-            # Set a timer to turn off the alert after 3 seconds
-            threading.Thread(
-                target=turn_off_alert_after_delay, args=(3.0,), daemon=True
-            ).start()
+            # Turn off the alert after 3 seconds, restarting the countdown if
+            # it is still pending from an earlier alert
+            if alert_off is not None:
+                cancel(alert_off)
+            alert_off = schedule(3.0, turn_off_alert)
 
         # Start monitoring
         print("\nMonitoring door state...")
         print("Press Ctrl+C to exit")
 
-        # Import the events module for processing callbacks
-        from spaxiom.events import process_events
+        # Print the door state whenever it changes; the sensor reports only
+        # real transitions, so the main loop does not track the state itself
+        @door_sensor.on_edge
+        def show_door_state(active):
+            if active:
+                print("\033[1;32mDoor CLOSED\033[0m")
+            else:
+                print("\033[1;33mDoor OPENED\033[0m")
+
+        show_door_state(door_sensor.is_active())
 
         # Main loop
-        last_state = None
         while running:
-            # Get current door state
-            current_state = not door_sensor.is_active()
-
-            # Print state changes
-            if current_state != last_state:
-                if current_state:
-                    print("\033[1;33mDoor OPENED\033[0m")
-                else:
-                    print("\033[1;32mDoor CLOSED\033[0m")
-                last_state = current_state
-
             # Process any events
             process_events()
 
-            # Small delay to prevent CPU hogging
-            time.sleep(0.1)
+            # Sleep until the door moves. While it is open, wake up every
+            # 100 ms as well so the 1 second "open" timer keeps running; while
+            # it is closed only an edge (or the shutdown check) matters.
+            # A pending alert-off call shortens the wait so it runs on time.
+            timeout = 1.0 if door_sensor.is_active() else 0.1
+            pending = time_until_scheduled()
+            if pending is not None:
+                timeout = min(timeout, pending)
+            door_sensor.wait_for_edge(timeout=timeout)
 
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -11,8 +11,8 @@ Run with:
 """
 
 import logging
-import importlib
 from spaxiom import Condition, on, within, SensorRegistry
+from spaxiom.plugins import load_plugin
 
 # Configure logging
 logging.basicConfig(
@@ -30,11 +30,12 @@ def main():
 
     # Manually import the plugin
     # In a real application, you could place this in the spaxiom_site_plugins namespace
-    # and it would be loaded automatically when the runtime starts
+    # or advertise it under the "spaxiom.plugins" entry point group, and it would be
+    # loaded automatically when the runtime starts
     print("\nManually importing custom plugin...")
     try:
         # Import the plugin module to trigger registration
-        importlib.import_module("examples.custom_plugin_demo")
+        load_plugin("examples.custom_plugin_demo")
     except ImportError:
         print("Error importing custom plugin, please make sure it exists.")
         return
@@ -49,9 +50,12 @@ def main():
 
         # Create conditions based on the sine wave
         # Since it oscillates between positive and negative values,
-        # we can create conditions for when it's positive or negative
-        positive_value = Condition(lambda: sine_sensor.read() > 0)
-        negative_value = Condition(lambda: sine_sensor.read() < 0)
+        # we can create conditions for when it's positive or negative.
+        # Grouping them means both share a single read of the sensor.
+        positive_value, negative_value = Condition.group(
+            [lambda value: value > 0, lambda value: value < 0],
+            source=sine_sensor.read,
+        )
 
         # Create temporal conditions
         sustained_positive = within(1.0, positive_value)
@@ -60,12 +64,12 @@ def main():
         # Register event handlers
         @on(sustained_positive)
         def on_positive_phase():
-            value = sine_sensor.read()
+            value = sine_sensor.get_last_value()
             print(f"[Event] Positive phase detected: {value:.2f}")
 
         @on(sustained_negative)
         def on_negative_phase():
-            value = sine_sensor.read()
+            value = sine_sensor.get_last_value()
             print(f"[Event] Negative phase detected: {value:.2f}")
 
         print("\nRegistered event handlers for sine wave phases")
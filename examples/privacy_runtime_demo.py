@@ -72,25 +72,22 @@ def main():
         logger.info(f"Private sensor reading: {formatted}")
 
     # Manually read and log
+    registry = SensorRegistry()
+    sensor_names = [public_sensor.name, private_sensor.name]
     print("\nDirectly reading sensors:")
     for _ in range(3):
-        # Read public sensor
-        public_value = public_sensor.read()
-        print(f"Public sensor raw value: {public_value}")
-        print(
-            f"Public sensor formatted value: {format_sensor_value(public_sensor, public_value)}"
-        )
-
-        # Read private sensor
-        private_value = private_sensor.read()
-        print(
-            f"Private sensor raw value: {private_value}"
-        )  # We can access the value directly
-        print(
-            f"Private sensor formatted value: {format_sensor_value(private_sensor, private_value)}"
-        )
-
-        print("---")
+        # Read both sensors in one batch; raw values are always accessible,
+        # formatting redacts the private one
+        lines = []
+        for name, value in registry.read_many(sensor_names).items():
+            formatted = format_sensor_value(registry.get(name), value)
+            lines.append(f"{name} raw value: {value}")
+            lines.append(f"{name} formatted value: {formatted}")
+        lines.append("---")
+
+        # Write the whole block at once rather than line by line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         time.sleep(1)
 
     print(
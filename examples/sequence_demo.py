@@ -9,8 +9,9 @@ and prints "Entry detected" when this sequence occurs.
 
 import asyncio
 import time
-from spaxiom import Sensor, Condition, on, sequence
-from spaxiom.runtime import start_runtime
+from spaxiom import Sensor
+from spaxiom.logic import ThresholdCondition
+from spaxiom.temporal import SequencePattern
 
 
 class DoorSensor(Sensor):
@@ -25,15 +26,19 @@ class DoorSensor(Sensor):
         """Read the current door state (1.0 = open, 0.0 = closed)."""
         return 1.0 if self.is_open else 0.0
 
-    def open(self):
-        """Open the door."""
-        print(f"Door {self.name} OPENED at t={time.time():.2f}")
+    def open(self, now):
+        """Open the door at monotonic time `now`."""
+        print(f"Door {self.name} OPENED at t={now:.2f}")
         self.is_open = True
+        self.changed_at = now
+        self.notify()
 
-    def close(self):
-        """Close the door."""
-        print(f"Door {self.name} CLOSED at t={time.time():.2f}")
+    def close(self, now):
+        """Close the door at monotonic time `now`."""
+        print(f"Door {self.name} CLOSED at t={now:.2f}")
         self.is_open = False
+        self.changed_at = now
+        self.notify()
 
 
 class PersonSensor(Sensor):
@@ -48,18 +53,22 @@ class PersonSensor(Sensor):
         """Read the current detection state (1.0 = person detected, 0.0 = no person)."""
         return 1.0 if self.person_detected else 0.0
 
-    def detect(self):
-        """Detect a person."""
-        print(f"PERSON DETECTED by {self.name} at t={time.time():.2f}")
+    def detect(self, now):
+        """Detect a person at monotonic time `now`."""
+        print(f"PERSON DETECTED by {self.name} at t={now:.2f}")
         self.person_detected = True
+        self.changed_at = now
+        self.notify()
 
-    def clear(self):
-        """Clear the detection."""
+    def clear(self, now):
+        """Clear the detection at monotonic time `now`."""
         print(f"Person no longer detected by {self.name}")
         self.person_detected = False
+        self.changed_at = now
+        self.notify()
 
 
-# Create a simple global callback that will be triggered by the runtime
+# Create a simple global flag set when the sequence is detected
 entry_detected = False
 
 
@@ -74,13 +83,14 @@ async def main():
     person = PersonSensor("entry_area", location=(1, 1, 0))
 
     # Ensure initial state
-    door.close()
-    person.clear()
+    now = time.monotonic()
+    door.close(now)
+    person.clear(now)
 
     # Create conditions based on sensor values
-    door_open = Condition(lambda: door.read() > 0.5)
-    person_present = Condition(lambda: person.read() > 0.5)
-    door_closed = Condition(lambda: door.read() < 0.5)
+    door_open = ThresholdCondition(door, ">", 0.5)
+    person_present = ThresholdCondition(person, ">", 0.5)
+    door_closed = ThresholdCondition(door, "<", 0.5)
 
     # Debug prints to check condition states
     print("\nInitial condition states:")
@@ -89,50 +99,57 @@ async def main():
     print(f"door_closed: {door_closed.evaluate()}")
 
     # Create the sequence pattern
-    entry_pattern = sequence(
-        door_open,  # First: door opens
-        person_present,  # Then: person is detected
-        door_closed,  # Finally: door closes
+    entry_pattern = SequencePattern(
+        [
+            door_open,  # First: door opens
+            person_present,  # Then: person is detected
+            door_closed,  # Finally: door closes
+        ],
         within_s=10.0,  # All within 10 seconds
     )
 
     # Define callback for when the sequence is detected
-    global entry_detected
-
-    @on(entry_pattern)
     def on_entry_detected():
         global entry_detected
         entry_detected = True
         print("\n🚨 ENTRY DETECTED! 🚨")
         print("Door opened → person detected → door closed within 10 seconds")
 
-    # Start the runtime with very fast polling for demo purposes
-    print("\nStarting runtime and waiting for events...\n")
-    runtime_task = asyncio.create_task(start_runtime(poll_ms=50))
+    # The sensors notify their listeners when their state changes, so the
+    # pattern is advanced once per event instead of being polled, using the
+    # time the sensor recorded for the change
+    def watch(sensor):
+        def check_sequence():
+            if entry_pattern.advance(sensor.changed_at):
+                on_entry_detected()
+
+        return sensor.add_listener(check_sequence)
+
+    entry_pattern.advance(now)  # Record the initial states
+    listeners = [(door, watch(door)), (person, watch(person))]
+
+    print("\nWaiting for events...\n")
 
     try:
-        await asyncio.sleep(1)  # Wait for runtime to initialize
+        await asyncio.sleep(1)
 
         # Simulate our sequence
         print("\nSimulating sequence: door open → person detected → door closed")
 
         # Step 1: Open the door
-        door.open()
-        await asyncio.sleep(0.1)  # Add a small delay to ensure condition is evaluated
+        door.open(time.monotonic())
         print(
             f"After door open - door_open: {door_open.evaluate()}, door_closed: {door_closed.evaluate()}"
         )
         await asyncio.sleep(2)
 
         # Step 2: Detect a person
-        person.detect()
-        await asyncio.sleep(0.1)  # Add a small delay to ensure condition is evaluated
+        person.detect(time.monotonic())
         print(f"After person detect - person_present: {person_present.evaluate()}")
         await asyncio.sleep(2)
 
         # Step 3: Close the door
-        door.close()
-        await asyncio.sleep(0.1)  # Add a small delay to ensure condition is evaluated
+        door.close(time.monotonic())
         print(
             f"After door close - door_open: {door_open.evaluate()}, door_closed: {door_closed.evaluate()}"
         )
@@ -157,11 +174,8 @@ async def main():
 
     finally:
         # Cleanup
-        runtime_task.cancel()
-        try:
-            await runtime_task
-        except asyncio.CancelledError:
-            pass
+        for sensor, listener in listeners:
+            sensor.remove_listener(listener)
 
 
 if __name__ == "__main__":
@@ -8,7 +8,8 @@ multiple simulated sensors with sinusoidal patterns.
 
 import time
 import logging
-from typing import List
+
+import numpy as np
 
 # Try to import matplotlib, but make it optional
 try:
@@ -20,6 +21,7 @@ except ImportError:
     HAS_MATPLOTLIB = False
 
 from spaxiom import SimVector, Condition
+from spaxiom.core import advance_tick
 
 # Configure logging
 logging.basicConfig(
@@ -42,9 +44,14 @@ def plot_demo(sim_vector: SimVector, duration: float = 20.0) -> None:
         print("Matplotlib is not installed. Cannot create plot.")
         return
 
-    # Initialize data structures for plotting
-    time_points: List[float] = []
-    sensor_values: List[List[float]] = [[] for _ in range(len(sim_vector))]
+    # Preallocate the plot data for every frame of the run, so each frame
+    # writes one row and hands matplotlib views of the filled part
+    # instead of growing lists that are copied on every frame
+    interval_ms = 50
+    capacity = int(duration * 1000 / interval_ms) + 1
+    time_points = np.empty(capacity)
+    sensor_values = np.empty((capacity, len(sim_vector)), dtype=sim_vector.dtype)
+    filled = 0
 
     # Create a figure and axis
     fig, ax = plt.subplots(figsize=(10, 6))
@@ -71,31 +78,32 @@ def plot_demo(sim_vector: SimVector, duration: float = 20.0) -> None:
 
     # Function to update the plot
     def update(frame):
+        nonlocal filled
+
         # Get current time since start
         current_time = time.time() - start_time
-        time_points.append(current_time)
+        time_points[filled] = current_time
 
-        # Get and store current sensor values
-        for i, sensor in enumerate(sim_vector.sensors):
-            value = sensor.read()
-            sensor_values[i].append(value)
+        # Get all current sensor values in one vectorized call and store them
+        sim_vector.read_all(out=sensor_values[filled])
+        filled += 1
 
         # Update the lines
         for i, line in enumerate(lines):
-            line.set_data(time_points, sensor_values[i])
+            line.set_data(time_points[:filled], sensor_values[:filled, i])
 
         # Adjust x-axis if needed
         if current_time > ax.get_xlim()[1]:
             ax.set_xlim(0, current_time + 5)
 
         # Stop the animation if we've reached the duration
-        if current_time >= duration:
+        if current_time >= duration or filled == capacity:
             ani.event_source.stop()
 
         return lines
 
     # Create the animation
-    ani = FuncAnimation(fig, update, frames=None, interval=50, blit=True)
+    ani = FuncAnimation(fig, update, frames=None, interval=interval_ms, blit=True)
 
     # Show the plot
     plt.tight_layout()
@@ -126,20 +134,23 @@ def simple_demo(sim_vector: SimVector, duration: float = 30.0) -> None:
             # Print values every second
             current_time = time.time()
             if current_time - last_print_time >= 1.0:
-                print(f"Time: {current_time - start_time:.1f}s")
+                # Conditions and prints below share one read per sensor
+                advance_tick()
 
-                # Print all sensor values
-                values = [sensor.read() for sensor in sim_vector.sensors]
-                print(f"Sensor values: {[f'{v:.2f}' for v in values]}")
+                # Log all sensor values; the values are only gathered and
+                # formatted when INFO messages are actually emitted
+                if logger.isEnabledFor(logging.INFO):
+                    values = sim_vector.read_all().tolist()
+                    logger.info("Time: %.1fs", current_time - start_time)
+                    logger.info("Sensor values: %s", [f"{v:.2f}" for v in values])
 
                 # Check conditions
                 if high_condition():
-                    print(f"HIGH CONDITION: Sensor 0 = {sim_vector[0].read():.2f}")
+                    logger.info("HIGH CONDITION: Sensor 0 = %.2f", sim_vector[0].read())
 
                 if low_condition():
-                    print(f"LOW CONDITION: Sensor 1 = {sim_vector[1].read():.2f}")
+                    logger.info("LOW CONDITION: Sensor 1 = %.2f", sim_vector[1].read())
 
-                print("")
                 last_print_time = current_time
 
             # Small delay to prevent CPU hogging
@@ -162,6 +173,7 @@ def main() -> None:
         frequency_range=(0.1, 1.0),  # Different frequencies for variety
         amplitude_range=(0.8, 1.2),  # Similar but varied amplitudes
         phase_range=(0, 3.14),  # Different phase offsets
+        dtype=np.float32,  # Plenty for values printed to 2 decimals
     )
 
     # Start the simulation
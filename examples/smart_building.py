@@ -20,6 +20,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from spaxiom import Zone, Condition, on, within, Sensor
+from spaxiom.events import process_events
 from spaxiom.adaptors.file_sensor import FileSensor
 from spaxiom.fusion import WeightedFusion
 
@@ -231,8 +232,6 @@ def main():
             )
 
             # Process events
-            from spaxiom.events import process_events
-
             process_events()
 
             # Wait before next update
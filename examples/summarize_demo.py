@@ -4,82 +4,98 @@ Sensor Summarization Demo for Spaxiom DSL.
 
 This example demonstrates:
 1. Creating a RandomSensor for temperature data
-2. Using the summary() method to track statistics over time
+2. Using a RollingSummary to track statistics over time
 3. Printing summary statistics every minute with a window of 60 readings
 """
 
+import asyncio
+import logging
 import os
 import sys
-import time
 from datetime import datetime
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from spaxiom import Condition, RandomSensor
+from spaxiom import RandomSensor, RollingSummary
+from spaxiom.core import advance_tick
 
+logger = logging.getLogger(__name__)
 
-def main():
+
+async def main():
     """Run the sensor summarization demo."""
     print("\nSpaxiom Sensor Summarization Demo")
     print("=================================")
     print("This demo shows how to:")
     print("1. Use RandomSensor for temperature readings")
-    print("2. Track statistics with the summary() method")
+    print("2. Track statistics with a RollingSummary")
     print("3. Print summaries every minute with a window of 60 readings\n")
 
     # Create a random temperature sensor
     # Location parameters are (x, y, z) coordinates
     temp_sensor = RandomSensor(name="temp_sensor", location=(5, 5, 1))
 
-    # Create a condition that returns the temperature value
     # Scale the random value (0-1) to a realistic temperature range (20-30°C)
     def get_temperature():
         random_value = temp_sensor.read()
         return 20.0 + (random_value * 10.0)  # Scale to 20-30°C range
 
-    temp_condition = Condition(get_temperature)
-
-    # Create a summarizer with a window of 60 readings
-    temp_summary = temp_condition.summary(window=60)
+    # Create a summarizer with a window of 60 readings; each reading is added
+    # directly, so no Condition wrapper is needed
+    temp_summary = RollingSummary(window=60)
 
     print("Starting temperature monitoring...")
     print("Summary will be printed every minute (or every 60 readings)")
     print("Press Ctrl+C to exit\n")
 
-    # Start the simulation loop
-    try:
-        reading_count = 0
-        start_time = time.time()
+    # The status line is only useful on a terminal; it is written without
+    # flushing, and stdout is flushed once per summary instead
+    show_status = sys.stdout.isatty()
+    write = sys.stdout.write
 
-        while True:
-            # Get current time
-            current_time = datetime.now().strftime("%H:%M:%S")
+    loop = asyncio.get_running_loop()
+    reading_count = 0
+    start_time = loop.time()
 
-            # Read temperature
-            reading = get_temperature()
+    async def tick():
+        nonlocal reading_count
 
-            # Add to the summary
-            temp_summary.add(reading)
-            reading_count += 1
+        # Start a new tick: every read of temp_sensor until the next one
+        # returns the same sample
+        advance_tick()
 
-            # Print current reading
-            print(
-                f"[{current_time}] Reading #{reading_count}: {reading:.2f}°C", end="\r"
-            )
+        # Read temperature
+        reading = get_temperature()
+
+        # Add to the summary
+        temp_summary.add(reading)
+        reading_count += 1
 
-            # Print summary every 60 readings (simulating every minute)
-            if reading_count % 60 == 0:
-                summary_text = temp_summary.to_text()
-                elapsed_minutes = int((time.time() - start_time) / 60)
-                print(
-                    f"\n[Minute {elapsed_minutes}] Temperature summary: {summary_text}"
-                )
+        # Show current reading
+        if show_status:
+            current_time = datetime.now().strftime("%H:%M:%S")
+            write(f"[{current_time}] Reading #{reading_count}: {reading:.2f}°C\r")
+
+        # Print summary every 60 readings (simulating every minute)
+        if reading_count % 60 == 0 and logger.isEnabledFor(logging.INFO):
+            if show_status:
+                write("\n")
+            logger.info(
+                "[Minute %d] Temperature summary: %s",
+                int((loop.time() - start_time) / 60),
+                temp_summary.to_text(),
+            )
+            sys.stdout.flush()
 
-            # Wait a bit (adjust this to control how fast readings are collected)
-            time.sleep(1.0)
+    # Start the simulation loop; each reading runs alongside the one second
+    # wait instead of before it, so the period doesn't drift by the time a
+    # reading takes (adjust the sleep to control how fast readings are collected)
+    try:
+        while True:
+            await asyncio.gather(tick(), asyncio.sleep(1.0))
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\nDemo stopped by user.")
 
     # Print final statistics
@@ -91,7 +107,14 @@ def main():
     print(f"Max: {temp_summary.get_max():.2f}°C")
     print(f"Min: {temp_summary.get_min():.2f}°C")
     print(f"Trend: {temp_summary.get_trend() or 'insufficient data'}")
+    slope = temp_summary.get_slope()
+    if slope is not None:
+        print(f"Slope: {slope:+.3f}°C per reading")
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
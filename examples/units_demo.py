@@ -9,6 +9,7 @@ This demonstrates:
 """
 
 import os
+import random
 import sys
 import time
 
@@ -16,6 +17,10 @@ import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from spaxiom import Sensor, Quantity
+from spaxiom.units import convert
+from spaxiom.core import advance_tick
+
+_rand = random.random
 
 
 class TemperatureSensor(Sensor):
@@ -45,9 +50,7 @@ class TemperatureSensor(Sensor):
             Temperature in Celsius
         """
         # Generate a random temperature around the base temperature
-        import random
-
-        temp = self.base_temp + (random.random() * 2 - 1) * self.variation
+        temp = self.base_temp + (_rand() * 2 - 1) * self.variation
         return temp
 
 
@@ -76,9 +79,7 @@ class DistanceSensor(Sensor):
             Distance in meters
         """
         # Generate a random distance
-        import random
-
-        distance = random.random() * self.max_distance
+        distance = _rand() * self.max_distance
         return distance
 
 
@@ -105,38 +106,44 @@ def main():
     )
     print()
 
+    # Constant quantities used in the calculations below, created once
+    speed = Quantity(5, "m/s")
+    area = Quantity(10, "m²")
+    temp_diff = Quantity(5, "delta_degC")
+
     # Take some readings
     for i in range(5):
-        # Read sensors with specific units
+        # Start a new tick so each sensor is sampled once for this reading
+        advance_tick()
+
+        # Read sensors in their native units and convert the same sample,
+        # rather than drawing a second, unrelated value for the other unit
         temp_c = temp_sensor.read(unit="degC")
-        temp_f = temp_sensor.read(unit="degF")
+        temp_f = convert(temp_c, "degF")
 
         dist_m = distance_sensor.read(unit="m")
-        dist_feet = distance_sensor.read(unit="ft")
+        dist_feet = convert(dist_m, "ft")
 
         # Print readings
         print(f"Reading {i+1}:")
         print(f"  Temperature: {temp_c:.2f} = {temp_f:.2f}")
         print(f"  Distance: {dist_m:.2f} = {dist_feet:.2f}")
 
-        # Create some additional quantities
-        speed = Quantity(5, "m/s")
+        # Calculate with quantities
         time_to_target = dist_m / speed
 
         # Print calculation results
         print(f"  Time to reach target at {speed}: {time_to_target:.2f}")
 
         # Convert to different units
-        time_minutes = time_to_target.to("minutes")
+        time_minutes = convert(time_to_target, "minutes")
         print(f"  Time in minutes: {time_minutes:.2f}")
 
         # Demonstrate compatible units
-        area = Quantity(10, "m²")
         volume = area * dist_m
         print(f"  Volume for area of {area} with height {dist_m}: {volume:.2f}")
 
         # Temperature differences (delta)
-        temp_diff = Quantity(5, "delta_degC")
         new_temp = temp_c + temp_diff
         print(f"  Temperature + 5°C: {new_temp:.2f}")
 
@@ -11,9 +11,9 @@ This version manually manages history to work around runtime limitations.
 
 import asyncio
 import time
-from collections import deque
-from spaxiom import Sensor, Condition
-from spaxiom.temporal import SequencePattern
+from spaxiom import Sensor
+from spaxiom.logic import ThresholdBatch, ThresholdCondition
+from spaxiom.temporal import RingHistory, SequencePattern
 
 
 class DoorSensor(Sensor):
@@ -28,14 +28,14 @@ class DoorSensor(Sensor):
         """Read the current door state (1.0 = open, 0.0 = closed)."""
         return 1.0 if self.is_open else 0.0
 
-    def open(self):
-        """Open the door."""
-        print(f"Door {self.name} OPENED at t={time.time():.2f}")
+    def open(self, now):
+        """Open the door at monotonic time `now`."""
+        print(f"Door {self.name} OPENED at t={now:.2f}")
         self.is_open = True
 
-    def close(self):
-        """Close the door."""
-        print(f"Door {self.name} CLOSED at t={time.time():.2f}")
+    def close(self, now):
+        """Close the door at monotonic time `now`."""
+        print(f"Door {self.name} CLOSED at t={now:.2f}")
         self.is_open = False
 
 
@@ -51,9 +51,9 @@ class PersonSensor(Sensor):
         """Read the current detection state (1.0 = person detected, 0.0 = no person)."""
         return 1.0 if self.person_detected else 0.0
 
-    def detect(self):
-        """Detect a person."""
-        print(f"PERSON DETECTED by {self.name} at t={time.time():.2f}")
+    def detect(self, now):
+        """Detect a person at monotonic time `now`."""
+        print(f"PERSON DETECTED by {self.name} at t={now:.2f}")
         self.person_detected = True
 
     def clear(self):
@@ -72,29 +72,40 @@ async def main():
     door = DoorSensor("front_door", location=(0, 0, 0))
     person = PersonSensor("entry_area", location=(1, 1, 0))
 
-    # Ensure initial state
-    door.close()
+    # Ensure initial state; the monotonic clock is read once per step and the
+    # same timestamp is used for the sensor and every history entry
+    now = time.monotonic()
+    door.close(now)
     person.clear()
 
     # Create conditions based on sensor values
-    door_open = Condition(lambda: door.read() > 0.5)
-    person_present = Condition(lambda: person.read() > 0.5)
-    door_closed = Condition(lambda: door.read() < 0.5)
+    door_open = ThresholdCondition(door, ">", 0.5)
+    person_present = ThresholdCondition(person, ">", 0.5)
+    door_closed = ThresholdCondition(door, "<", 0.5)
 
     # Initialize sequence pattern
     pattern = SequencePattern([door_open, person_present, door_closed], within_s=10.0)
 
-    # Manually create history deques
-    # Format: (timestamp, value)
-    door_open_history = deque(maxlen=50)
-    person_present_history = deque(maxlen=50)
-    door_closed_history = deque(maxlen=50)
+    # Manually create histories of (timestamp, value) entries, kept in
+    # fixed-size NumPy ring buffers
+    door_open_history = RingHistory(50)
+    person_present_history = RingHistory(50)
+    door_closed_history = RingHistory(50)
+    histories = [door_open_history, person_present_history, door_closed_history]
+
+    # The conditions are plain threshold tests, so they can be evaluated
+    # together: each sensor is read once and compared in one vectorized pass
+    states = ThresholdBatch([door_open, person_present, door_closed])
+
+    def record(now):
+        """Evaluate all conditions once and add their values to the histories."""
+        values = states.evaluate(now).tolist()
+        for history, value in zip(histories, values):
+            history.push(now, value)
+        return values
 
     # Add initial state to histories
-    now = time.time()
-    door_open_history.append((now, door_open.evaluate()))
-    person_present_history.append((now, person_present.evaluate()))
-    door_closed_history.append((now, door_closed.evaluate()))
+    record(now)
 
     print("\nStarting the demo sequence...")
 
@@ -102,45 +113,29 @@ async def main():
     print("\nSimulating sequence: door open → person detected → door closed")
 
     # Step 1: Open the door
-    door.open()
-    now = time.time()
-    # First add previous state
-    door_open_history.append((now - 0.1, False))
-    # Then add current state (transition to True)
-    door_open_history.append((now, True))
-    door_closed_history.append((now, False))
-    print(f"  Added to door_open_history: {now:.2f}, {door_open.evaluate()}")
+    now = time.monotonic()
+    door.open(now)
+    print(f"  Added to door_open_history: {now:.2f}, {record(now)[0]}")
 
     await asyncio.sleep(2)
 
     # Step 2: Detect a person
-    person.detect()
-    now = time.time()
-    # First add previous state
-    person_present_history.append((now - 0.1, False))
-    # Then add current state (transition to True)
-    person_present_history.append((now, True))
-    print(f"  Added to person_present_history: {now:.2f}, {person_present.evaluate()}")
+    now = time.monotonic()
+    person.detect(now)
+    print(f"  Added to person_present_history: {now:.2f}, {record(now)[1]}")
 
     await asyncio.sleep(2)
 
     # Step 3: Close the door
-    door.close()
-    now = time.time()
-    # First add previous state
-    door_closed_history.append((now - 0.1, False))
-    # Then add current state (transition to True)
-    door_closed_history.append((now, True))
-    door_open_history.append((now, False))
-    print(f"  Added to door_closed_history: {now:.2f}, {door_closed.evaluate()}")
+    now = time.monotonic()
+    door.close(now)
+    print(f"  Added to door_closed_history: {now:.2f}, {record(now)[2]}")
 
     await asyncio.sleep(0.5)
 
     # Manually evaluate the sequence pattern
-    now = time.time()
-    result = pattern.evaluate(
-        now, [door_open_history, person_present_history, door_closed_history]
-    )
+    now = time.monotonic()
+    result = pattern.evaluate(now, histories)
 
     if result:
         print("\n🚨 ENTRY DETECTED! 🚨")
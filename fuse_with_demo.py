@@ -10,7 +10,11 @@ This demonstrates:
 
 import time
 import numpy as np
-from spaxiom.sensor import Sensor
+from spaxiom.core import advance_tick
+from spaxiom.sensor import BufferedDraws, Sensor
+
+# Shared generator for the sensor noise
+_rng = np.random.default_rng()
 
 
 class ConstantSensor(Sensor):
@@ -34,6 +38,8 @@ class ConstantSensor(Sensor):
         )
         self.value = value
         self.noise_stddev = noise_stddev
+        # Standard normal deviates, scaled per read to the noise level
+        self._noise = BufferedDraws(_rng.standard_normal)
 
     def _read_raw(self):
         """
@@ -43,7 +49,7 @@ class ConstantSensor(Sensor):
             The constant value plus optional noise
         """
         if self.noise_stddev > 0:
-            return self.value + np.random.normal(0, self.noise_stddev)
+            return self.value + self.noise_stddev * self._noise.take()
         return self.value
 
     def __repr__(self):
@@ -54,9 +60,11 @@ class ConstantSensor(Sensor):
 def print_readings(sensors, fusion=None, rounds=1):
     """Print readings from sensors and optional fusion."""
     for _ in range(rounds):
-        readings = [s.read() for s in sensors]
+        # Within a tick each sensor is sampled once, so the fusion (and any
+        # fusion it is chained from) reuses the readings printed here
+        advance_tick()
 
-        line = " | ".join([f"{s.name}: {v:.2f}" for s, v in zip(sensors, readings)])
+        line = " | ".join(f"{s.name}: {s.read():.2f}" for s in sensors)
 
         if fusion:
             fusion_value = fusion.read()
@@ -11,6 +11,10 @@ This demonstrates:
 import time
 import numpy as np
 from spaxiom import Sensor, WeightedFusion
+from spaxiom.sensor import BufferedDraws
+
+# Shared generator for the sensor noise
+_rng = np.random.default_rng()
 
 
 class NoisySensor(Sensor):
@@ -37,6 +41,8 @@ class NoisySensor(Sensor):
         )
         self.true_value = true_value
         self.noise_stddev = noise_stddev
+        # Standard normal deviates, scaled per read to this sensor's noise level
+        self._noise = BufferedDraws(_rng.standard_normal)
 
     def _read_raw(self):
         """
@@ -45,9 +51,7 @@ class NoisySensor(Sensor):
         Returns:
             The true value plus Gaussian noise
         """
-        # Add Gaussian noise to the true value
-        noise = np.random.normal(0, self.noise_stddev)
-        return self.true_value + noise
+        return self.true_value + self.noise_stddev * self._noise.take()
 
     def __repr__(self):
         return f"NoisySensor(name='{self.name}', noise_level={self.noise_stddev})"
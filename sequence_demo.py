@@ -10,7 +10,7 @@ This demonstrates:
 
 import asyncio
 from spaxiom import Sensor, Condition, on, sequence
-from spaxiom.runtime import start_runtime
+from spaxiom.runtime import start_runtime, wake
 
 
 class EventSensor(Sensor):
@@ -31,14 +31,17 @@ class EventSensor(Sensor):
         print(f"[EVENT] {self.name} triggered!")
         self.triggered = True
         self.value = 1.0
+        # Evaluate the sequence now rather than at the next poll
+        wake()
 
     def reset(self):
         """Reset the sensor event."""
         self.triggered = False
         self.value = 0.0
+        wake()
 
 
-def main():
+async def main():
     print("Spaxiom Sequence Pattern Demo")
     print("-----------------------------")
     print("Demonstrating detection of ordered temporal sequences of events.")
@@ -149,11 +152,11 @@ def main():
         runtime_task.cancel()
 
     # Run simulation
-    try:
-        asyncio.run(asyncio.wait([runtime_task, simulate_entry_sequence()]))
-    except asyncio.CancelledError:
-        print("Runtime stopped")
+    await asyncio.gather(runtime_task, simulate_entry_sequence())
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except asyncio.CancelledError:
+        print("Runtime stopped")
@@ -7,15 +7,15 @@ import importlib.util
 from spaxiom.core import Sensor, SensorRegistry
 from spaxiom.sensor import RandomSensor, TogglingSensor
 from spaxiom.zone import Zone
-from spaxiom.logic import Condition, transitioned_to_true, exists
+from spaxiom.logic import Condition, ThresholdCondition, transitioned_to_true, exists
 from spaxiom.events import on
 from spaxiom.temporal import within, sequence
 from spaxiom.entities import Entity, EntitySet
 from .model import StubModel, OnnxModel
 from .units import Quantity, ureg, QuantityType
-from .geo import intersection, union
+from .geo import intersection, union, intersect_many, ZoneIndex
 from .fusion import weighted_average, WeightedFusion
-from .adaptors.file_sensor import FileSensor
+from .adaptors.file_sensor import FileSensor, MultiColumnFileSensor
 # Conditional import for MQTT
 # from .adaptors.mqtt_sensor import MQTTSensor
 from .summarize import RollingSummary
@@ -31,6 +31,7 @@ __all__ = [
     "TogglingSensor",
     "Zone",
     "Condition",
+    "ThresholdCondition",
     "on",
     "within",
     "sequence",
@@ -45,9 +46,12 @@ __all__ = [
     "QuantityType",
     "intersection",
     "union",
+    "intersect_many",
+    "ZoneIndex",
     "weighted_average",
     "WeightedFusion",
     "FileSensor",
+    "MultiColumnFileSensor",
     # "MQTTSensor", # Will be conditionally added
     "RollingSummary",
     "load_yaml",
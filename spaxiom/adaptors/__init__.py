@@ -5,11 +5,11 @@ This module contains adaptor classes that interface with various data sources
 and convert them into Spaxiom sensor data.
 """
 
-from spaxiom.adaptors.file_sensor import FileSensor
+from spaxiom.adaptors.file_sensor import FileSensor, MultiColumnFileSensor
 import sys
 import importlib.util
 
-__all__ = ["FileSensor"]
+__all__ = ["FileSensor", "MultiColumnFileSensor"]
 
 # Import GPIO sensor if we're on Linux
 if sys.platform.startswith("linux"):
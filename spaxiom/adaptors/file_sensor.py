@@ -3,10 +3,18 @@ File Sensor module for reading data from CSV files in Spaxiom DSL.
 """
 
 import csv
+import mmap
 import os
 from typing import Optional, Dict, Any, Tuple, List, Union
 
+import numpy as np
+
 from spaxiom.sensor import Sensor
+from spaxiom.units import Quantity, QuantityType, resolve_conversion, ureg
+
+# Files at least this large are parsed with pandas' C CSV reader when pandas is
+# installed; below it, importing pandas costs more than it saves
+PANDAS_MIN_FILE_SIZE = 1 << 20
 
 
 class FileSensor(Sensor):
@@ -23,8 +31,9 @@ class FileSensor(Sensor):
         unit: Optional unit for the data (e.g., "m", "s", "degC")
         skip_header: Whether to skip the header row
         loop: Whether to loop back to the beginning after reaching the end
+        stream: Whether rows are parsed on demand from a memory-mapped file
         current_row: Current row index in the file
-        data: Cached data from the CSV file
+        data: Cached data from the CSV file (empty in stream mode)
     """
 
     def __init__(
@@ -38,6 +47,7 @@ class FileSensor(Sensor):
         skip_header: bool = True,
         loop: bool = False,
         metadata: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ):
         """
         Initialize a file sensor.
@@ -52,6 +62,10 @@ class FileSensor(Sensor):
             skip_header: Whether to skip the header row
             loop: Whether to loop back to the beginning after reaching the end
             metadata: Optional metadata dictionary
+            stream: If True, memory-map the file and parse each row when it is
+                    read instead of loading the whole column up front. Startup
+                    only scans for line breaks, which suits very large feeds.
+                    Quoted fields must not contain line breaks in this mode.
         """
         # First call the parent constructor to register the sensor
         super().__init__(
@@ -65,6 +79,7 @@ class FileSensor(Sensor):
         self.unit_str = unit
         self.skip_header = skip_header
         self.loop = loop
+        self.stream = stream
         self.current_row = 0
         self.data: List[float] = []
         self.column_index = -1
@@ -74,7 +89,14 @@ class FileSensor(Sensor):
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
         # Load the data from the file
-        self._load_data()
+        if stream:
+            try:
+                self._index_lines()
+            except ValueError:
+                self.close()
+                raise
+        else:
+            self._load_data()
 
     def _load_data(self) -> None:
         """
@@ -82,6 +104,9 @@ class FileSensor(Sensor):
         """
         self.data = []
 
+        if self._load_data_pandas():
+            return
+
         with open(self.file_path, "r", newline="") as file:
             reader = csv.reader(file, delimiter=self.delimiter)
 
@@ -98,33 +123,185 @@ class FileSensor(Sensor):
             # Read all rows and store the values from the specified column
             for row in reader:
                 try:
-                    # If no header was specified, use the column index directly
-                    if self.column_index == -1:
-                        try:
-                            # Try to parse the column name as an integer index
-                            col_idx = int(self.column_name)
-                            if col_idx < 0 or col_idx >= len(row):
-                                raise ValueError(
-                                    f"Column index {col_idx} out of range (0-{len(row)-1})"
-                                )
-                            value = float(row[col_idx])
-                        except ValueError:
-                            # If column_name isn't an integer, treat it as a string index
-                            # This would be uncommon without a header, but still possible
-                            if self.column_name not in row:
-                                raise ValueError(
-                                    f"Column '{self.column_name}' not found in row"
-                                )
-                            value = float(row[row.index(self.column_name)])
-                    else:
-                        # Use the column index determined from the header
-                        value = float(row[self.column_index])
-
-                    self.data.append(value)
+                    self.data.append(self._parse_row(row))
                 except (ValueError, IndexError) as e:
                     # Skip rows with invalid data
                     print(f"Warning: Skipping row with invalid data: {e}")
 
+    def _parse_row(self, row: List[str]) -> float:
+        """
+        Extract the numeric value of the sensor's column from a CSV row.
+
+        Args:
+            row: The fields of one CSV row
+
+        Returns:
+            The value of the column
+
+        Raises:
+            ValueError: If the value is not numeric or the column is missing
+            IndexError: If the row is too short
+        """
+        # If no header was specified, use the column index directly
+        if self.column_index == -1:
+            try:
+                # Try to parse the column name as an integer index
+                col_idx = int(self.column_name)
+                if col_idx < 0 or col_idx >= len(row):
+                    raise ValueError(
+                        f"Column index {col_idx} out of range (0-{len(row)-1})"
+                    )
+                return float(row[col_idx])
+            except ValueError:
+                # If column_name isn't an integer, treat it as a string index
+                # This would be uncommon without a header, but still possible
+                if self.column_name not in row:
+                    raise ValueError(f"Column '{self.column_name}' not found in row")
+                return float(row[row.index(self.column_name)])
+
+        # Use the column index determined from the header
+        return float(row[self.column_index])
+
+    def _index_lines(self) -> None:
+        """
+        Memory-map the CSV file and record where each data row starts and ends.
+        """
+        with open(self.file_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            # Empty files cannot be mapped
+            self._buffer = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            )
+
+        # One vectorized scan for line breaks instead of a Python loop
+        newlines = np.flatnonzero(np.frombuffer(self._buffer, dtype=np.uint8) == 0x0A)
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [size]))
+        if len(starts) and starts[-1] >= size:
+            # No row after a trailing line break
+            starts, ends = starts[:-1], ends[:-1]
+
+        if self.skip_header:
+            if not len(starts):
+                raise ValueError(f"Column '{self.column_name}' not found in CSV header")
+            header = self._split_line(int(starts[0]), int(ends[0]))
+            if self.column_name not in header:
+                raise ValueError(
+                    f"Column '{self.column_name}' not found in CSV header. "
+                    f"Available columns: {', '.join(header)}"
+                )
+            self.column_index = header.index(self.column_name)
+            starts, ends = starts[1:], ends[1:]
+
+        # Kept as int64 arrays, 16 bytes per row
+        self._line_starts = starts.astype(np.int64)
+        self._line_ends = ends.astype(np.int64)
+
+    def _split_line(self, start: int, end: int) -> List[str]:
+        """Split the line between two offsets of the mapped file into fields."""
+        line = self._buffer[start:end].decode().rstrip("\r")
+        return next(csv.reader([line], delimiter=self.delimiter), [])
+
+    def _read_streamed(self) -> Union[float, None]:
+        """
+        Parse and return the next valid row of a memory-mapped file.
+
+        Returns:
+            The next numeric value, or None if the end is reached and loop is False
+        """
+        num_rows = len(self._line_starts)
+        # Give up after one full pass without a valid row
+        for _ in range(num_rows):
+            if self.current_row >= num_rows:
+                if not self.loop:
+                    return None
+                self.current_row = 0
+
+            i = self.current_row
+            self.current_row += 1
+            try:
+                return self._parse_row(
+                    self._split_line(self._line_starts[i], self._line_ends[i])
+                )
+            except (ValueError, IndexError) as e:
+                # Skip rows with invalid data
+                print(f"Warning: Skipping row with invalid data: {e}")
+
+        return None
+
+    def _load_data_pandas(self) -> bool:
+        """
+        Load the column with pandas' C parser, for large files with a header.
+
+        Only clean numeric columns are loaded this way. Anything that needs the
+        row-by-row handling of _load_data (a missing column, invalid or empty
+        values) is left to it, so both paths produce the same data.
+
+        Returns:
+            True if the data was loaded, False if the caller should parse the file
+        """
+        if not self.skip_header:
+            return False
+        if os.path.getsize(self.file_path) < PANDAS_MIN_FILE_SIZE:
+            return False
+
+        try:
+            import pandas as pd
+        except ImportError:
+            return False
+
+        try:
+            frame = pd.read_csv(
+                self.file_path,
+                sep=self.delimiter,
+                usecols=[self.column_name],
+                dtype={self.column_name: float},
+                engine="c",
+                # Parse exactly like float(), as the csv path does
+                float_precision="round_trip",
+            )
+        except (ValueError, pd.errors.ParserError):
+            return False
+
+        column = frame[self.column_name]
+        if column.isna().any():
+            return False
+
+        with open(self.file_path, "r", newline="") as file:
+            header = next(csv.reader(file, delimiter=self.delimiter))
+        self.column_index = header.index(self.column_name)
+        self.data = column.tolist()
+        return True
+
+    def read(self, unit: Optional[str] = None) -> Union[float, QuantityType, None]:
+        """
+        Read the next value from the CSV data.
+
+        If the sensor was created with a unit and a different unit is requested,
+        the value is converted to it. The conversion is resolved with pint once
+        per requested unit and then applied as ``value * scale + offset``, which
+        also covers offset units such as degC -> degF.
+
+        Args:
+            unit: Optional unit string to return the value as a Quantity with units
+
+        Returns:
+            The next value, optionally as a Quantity, or None at the end of the data
+        """
+        if unit is None or self.unit_str is None:
+            return super().read(unit)
+
+        value = self._read_once()
+        if value is None:
+            return None
+
+        scale, offset, target = resolve_conversion(self.unit_str, unit)
+
+        if scale is None:
+            # Not a linear conversion, let pint handle every value
+            return Quantity(value, self.unit_str).to(target)
+        return ureg.Quantity(value * scale + offset, target)
+
     def _read_raw(self) -> Union[float, None]:
         """
         Read the next value from the CSV data.
@@ -133,6 +310,9 @@ class FileSensor(Sensor):
             The next numeric value from the CSV file, or None if the end is reached
             and loop is False
         """
+        if self.stream:
+            return self._read_streamed()
+
         if not self.data:
             return None
 
@@ -157,9 +337,188 @@ class FileSensor(Sensor):
         """
         self.current_row = 0
 
+    def close(self) -> None:
+        """
+        Release the memory-mapped file of a stream-mode sensor.
+
+        Reads return None afterwards. Sensors that load the whole column keep
+        no file open, so this does nothing for them.
+        """
+        buffer = getattr(self, "_buffer", None)
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+        if getattr(self, "stream", False):
+            self._buffer = b""
+            self._line_starts = np.empty(0, dtype=np.int64)
+            self._line_ends = np.empty(0, dtype=np.int64)
+
+    def __enter__(self) -> "FileSensor":
+        """Use the sensor as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the sensor."""
+        self.close()
+
+    def __del__(self):
+        """Clean up resources when the object is deleted."""
+        try:
+            self.close()
+        except Exception:
+            pass  # Ignore cleanup errors
+
     def __repr__(self) -> str:
         """Return a string representation of the file sensor."""
+        num_rows = len(self._line_starts) if self.stream else len(self.data)
         return (
             f"FileSensor(name='{self.name}', file='{os.path.basename(self.file_path)}', "
-            f"column='{self.column_name}', row={self.current_row}/{len(self.data)})"
+            f"column='{self.column_name}', row={self.current_row}/{num_rows})"
+        )
+
+
+class _ColumnSensor(FileSensor):
+    """A FileSensor over a column that MultiColumnFileSensor already parsed."""
+
+    def __init__(self, data: List[float], column_index: int, **kwargs):
+        self._parsed = data
+        self._parsed_column_index = column_index
+        super().__init__(**kwargs)
+
+    def _load_data(self) -> None:
+        """Use the parsed column instead of reading the file again."""
+        self.data = self._parsed
+        self.column_index = self._parsed_column_index
+
+
+class MultiColumnFileSensor:
+    """
+    Reads several numeric columns of one CSV file in a single pass.
+
+    Each column is exposed as its own FileSensor, so it can be used anywhere a
+    sensor is expected. The file is opened and parsed once for all of them
+    instead of once per column. Every column sensor keeps its own row cursor,
+    exactly like separate FileSensors on the same file.
+
+    Example:
+        ```python
+        temp, humidity = MultiColumnFileSensor(
+            "data.csv", ["temperature", "humidity"], units={"temperature": "degC"}
+        ).views()
+        ```
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        columns: List[str],
+        names: Optional[List[str]] = None,
+        location: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        delimiter: str = ",",
+        units: Optional[Dict[str, str]] = None,
+        loop: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Parse the file and create one sensor per column.
+
+        Args:
+            file_path: Path to the CSV file, which must have a header row
+            columns: Names of the columns containing numeric data
+            names: Unique sensor names, one per column (defaults to the column names)
+            location: Spatial coordinates (x, y, z) of the sensors
+            delimiter: CSV delimiter character
+            units: Optional mapping from column name to unit (e.g., "degC")
+            loop: Whether to loop back to the beginning after reaching the end
+            metadata: Optional metadata dictionary, copied to every sensor
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If a column is missing or the names don't match the columns
+        """
+        names = list(columns) if names is None else list(names)
+        if len(names) != len(columns):
+            raise ValueError(f"Expected {len(columns)} sensor names, got {len(names)}")
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+        self.file_path = file_path
+        self.columns = list(columns)
+        units = units or {}
+
+        indices, data = self._load_columns(delimiter)
+        self._sensors = [
+            _ColumnSensor(
+                data=column_data,
+                column_index=column_index,
+                name=name,
+                file_path=file_path,
+                column_name=column,
+                location=location,
+                delimiter=delimiter,
+                unit=units.get(column),
+                loop=loop,
+                metadata=dict(metadata) if metadata else None,
+            )
+            for name, column, column_index, column_data in zip(
+                names, self.columns, indices, data
+            )
+        ]
+
+    def _load_columns(self, delimiter: str) -> Tuple[List[int], List[List[float]]]:
+        """
+        Read every requested column in one pass over the file.
+
+        Invalid values are skipped per column, as FileSensor does for its column.
+
+        Returns:
+            Tuple of (column indices, parsed values per column)
+        """
+        with open(self.file_path, "r", newline="") as file:
+            reader = csv.reader(file, delimiter=delimiter)
+
+            header = next(reader, [])
+            missing = [column for column in self.columns if column not in header]
+            if missing:
+                raise ValueError(
+                    f"Column '{missing[0]}' not found in CSV header. "
+                    f"Available columns: {', '.join(header)}"
+                )
+            indices = [header.index(column) for column in self.columns]
+            data: List[List[float]] = [[] for _ in self.columns]
+
+            for row in reader:
+                for index, values in zip(indices, data):
+                    try:
+                        values.append(float(row[index]))
+                    except (ValueError, IndexError) as e:
+                        # Skip rows with invalid data
+                        print(f"Warning: Skipping row with invalid data: {e}")
+
+        return indices, data
+
+    def views(self) -> List[FileSensor]:
+        """
+        Return the column sensors, in the order of the columns.
+
+        Returns:
+            One FileSensor per column
+        """
+        return list(self._sensors)
+
+    def __getitem__(self, column: str) -> FileSensor:
+        """Return the sensor for a column by name."""
+        return self._sensors[self.columns.index(column)]
+
+    def reset(self) -> None:
+        """
+        Reset every column sensor to the first row of data.
+        """
+        for sensor in self._sensors:
+            sensor.reset()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the multi-column file sensor."""
+        return (
+            f"MultiColumnFileSensor(file='{os.path.basename(self.file_path)}', "
+            f"columns={self.columns})"
         )
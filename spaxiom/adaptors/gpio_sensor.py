@@ -3,7 +3,8 @@ GPIO Sensor module for interfacing with GPIO pins on Linux systems using gpiozer
 """
 
 import sys
-from typing import Optional, Dict, Any, Tuple
+import threading
+from typing import Optional, Dict, Any, Callable, List, Tuple
 
 from spaxiom.sensor import Sensor
 
@@ -80,6 +81,76 @@ class GPIODigitalSensor(Sensor):
         except Exception as e:
             raise RuntimeError(f"Failed to initialize GPIO pin {pin}: {str(e)}")
 
+        # gpiozero detects edges in its own thread (epoll/interrupt based,
+        # depending on the pin factory); record them so callers can block
+        # until the pin changes instead of polling it
+        self._edge = threading.Event()
+        self._edge_callbacks: List[Callable[[bool], None]] = []
+        # State reported by the last edge, used to drop repeated reports
+        self._last_edge: Optional[bool] = None
+        self._input_device.when_activated = self._on_activated
+        self._input_device.when_deactivated = self._on_deactivated
+
+    def _on_activated(self) -> None:
+        """Handle a transition to the active state reported by gpiozero."""
+        self._on_edge(True)
+
+    def _on_deactivated(self) -> None:
+        """Handle a transition to the inactive state reported by gpiozero."""
+        self._on_edge(False)
+
+    def _on_edge(self, active: bool) -> None:
+        """Record a state change and notify the edge callbacks."""
+        # Contact bounce can report the same state twice in a row
+        if active == self._last_edge:
+            return
+        self._last_edge = active
+        self._edge.set()
+        for callback in list(self._edge_callbacks):
+            callback(active)
+
+    def on_edge(self, callback: Callable[[bool], None]) -> Callable[[bool], None]:
+        """
+        Register a callback for state changes of the pin.
+
+        The callback receives True when the pin becomes active and False when
+        it becomes inactive, and is only called when the state actually
+        changes. It runs in gpiozero's edge-detection thread, so
+        it should be quick; heavier work belongs in event handlers driven by
+        wait_for_edge() and process_events().
+
+        Can be used as a decorator:
+            ```python
+            @button.on_edge
+            def show_state(active):
+                print("pressed" if active else "released")
+            ```
+
+        Args:
+            callback: Function called with the new state on every edge
+
+        Returns:
+            The callback unchanged
+        """
+        self._edge_callbacks.append(callback)
+        return callback
+
+    def wait_for_edge(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the pin changes state.
+
+        Edges that happened since the previous call are reported immediately.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait forever
+
+        Returns:
+            True if the pin changed state, False if the timeout expired
+        """
+        changed = self._edge.wait(timeout)
+        self._edge.clear()
+        return changed
+
     def _read_raw(self) -> bool:
         """
         Read the current state of the GPIO pin.
@@ -41,6 +41,11 @@ def cli():
     type=click.Path(exists=True, readable=True, dir_okay=False),
     help="YAML configuration file for sensors and zones",
 )
+@click.option(
+    "--config-cache/--no-config-cache",
+    default=False,
+    help="Cache the parsed configuration in a JSON file next to it (default: off)",
+)
 @click.option(
     "--verbose",
     is_flag=True,
@@ -51,6 +56,7 @@ def run_script(
     poll_ms: int,
     history_length: int,
     config: str = None,
+    config_cache: bool = False,
     verbose: bool = False,
 ):
     """
@@ -97,7 +103,7 @@ def run_script(
     if config:
         try:
             click.echo(f"Loading configuration from {config}...")
-            sensors = load_sensors_from_yaml(config)
+            sensors = load_sensors_from_yaml(config, json_cache=config_cache)
             click.echo(f"Loaded {len(sensors)} sensors from configuration.")
         except Exception as e:
             click.echo(f"Error loading configuration: {str(e)}", err=True)
@@ -28,6 +28,10 @@ class Condition:
                such as 'now' and 'history' for temporal conditions.
         """
         self.fn = fn
+        # True for within() and sequence() conditions and combinations of
+        # them; these track their own state, so the runtime must not pass them
+        # the history of their own output
+        self._stateful = False
 
     def __call__(self, **kwargs) -> bool:
         """
@@ -63,7 +67,7 @@ class Condition:
                 return False
             return other(**kwargs)
 
-        return Condition(combined_condition)
+        return Condition._combine(combined_condition, self, other)
 
     def __or__(self, other: "Condition") -> "Condition":
         """
@@ -82,7 +86,7 @@ class Condition:
                 return True
             return other(**kwargs)
 
-        return Condition(combined_condition)
+        return Condition._combine(combined_condition, self, other)
 
     def __invert__(self) -> "Condition":
         """
@@ -95,7 +99,25 @@ class Condition:
         def inverted_condition(**kwargs):
             return not self(**kwargs)
 
-        return Condition(inverted_condition)
+        return Condition._combine(inverted_condition, self)
+
+    @staticmethod
+    def _combine(fn: Callable[..., bool], *operands: "Condition") -> "Condition":
+        """
+        Create a combined condition that is stateful if any operand is.
+
+        Args:
+            fn: The function evaluating the combination
+            *operands: The conditions the operator was applied to
+
+        Returns:
+            A new Condition wrapping fn
+        """
+        condition = Condition(fn)
+        condition._stateful = any(
+            getattr(operand, "_stateful", False) for operand in operands
+        )
+        return condition
 
     def __repr__(self) -> str:
         """Return a string representation of the condition"""
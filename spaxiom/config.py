@@ -2,8 +2,13 @@
 Configuration module for Spaxiom DSL to load configuration from YAML files.
 """
 
+import copy
+import json
+import logging
 import os
-from typing import Dict, Any, Optional, List
+import tempfile
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 
 try:
     import yaml
@@ -17,11 +22,36 @@ from spaxiom.sensor import RandomSensor, TogglingSensor
 from spaxiom.adaptors.gpio_sensor import GPIODigitalSensor
 from spaxiom.core import Sensor
 
+logger = logging.getLogger(__name__)
+
+# Use the LibYAML-based C loader when PyYAML was built with it; it parses the
+# same safe subset of YAML as SafeLoader, several times faster
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+logger.debug(f"Loading YAML configuration with {_YamlLoader.__name__}")
+
+# Maximum number of parsed YAML files kept in memory by load_yaml
+YAML_CACHE_SIZE = 100
+
+# Parsed YAML files keyed by absolute path, with the (st_mtime_ns, st_size) of
+# the file when it was parsed; ordered from least to most recently used
+_yaml_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+
+
+def clear_yaml_cache() -> None:
+    """
+    Clear the cache of parsed YAML files used by load_yaml.
+    """
+    _yaml_cache.clear()
+
 
 def load_yaml(path: str) -> Dict[str, Any]:
     """
     Load a YAML configuration file and return Python objects.
 
+    Parsed files are cached, so loading the same file again only re-parses it
+    when its modification time or size has changed. Each call returns a fresh
+    copy that the caller may modify.
+
     Args:
         path: Path to the YAML configuration file
 
@@ -35,13 +65,96 @@ def load_yaml(path: str) -> Dict[str, Any]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        _yaml_cache.move_to_end(key)
+        return copy.deepcopy(cached[1])
+
     with open(path, "r") as file:
         try:
-            config = yaml.safe_load(file)
-            return config
+            config = yaml.load(file, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Error parsing YAML file: {e}")
 
+    _yaml_cache[key] = (signature, config)
+    _yaml_cache.move_to_end(key)
+    if len(_yaml_cache) > YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+
+    return copy.deepcopy(config)
+
+
+def _sidecar_path(path: str) -> str:
+    """Return the path of the JSON sidecar cache for a YAML file."""
+    return path + ".cache.json"
+
+
+def load_yaml_cached(path: str) -> Dict[str, Any]:
+    """
+    Load a YAML configuration file through a JSON sidecar cache.
+
+    The parsed configuration is stored next to the YAML file as
+    ``<path>.cache.json``, together with the YAML file's modification time and
+    size. Later loads read the sidecar with the much faster JSON parser as long
+    as the YAML file is unchanged. If the sidecar cannot be written (e.g. a
+    read-only directory) or the configuration cannot be represented in JSON,
+    this behaves like load_yaml.
+
+    Args:
+        path: Path to the YAML configuration file
+
+    Returns:
+        Dictionary containing the configuration
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the YAML file is invalid
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Configuration file not found: {path}")
+
+    stat = os.stat(path)
+    source = [stat.st_mtime_ns, stat.st_size]
+    sidecar = _sidecar_path(path)
+
+    try:
+        with open(sidecar, "r") as file:
+            cached = json.load(file)
+        if cached.get("source") == source:
+            return cached["config"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        # Missing, unreadable or malformed sidecar; rebuild it below
+        pass
+
+    config = load_yaml(path)
+
+    try:
+        data = json.dumps({"source": source, "config": config})
+        # Only cache configurations that survive the round trip unchanged
+        # (e.g. no dates or non-string keys)
+        if json.loads(data)["config"] != config:
+            return config
+
+        # Write to a temporary file first so readers never see a partial sidecar
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(data)
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Not caching configuration {path} as JSON: {e}")
+
+    return config
+
 
 def create_sensor_from_cfg(entry: Dict[str, Any]) -> Optional[Sensor]:
     """
@@ -162,12 +275,14 @@ def create_sensors_from_config(config: Dict[str, Any]) -> List[Sensor]:
     return sensors
 
 
-def load_sensors_from_yaml(path: str) -> List[Sensor]:
+def load_sensors_from_yaml(path: str, json_cache: bool = False) -> List[Sensor]:
     """
     Load and create sensors from a YAML configuration file.
 
     Args:
         path: Path to the YAML configuration file
+        json_cache: If True, load the configuration through a JSON sidecar cache
+                    (see load_yaml_cached) to speed up repeated startups
 
     Returns:
         List of created sensor objects
@@ -177,5 +292,5 @@ def load_sensors_from_yaml(path: str) -> List[Sensor]:
         yaml.YAMLError: If the YAML file is invalid
         ValueError: If the configuration is invalid
     """
-    config = load_yaml(path)
+    config = load_yaml_cached(path) if json_cache else load_yaml(path)
     return create_sensors_from_config(config)
@@ -3,12 +3,59 @@ Core module for Spaxiom DSL containing base classes and registry functionality.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple, Union, Literal
+from types import MappingProxyType
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+    Literal,
+)
 import threading
 import uuid
 
 from spaxiom.units import Quantity, QuantityType
 
+# Current evaluation tick, or None when per-tick caching is disabled
+_TICK: Optional[int] = None
+
+# Last tick handed out; not reset by reset_tick() so tick numbers never repeat
+_LAST_TICK = -1
+
+
+def advance_tick() -> int:
+    """
+    Start a new evaluation tick.
+
+    While ticks are in use, each sensor reads its hardware at most once per
+    tick and conditions evaluate at most once per tick; repeated calls within
+    the same tick return the cached result. Call this once per iteration of
+    the main loop.
+
+    Returns:
+        The number of the new tick
+    """
+    global _TICK, _LAST_TICK
+    _LAST_TICK += 1
+    _TICK = _LAST_TICK
+    return _TICK
+
+
+def current_tick() -> Optional[int]:
+    """Return the current tick, or None if advance_tick() has not been called."""
+    return _TICK
+
+
+def reset_tick() -> None:
+    """Disable per-tick caching so every read samples the sensor again."""
+    global _TICK
+    _TICK = None
+
 
 @dataclass
 class Sensor:
@@ -40,6 +87,48 @@ class Sensor:
         # Initialize last_value field
         self.last_value = None
 
+        # Tick of the cached last_value, see advance_tick()
+        self._tick: Optional[int] = None
+
+        # Callbacks run by notify() when the sensor's state changes
+        self._listeners: List[Callable[[], Any]] = []
+
+    def add_listener(self, callback: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Register a function to be called whenever the sensor calls notify().
+
+        Lets event-driven code react to state changes as they happen instead
+        of polling the sensor. Can be used as a decorator.
+
+        Args:
+            callback: A callable taking no arguments
+
+        Returns:
+            The callback, unchanged
+        """
+        self._listeners.append(callback)
+        return callback
+
+    def remove_listener(self, callback: Callable[[], Any]) -> None:
+        """
+        Unregister a callback added with add_listener().
+
+        Args:
+            callback: The callable to remove; ignored if not registered
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def notify(self) -> None:
+        """
+        Call the registered listeners.
+
+        Sensors whose state is changed by events (rather than sampled) should
+        call this after each change.
+        """
+        for callback in list(self._listeners):
+            callback()
+
     def read(self, unit: Optional[str] = None) -> Union[Any, QuantityType, None]:
         """
         Read data from the sensor.
@@ -53,8 +142,7 @@ class Sensor:
             optionally wrapped in a Quantity object if unit is specified.
             Returns None if the sensor has no more data to provide.
         """
-        value = self._read_raw()
-        self.last_value = value
+        value = self._read_once()
 
         if value is None:
             return None
@@ -63,6 +151,20 @@ class Sensor:
             return Quantity(value, unit)
         return value
 
+    def _read_once(self) -> Any:
+        """
+        Read raw data, reusing last_value if already read during this tick.
+
+        Returns:
+            The raw sensor value
+        """
+        if _TICK is not None and self._tick == _TICK:
+            return self.last_value
+        value = self._read_raw()
+        self.last_value = value
+        self._tick = _TICK
+        return value
+
     def get_last_value(
         self, unit: Optional[str] = None
     ) -> Union[Any, QuantityType, None]:
@@ -175,8 +277,11 @@ class SensorRegistry:
             if cls._instance is None:
                 cls._instance = super(SensorRegistry, cls).__new__(cls)
                 cls._instance._sensors = {}
-                cls._instance._public_sensors = set()
-                cls._instance._private_sensors = set()
+                cls._instance._sensors_view = MappingProxyType(cls._instance._sensors)
+                # Sensors split by privacy level
+                cls._instance._public_sensors = {}
+                cls._instance._private_sensors = {}
+                cls._instance._factories = {}
             return cls._instance
 
     def add(self, sensor: Sensor) -> None:
@@ -193,20 +298,43 @@ class SensorRegistry:
             raise ValueError(f"Sensor with name '{sensor.name}' already exists")
 
         self._sensors[sensor.name] = sensor
+        self._factories.pop(sensor.name, None)
 
         # Track privacy level
         if sensor.privacy == "public":
-            self._public_sensors.add(sensor.name)
+            self._public_sensors[sensor.name] = sensor
         elif sensor.privacy == "private":
-            self._private_sensors.add(sensor.name)
+            self._private_sensors[sensor.name] = sensor
         else:
             # This shouldn't happen due to type constraints, but just in case
             raise ValueError(f"Invalid privacy level: {sensor.privacy}")
 
+    def add_factory(self, name: str, factory: Callable[[], Sensor]) -> None:
+        """
+        Register a factory that creates a sensor on first use.
+
+        The factory is called the first time ``get(name)`` finds no sensor with
+        that name, so sensors that are never looked up are never created. Until
+        then the sensor does not appear in ``list_all()``.
+
+        Args:
+            name: The name of the sensor the factory creates
+            factory: Callable that creates the sensor, registering it under ``name``
+
+        Raises:
+            ValueError: If a sensor or factory with the same name already exists
+        """
+        if name in self._sensors or name in self._factories:
+            raise ValueError(f"Sensor with name '{name}' already exists")
+
+        self._factories[name] = factory
+
     def get(self, name: str) -> Sensor:
         """
         Get a sensor by name.
 
+        Sensors registered with ``add_factory`` are created on first access.
+
         Args:
             name: The name of the sensor to retrieve
 
@@ -216,10 +344,36 @@ class SensorRegistry:
         Raises:
             KeyError: If no sensor with the given name exists
         """
-        if name not in self._sensors:
-            raise KeyError(f"No sensor with name '{name}' found")
+        try:
+            return self._sensors[name]
+        except KeyError:
+            factory = self._factories.pop(name, None)
+            if factory is None:
+                raise KeyError(f"No sensor with name '{name}' found") from None
+
+        factory()
+        try:
+            return self._sensors[name]
+        except KeyError:
+            raise KeyError(f"Factory for sensor '{name}' did not create it") from None
+
+    def read_many(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Read several sensors in one call.
+
+        Args:
+            names: Names of the sensors to read, or None to read every
+                   registered sensor
+
+        Returns:
+            A dictionary mapping each sensor name to its reading
 
-        return self._sensors[name]
+        Raises:
+            KeyError: If one of the named sensors does not exist
+        """
+        if names is None:
+            return {name: sensor.read() for name, sensor in self._sensors.items()}
+        return {name: self.get(name).read() for name in names}
 
     def list_all(self) -> Dict[str, Sensor]:
         """
@@ -228,7 +382,19 @@ class SensorRegistry:
         Returns:
             A dictionary mapping sensor names to sensors
         """
-        return self._sensors.copy()
+        return dict(self._sensors)
+
+    def view_all(self) -> Mapping[str, Sensor]:
+        """
+        Return a read-only, live view of all registered sensors.
+
+        Unlike list_all(), this does not copy the registry, so it is cheaper
+        for frequent lookups, but it reflects later additions and removals.
+
+        Returns:
+            A read-only mapping of sensor names to sensors
+        """
+        return self._sensors_view
 
     def list_public(self) -> Dict[str, Sensor]:
         """
@@ -237,7 +403,7 @@ class SensorRegistry:
         Returns:
             A dictionary mapping sensor names to public sensors
         """
-        return {name: self._sensors[name] for name in self._public_sensors}
+        return dict(self._public_sensors)
 
     def list_private(self) -> Dict[str, Sensor]:
         """
@@ -246,7 +412,7 @@ class SensorRegistry:
         Returns:
             A dictionary mapping sensor names to private sensors
         """
-        return {name: self._sensors[name] for name in self._private_sensors}
+        return dict(self._private_sensors)
 
     def clear(self) -> None:
         """
@@ -255,3 +421,4 @@ class SensorRegistry:
         self._sensors.clear()
         self._public_sensors.clear()
         self._private_sensors.clear()
+        self._factories.clear()
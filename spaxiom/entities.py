@@ -88,6 +88,15 @@ class EntitySet(Generic[T]):
         """
         self.entities.remove(entity)
 
+    def discard(self, entity: T) -> None:
+        """
+        Remove an entity from this set if it is present.
+
+        Args:
+            entity: The entity to remove
+        """
+        self.entities.discard(entity)
+
     def filter(self, fn: Callable[[T], bool]) -> "EntitySet[T]":
         """
         Create a new entity set containing only entities that match the filter function.
@@ -2,17 +2,30 @@
 Events module for condition-based callbacks in Spaxiom DSL.
 """
 
-from typing import Callable, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import functools
+import heapq
+import itertools
 import logging
 import time
 
 # Import here rather than from ... to avoid circular imports
 from spaxiom.condition import Condition
+from spaxiom.logic import ThresholdBatch
 
 # Global registry of event handlers
 EVENT_HANDLERS: List[Tuple[Condition, Callable[[], Any]]] = []
 
+# Evaluation plan used by process_events: the conditions it was built for and
+# the batch that evaluates their threshold conditions in one vectorized pass
+_plan_conditions: Tuple[Condition, ...] = ()
+_plan_thresholds: Optional[ThresholdBatch] = None
+
+# Heap of [deadline, sequence, callback] entries for schedule(); cancelled
+# entries stay in the heap with their callback set to None
+SCHEDULED: List[List[Any]] = []
+_schedule_counter = itertools.count()
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,9 +49,13 @@ def on(condition: Condition) -> Callable[[Callable[[], Any]], Callable[[], Any]]
         ```
     """
 
+    # Fuse conditions built with &, | and ~ into a single function; compile()
+    # returns a separate condition, so the caller's condition is left as is
+    registered = condition.compile() if hasattr(condition, "compile") else condition
+
     def decorator(callback: Callable[[], Any]) -> Callable[[], Any]:
         # Register the callback with its condition
-        EVENT_HANDLERS.append((condition, callback))
+        EVENT_HANDLERS.append((registered, callback))
 
         @functools.wraps(callback)
         def wrapper(*args, **kwargs):
@@ -53,16 +70,119 @@ def process_events() -> None:
     """
     Check all registered conditions and call their callbacks if the conditions are met.
 
-    This should be called periodically, for example in a main loop.
+    Callbacks registered with schedule() whose delay has passed are run first.
+    This should be called periodically, for example in a main loop. It returns
+    immediately when there is nothing registered.
     """
+    if not EVENT_HANDLERS and not SCHEDULED:
+        return
+
+    _run_scheduled()
+
+    thresholds = _threshold_plan()
+
+    threshold_states: Dict[Condition, bool] = {}
+    if thresholds.conditions:
+        try:
+            threshold_states = dict(
+                zip(thresholds.conditions, thresholds.evaluate().tolist())
+            )
+        except Exception as e:
+            # Fall back to evaluating each condition on its own
+            logger.error(f"Error in threshold conditions: {str(e)}")
+
     for condition, callback in EVENT_HANDLERS:
         try:
-            if condition():
+            state = threshold_states.get(condition)
+            if state is None:
+                state = condition()
+            if state:
                 callback()
         except Exception as e:
             logger.error(f"Error in event handler {callback.__name__}: {str(e)}")
 
 
+def _threshold_plan() -> ThresholdBatch:
+    """
+    Return the batch of threshold conditions for the registered handlers.
+
+    The batch is built once and reused until the registered conditions change.
+    """
+    global _plan_conditions, _plan_thresholds
+
+    conditions = tuple(condition for condition, _ in EVENT_HANDLERS)
+    if _plan_thresholds is None or conditions != _plan_conditions:
+        _plan_conditions = conditions
+        _plan_thresholds = ThresholdBatch.from_conditions(conditions)
+    return _plan_thresholds
+
+
+def schedule(delay: float, callback: Callable[[], Any]) -> List[Any]:
+    """
+    Call a function once, from process_events, after a delay.
+
+    Scheduled calls share the thread running process_events instead of each
+    needing a timer thread of their own.
+
+    Args:
+        delay: Seconds to wait before calling the function
+        callback: A callable taking no arguments
+
+    Returns:
+        A handle that can be passed to cancel()
+
+    Example:
+        ```python
+        pending = schedule(3.0, alert_output.set_low)
+        ```
+    """
+    entry = [time.monotonic() + delay, next(_schedule_counter), callback]
+    heapq.heappush(SCHEDULED, entry)
+    return entry
+
+
+def cancel(handle: List[Any]) -> None:
+    """
+    Cancel a call registered with schedule(), if it has not run yet.
+
+    Args:
+        handle: The handle returned by schedule()
+    """
+    handle[-1] = None
+
+
+def time_until_scheduled() -> Optional[float]:
+    """
+    Return the number of seconds until the next scheduled call is due.
+
+    Useful as a timeout for loops that block between calls to process_events.
+
+    Returns:
+        Seconds until the earliest pending call (0.0 if it is overdue), or
+        None if no calls are pending
+    """
+    while SCHEDULED and SCHEDULED[0][-1] is None:
+        heapq.heappop(SCHEDULED)
+    if not SCHEDULED:
+        return None
+    return max(0.0, SCHEDULED[0][0] - time.monotonic())
+
+
+def _run_scheduled() -> None:
+    """Run the scheduled calls whose deadline has passed."""
+    now = time.monotonic()
+    while SCHEDULED and SCHEDULED[0][0] <= now:
+        _, _, callback = heapq.heappop(SCHEDULED)
+        if callback is None:
+            continue
+        try:
+            callback()
+        except Exception as e:
+            logger.error(
+                f"Error in scheduled call {getattr(callback, '__name__', callback)}: {str(e)}"
+            )
+
+
 def run_event_loop(interval: float = 0.1) -> None:
     """
     Run a simple event loop that processes events at the specified interval.
@@ -2,10 +2,39 @@
 Fusion module for sensor data fusion in Spaxiom DSL.
 """
 
-from typing import List, Dict, Any, Optional, Tuple, Union, Literal
+import functools
+import importlib.util
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union, Literal
 import numpy as np
 
 from spaxiom.core import Sensor
+from spaxiom.sim.vec_sim import SimSensor
+
+
+@functools.lru_cache(maxsize=None)
+def _load_weighted_sum() -> Optional[Callable[[np.ndarray, np.ndarray], float]]:
+    """
+    Compile the numba kernel that computes the fused reading, if numba is installed.
+
+    numba is imported on first use, as in spaxiom.sim.vec_sim, so that it does
+    not slow down ``import spaxiom``.
+
+    Returns:
+        The compiled kernel, or None if numba is not installed
+    """
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    import numba
+
+    @numba.njit(nogil=True, fastmath=True, cache=True)
+    def _weighted_sum(readings, weights):
+        total = 0.0
+        for i in range(readings.shape[0]):
+            total += readings[i] * weights[i]
+        return total
+
+    return _weighted_sum
 
 
 def weighted_average(readings: List[float], weights: List[float]) -> float:
@@ -49,6 +78,37 @@ def weighted_average(readings: List[float], weights: List[float]) -> float:
     return float(weighted_sum / weights_sum)
 
 
+def _shared_storage(
+    sensors: List[Sensor],
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Find the array holding the values of all the given sensors, if there is one.
+
+    The sensors of a SimVector keep their current values in one contiguous
+    array, so a fusion of them can gather all readings with a single indexing
+    operation instead of reading each sensor. Only plain SimSensors qualify,
+    since a subclass may override how it is read.
+
+    Args:
+        sensors: The sensors to fuse
+
+    Returns:
+        Tuple of (shared value array, index of each sensor in it), or
+        (None, None) if the sensors do not all share one array
+    """
+    vector = None
+    indices = []
+    for sensor in sensors:
+        if type(sensor) is not SimSensor or sensor.vector is None:
+            return None, None
+        if vector is None:
+            vector = sensor.vector
+        elif sensor.vector is not vector:
+            return None, None
+        indices.append(sensor.index)
+    return vector.values_view(), np.asarray(indices, dtype=np.intp)
+
+
 class WeightedFusion(Sensor):
     """
     A sensor that fuses multiple sensor readings using weighted averaging.
@@ -122,6 +182,26 @@ class WeightedFusion(Sensor):
             metadata=metadata or {},
         )
 
+        # Normalize the weights once so each read is a single dot product;
+        # None when the weights sum to zero, which is reported on read
+        weights_array = np.asarray(weights, dtype=np.float64)
+        weights_sum = weights_array.sum()
+        self._normalized_weights: Optional[np.ndarray] = (
+            None if np.isclose(weights_sum, 0.0) else weights_array / weights_sum
+        )
+        # Readings are gathered straight from a shared value array when the
+        # sensors have one (see _shared_storage)
+        self._shared_values, self._indices = _shared_storage(sensors)
+        # Reused buffer for the component readings
+        self._readings = np.empty(
+            len(sensors),
+            dtype=(
+                np.float64 if self._shared_values is None else self._shared_values.dtype
+            ),
+        )
+        # A single compiled loop has less call overhead than the @ operator
+        self._weighted_sum = _load_weighted_sum()
+
     def _read_raw(self) -> Union[float, None]:
         """
         Read values from all component sensors and compute weighted average.
@@ -133,23 +213,32 @@ class WeightedFusion(Sensor):
             ValueError: If any sensor returns None or a non-numeric value
         """
         # Collect readings from all sensors
-        readings = []
-        for sensor in self.sensors:
-            value = sensor.read()
-
-            # Validate sensor reading
-            if value is None:
-                raise ValueError(f"Sensor {sensor.name} returned None")
-
-            try:
-                readings.append(float(value))
-            except (ValueError, TypeError):
-                raise ValueError(
-                    f"Sensor {sensor.name} returned non-numeric value: {value}"
-                )
+        readings = self._readings
+        if self._shared_values is not None:
+            # One gather from the shared array replaces the per-sensor reads
+            np.take(self._shared_values, self._indices, out=readings)
+        else:
+            for i, sensor in enumerate(self.sensors):
+                value = sensor.read()
+
+                # Validate sensor reading
+                if value is None:
+                    raise ValueError(f"Sensor {sensor.name} returned None")
+
+                try:
+                    readings[i] = float(value)
+                except (ValueError, TypeError):
+                    raise ValueError(
+                        f"Sensor {sensor.name} returned non-numeric value: {value}"
+                    )
+
+        if self._normalized_weights is None:
+            raise ValueError("Sum of weights cannot be zero")
 
         # Compute weighted average
-        return weighted_average(readings, self.weights)
+        if self._weighted_sum is not None:
+            return float(self._weighted_sum(readings, self._normalized_weights))
+        return float(self._normalized_weights @ readings)
 
     def __repr__(self) -> str:
         """Return string representation of the fusion sensor."""
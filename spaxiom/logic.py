@@ -2,9 +2,13 @@
 Logic module with timestamped Conditions for Spaxiom DSL.
 """
 
+import operator
 import time
-from typing import Callable, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
 
+import numpy as np
+
+from spaxiom.core import current_tick
 from spaxiom.entities import EntitySet, Entity
 from spaxiom.summarize import RollingSummary
 
@@ -40,6 +44,16 @@ class Condition:
         self.last_changed = time.time()  # Initialize with current time
         # Track whether the condition just transitioned to true
         self._last_transition_to_true = None
+        # (sensor, op, value) for ThresholdConditions, which lets the runtime
+        # evaluate them in a vectorized ThresholdBatch
+        self._threshold: Optional[Tuple[Any, str, float]] = None
+        # Operator ("and", "or" or "not") and operands when built with &, | or ~
+        self._op: Optional[str] = None
+        self._operands: Tuple["Condition", ...] = ()
+        # True for combinations of within() or sequence() conditions
+        self._stateful = False
+        # Tick of last_value, so it is reused within a tick (see advance_tick)
+        self._tick: Optional[int] = None
 
     def evaluate(self, now: Optional[float] = None, **kwargs) -> bool:
         """
@@ -50,8 +64,13 @@ class Condition:
             **kwargs: Optional arguments to pass to the wrapped function
 
         Returns:
-            The boolean result of the wrapped function
+            The boolean result of the wrapped function, cached for the rest of
+            the tick when spaxiom.core.advance_tick() is in use
         """
+        tick = current_tick()
+        if tick is not None and self._tick == tick:
+            return self.last_value
+
         # Get current time if not provided
         if now is None:
             now = time.time()
@@ -79,6 +98,18 @@ class Condition:
                 # Last resort: no arguments
                 current_value = bool(self.fn())
 
+        self._record(current_value, now)
+        self._tick = tick
+        return current_value
+
+    def _record(self, current_value: bool, now: float) -> None:
+        """
+        Update the timestamp fields for a freshly evaluated value.
+
+        Args:
+            current_value: The value the condition evaluated to
+            now: The timestamp of the evaluation
+        """
         # Track transition to true
         if current_value and not self.last_value:
             self._last_transition_to_true = now
@@ -88,8 +119,6 @@ class Condition:
             self.last_changed = now
             self.last_value = current_value
 
-        return current_value
-
     def __call__(self, **kwargs) -> bool:
         """
         Evaluate the condition by calling evaluate.
@@ -171,7 +200,7 @@ class Condition:
                 return False
             return other(**kwargs)
 
-        return Condition(combined_condition)
+        return Condition._combine(combined_condition, "and", self, other)
 
     def __or__(self, other: "Condition") -> "Condition":
         """
@@ -190,7 +219,7 @@ class Condition:
                 return True
             return other(**kwargs)
 
-        return Condition(combined_condition)
+        return Condition._combine(combined_condition, "or", self, other)
 
     def __invert__(self) -> "Condition":
         """
@@ -203,13 +232,322 @@ class Condition:
         def inverted_condition(**kwargs):
             return not self(**kwargs)
 
-        return Condition(inverted_condition)
+        return Condition._combine(inverted_condition, "not", self)
+
+    @staticmethod
+    def _combine(fn: Callable[..., bool], op: str, *operands: "Condition"):
+        """
+        Create a combined condition that remembers how it was built.
+
+        Args:
+            fn: The function evaluating the combination
+            op: The logical operator, "and", "or" or "not"
+            *operands: The conditions the operator was applied to
+
+        Returns:
+            A new Condition wrapping fn
+        """
+        condition = Condition(fn)
+        condition._op = op
+        condition._operands = operands
+        # Combinations of within() or sequence() conditions track their own
+        # state too (see spaxiom.condition.Condition)
+        condition._stateful = any(
+            getattr(operand, "_stateful", False) for operand in operands
+        )
+        return condition
+
+    def compile(self) -> "Condition":
+        """
+        Fuse a condition built with &, | and ~ into a single function.
+
+        The expression tree is turned into one Python expression, e.g.
+        ``(c0(**kwargs) and not c1(**kwargs))``, which replaces the tree walk
+        done by the combined conditions. Leaf conditions are still called
+        through their own Condition objects, so their timestamp fields are
+        updated as before; only the intermediate &, | and ~ nodes are skipped.
+
+        Returns:
+            A new Condition wrapping the fused function, or this condition if
+            it was not built with &, | or ~. This condition and its operands
+            are left unchanged.
+        """
+        if self._op is None:
+            return self
+
+        namespace: Dict[str, Any] = {}
+        expression = self._emit(namespace)
+        exec(f"def fused_condition(**kwargs):\n    return {expression}\n", namespace)
+        return Condition(namespace["fused_condition"])
+
+    def _emit(self, namespace: Dict[str, Any]) -> str:
+        """
+        Emit the Python expression for this condition.
+
+        Args:
+            namespace: Globals for the fused function; the objects referenced
+                       by the expression are added under unique names
+
+        Returns:
+            The expression source
+        """
+
+        if self._op == "not":
+            return f"(not {self._operands[0]._emit(namespace)})"
+        if self._op is not None:
+            left, right = self._operands
+            return f"({left._emit(namespace)} {self._op} {right._emit(namespace)})"
+
+        name = f"c{len(namespace)}"
+        namespace[name] = self
+        return f"{name}(**kwargs)"
+
+    @classmethod
+    def group(
+        cls, predicates: Sequence[Callable[[Any], bool]], source: Callable[[], Any]
+    ) -> List["Condition"]:
+        """
+        Create conditions that share one reading of a common source.
+
+        The source is read once and the reading is handed to each condition in
+        the group; it is read again as soon as a condition that already used
+        the current reading is evaluated again. Evaluating every condition
+        once per tick therefore costs a single read of the source.
+
+        Args:
+            predicates: Functions taking the reading and returning a boolean
+            source: Callable producing the reading, e.g. a sensor's read method
+
+        Returns:
+            One Condition per predicate, in the same order
+
+        Example:
+            ```python
+            positive, negative = Condition.group(
+                [lambda v: v > 0, lambda v: v < 0], source=sensor.read
+            )
+            ```
+        """
+        reading = _SharedReading(source)
+
+        def make_condition(index: int, predicate: Callable[[Any], bool]):
+            def grouped_condition() -> bool:
+                return predicate(reading.get(index))
+
+            return cls(grouped_condition)
+
+        return [
+            make_condition(index, predicate)
+            for index, predicate in enumerate(predicates)
+        ]
 
     def __repr__(self) -> str:
         """Return a string representation of the condition"""
         return f"Condition({self.fn.__name__ if hasattr(self.fn, '__name__') else 'lambda'})"
 
 
+class _SharedReading:
+    """
+    A reading shared by the conditions of a Condition.group.
+
+    Each member gets the cached reading until it asks for it a second time,
+    which starts a new round with a fresh read.
+    """
+
+    def __init__(self, source: Callable[[], Any]):
+        """
+        Initialize the shared reading.
+
+        Args:
+            source: Callable producing the reading
+        """
+        self.source = source
+        self.value: Any = None
+        # Members that have used the current reading
+        self._used: Set[int] = set()
+
+    def get(self, member: int) -> Any:
+        """
+        Return the current reading for a group member.
+
+        Args:
+            member: Index of the condition within its group
+
+        Returns:
+            The shared reading, refreshed if this member already used it
+        """
+        if not self._used or member in self._used:
+            self.value = self.source()
+            self._used.clear()
+        self._used.add(member)
+        return self.value
+
+
+# Comparison operators supported by ThresholdCondition, with their scalar
+# and vectorized implementations
+_THRESHOLD_OPS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_THRESHOLD_UFUNCS: Dict[str, np.ufunc] = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+class ThresholdCondition(Condition):
+    """
+    A condition comparing a sensor reading against a constant threshold.
+
+    Behaves like ``Condition(lambda: sensor.read() > value)``, but because the
+    comparison is described declaratively the runtime can evaluate many
+    threshold conditions in one vectorized pass (see ThresholdBatch).
+
+    Example:
+        ```python
+        co2_high = ThresholdCondition(co2_sensor, ">", 800)
+        ```
+    """
+
+    def __init__(self, sensor, op: str, value: float):
+        """
+        Initialize the threshold condition.
+
+        Args:
+            sensor: The sensor whose reading is compared
+            op: Comparison operator, one of ">", ">=", "<", "<=", "==", "!="
+            value: The threshold to compare the reading against
+
+        Raises:
+            ValueError: If the operator is not supported
+        """
+        if op not in _THRESHOLD_OPS:
+            raise ValueError(
+                f"Unsupported comparison operator {op!r}; "
+                f"expected one of {', '.join(_THRESHOLD_OPS)}"
+            )
+        compare = _THRESHOLD_OPS[op]
+
+        def threshold_condition() -> bool:
+            reading = sensor.read()
+            return reading is not None and compare(reading, value)
+
+        super().__init__(threshold_condition)
+        self.sensor = sensor
+        self.op = op
+        self.value = value
+        self._threshold = (sensor, op, value)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the condition"""
+        return f"ThresholdCondition({self.sensor.name} {self.op} {self.value})"
+
+
+class ThresholdBatch:
+    """
+    Evaluates a fixed set of threshold conditions in a single vectorized pass.
+
+    Each distinct sensor is read once per evaluation, and the readings are
+    compared against all thresholds with one NumPy comparison per operator.
+    """
+
+    def __init__(self, conditions: Sequence[Condition]):
+        """
+        Initialize the batch.
+
+        Args:
+            conditions: The ThresholdConditions to evaluate together
+        """
+        self.conditions: List[Condition] = list(conditions)
+
+        sensor_index: Dict[int, int] = {}
+        self.sensors = []
+        indices = []
+        thresholds = []
+        ops = []
+        for condition in self.conditions:
+            sensor, op, value = condition._threshold
+            key = id(sensor)
+            if key not in sensor_index:
+                sensor_index[key] = len(self.sensors)
+                self.sensors.append(sensor)
+            indices.append(sensor_index[key])
+            thresholds.append(value)
+            ops.append(op)
+
+        self._indices = np.array(indices, dtype=np.intp)
+        self._thresholds = np.array(thresholds, dtype=float)
+        # Positions of the conditions using each operator
+        self._groups = [
+            (ufunc, np.array([i for i, o in enumerate(ops) if o == op], dtype=np.intp))
+            for op, ufunc in _THRESHOLD_UFUNCS.items()
+            if op in ops
+        ]
+        self._readings = np.empty(len(self.sensors), dtype=float)
+        self._results = np.zeros(len(self.conditions), dtype=bool)
+
+    @classmethod
+    def from_conditions(cls, conditions) -> "ThresholdBatch":
+        """
+        Build a batch from the threshold conditions among arbitrary conditions.
+
+        Args:
+            conditions: Conditions of any kind; duplicates and conditions that
+                        are not threshold tests are skipped
+
+        Returns:
+            A batch over the distinct threshold conditions, in first-seen order
+        """
+        return cls(
+            list(
+                {
+                    condition: None
+                    for condition in conditions
+                    if getattr(condition, "_threshold", None) is not None
+                }
+            )
+        )
+
+    def evaluate(self, now: Optional[float] = None) -> np.ndarray:
+        """
+        Evaluate every condition in the batch and update their timestamp fields.
+
+        Args:
+            now: The current timestamp (uses current time if None)
+
+        Returns:
+            A boolean array with one result per condition, in the original order.
+            The array is reused by the next call.
+        """
+        if now is None:
+            now = time.time()
+
+        readings = self._readings
+        for i, sensor in enumerate(self.sensors):
+            reading = sensor.read()
+            readings[i] = np.nan if reading is None else reading
+
+        values = readings[self._indices]
+        results = self._results
+        for ufunc, positions in self._groups:
+            results[positions] = ufunc(values[positions], self._thresholds[positions])
+        # Missing readings never satisfy a threshold
+        results &= ~np.isnan(values)
+
+        for condition, result in zip(self.conditions, results.tolist()):
+            condition._record(result, now)
+
+        return results
+
+
 def transitioned_to_true(condition: Condition, now: Optional[float] = None) -> bool:
     """
     Helper function to check if a condition just transitioned to true.
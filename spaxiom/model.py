@@ -3,9 +3,16 @@ Model module for probabilistic and machine learning models in Spaxiom DSL.
 """
 
 import random
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 import numpy as np
 
+# Floating-point ONNX tensor types and the NumPy dtypes they take
+_ONNX_FLOAT_TYPES = {
+    "tensor(float16)": np.float16,
+    "tensor(float)": np.float32,
+    "tensor(double)": np.float64,
+}
+
 
 class StubModel:
     """
@@ -95,6 +102,12 @@ class OnnxModel(SensorModel):
     This class loads an ONNX model and provides a predict method to run inference.
     The model is loaded lazily when the first prediction is made.
 
+    Floating-point inputs are converted to the precision the model declares, so
+    the same float32 sensor data can feed a full-precision model or one exported
+    with float16 inputs (e.g. by onnxconverter_common's float16 converter).
+    Integer inputs, such as those of a statically quantized model with uint8
+    inputs, must already be quantized by the caller.
+
     Attributes:
         name: Name of the model
         path: Path to the ONNX model file
@@ -127,6 +140,8 @@ class OnnxModel(SensorModel):
         self.output_name = output_name
         self.providers = providers
         self._session = None
+        # Input name -> NumPy dtype for the model's floating-point inputs
+        self._input_dtypes: Dict[str, Any] = {}
         self._onnx_available = self._check_onnx_available()
 
     def _check_onnx_available(self) -> bool:
@@ -160,6 +175,11 @@ class OnnxModel(SensorModel):
 
             # Load the model
             self._session = ort.InferenceSession(self.path, providers=self.providers)
+            self._input_dtypes = {
+                model_input.name: _ONNX_FLOAT_TYPES[model_input.type]
+                for model_input in self._session.get_inputs()
+                if model_input.type in _ONNX_FLOAT_TYPES
+            }
 
     def predict(self, **named_arrays) -> np.ndarray:
         """
@@ -183,8 +203,20 @@ class OnnxModel(SensorModel):
         if missing_inputs:
             raise ValueError(f"Missing required inputs: {missing_inputs}")
 
-        # Prepare input dict, only including the expected inputs
-        input_dict = {name: named_arrays[name] for name in self.input_names}
+        # Prepare input dict, only including the expected inputs, converting
+        # floating-point arrays to the precision the model expects
+        input_dict = {}
+        for name in self.input_names:
+            array = named_arrays[name]
+            dtype = self._input_dtypes.get(name)
+            if (
+                dtype is not None
+                and isinstance(array, np.ndarray)
+                and array.dtype != dtype
+                and np.issubdtype(array.dtype, np.floating)
+            ):
+                array = array.astype(dtype)
+            input_dict[name] = array
 
         # Run inference
         outputs = self._session.run([self.output_name], input_dict)
@@ -4,18 +4,28 @@ Plugin system for Spaxiom DSL.
 This module provides a plugin mechanism for extending the Spaxiom DSL with custom
 functionality. Plugins can add new sensor types, actuators, or other extensions.
 
-Plugins are automatically loaded from the spaxiom_site_plugins namespace if available.
+Plugins are automatically loaded from the spaxiom_site_plugins namespace if available,
+and from installed packages that advertise them under the "spaxiom.plugins" entry
+point group.
 """
 
 import pkgutil
 import importlib
+import importlib.metadata
 import logging
 import traceback
-from typing import Callable, List
+from typing import Any, Callable, Dict, List
 
 # List of registered plugin functions
 PLUGINS: List[Callable[[], None]] = []
 
+# Entry point group under which installed packages advertise plugins
+ENTRY_POINT_GROUP = "spaxiom.plugins"
+
+# Plugin modules and entry points loaded so far, keyed by module name or
+# entry point value, so each is only looked up and imported once
+_PLUGIN_CACHE: Dict[str, Any] = {}
+
 # Logger for plugin operations
 logger = logging.getLogger(__name__)
 
@@ -50,13 +60,69 @@ def register_plugin(func: Callable[[], None]) -> Callable[[], None]:
     return func
 
 
+def load_plugin(module_name: str) -> Any:
+    """
+    Import a plugin module, registering the plugins it defines.
+
+    Modules are imported once; later calls return the cached module.
+
+    Args:
+        module_name: Dotted name of the module to import
+
+    Returns:
+        The imported module
+
+    Raises:
+        ImportError: If the module cannot be imported
+    """
+    module = _PLUGIN_CACHE.get(module_name)
+    if module is None:
+        module = _PLUGIN_CACHE[module_name] = importlib.import_module(module_name)
+    return module
+
+
+def load_entry_point_plugins() -> None:
+    """
+    Load the plugins advertised under the "spaxiom.plugins" entry point group.
+
+    An entry point may name a module, whose @register_plugin functions are
+    registered when it is imported, or a plugin function, which is registered
+    directly. Entry points that were already loaded are skipped.
+
+    Returns:
+        None
+    """
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        group = entry_points.select(group=ENTRY_POINT_GROUP)
+    else:
+        # Python < 3.10 returns a dict of groups
+        group = entry_points.get(ENTRY_POINT_GROUP, [])
+
+    for entry_point in group:
+        if entry_point.value in _PLUGIN_CACHE:
+            continue
+        try:
+            logger.debug(f"Found plugin entry point: {entry_point.name}")
+            loaded = entry_point.load()
+        except Exception:
+            logger.warning(f"Failed to load plugin entry point: {entry_point.name}")
+            logger.debug(traceback.format_exc())
+            continue
+
+        _PLUGIN_CACHE[entry_point.value] = loaded
+        if callable(loaded):
+            register_plugin(loaded)
+
+
 def discover_and_load_plugins() -> None:
     """
     Discover and load plugins from the spaxiom_site_plugins namespace.
 
     This function searches for modules in the spaxiom_site_plugins namespace
     and imports them, which triggers the registration of any functions
-    decorated with @register_plugin.
+    decorated with @register_plugin. Plugins advertised through entry points
+    are loaded as well (see load_entry_point_plugins).
 
     Returns:
         None
@@ -71,7 +137,7 @@ def discover_and_load_plugins() -> None:
         for _, name, is_pkg in pkgutil.iter_modules(imported.__path__, f"{namespace}."):
             try:
                 logger.debug(f"Found plugin module: {name}")
-                importlib.import_module(name)
+                load_plugin(name)
             except ImportError:
                 logger.warning(f"Failed to import plugin module: {name}")
                 logger.debug(traceback.format_exc())
@@ -82,6 +148,12 @@ def discover_and_load_plugins() -> None:
         logger.warning(f"Error discovering plugins: {str(e)}")
         logger.debug(traceback.format_exc())
 
+    try:
+        load_entry_point_plugins()
+    except Exception as e:
+        logger.warning(f"Error loading plugin entry points: {str(e)}")
+        logger.debug(traceback.format_exc())
+
 
 def initialize_plugins() -> None:
     """
@@ -115,3 +187,4 @@ def reset_plugins() -> None:
     """
     logger.debug("Resetting plugin system...")
     PLUGINS.clear()
+    _PLUGIN_CACHE.clear()
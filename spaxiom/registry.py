@@ -2,7 +2,8 @@
 Registry module for managing sensors in Spaxiom DSL.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 import threading
 
 # Forward reference to avoid circular imports
@@ -25,6 +26,7 @@ class SensorRegistry:
             if cls._instance is None:
                 cls._instance = super(SensorRegistry, cls).__new__(cls)
                 cls._instance._sensors = {}
+                cls._instance._sensors_view = MappingProxyType(cls._instance._sensors)
             return cls._instance
 
     def add(self, sensor) -> None:
@@ -55,10 +57,10 @@ class SensorRegistry:
         Raises:
             KeyError: If no sensor with the given name exists
         """
-        if name not in self._sensors:
-            raise KeyError(f"No sensor with name '{name}' found")
-
-        return self._sensors[name]
+        try:
+            return self._sensors[name]
+        except KeyError:
+            raise KeyError(f"No sensor with name '{name}' found") from None
 
     def list_all(self) -> Dict[str, "Sensor"]:
         """
@@ -67,7 +69,19 @@ class SensorRegistry:
         Returns:
             A dictionary mapping sensor names to sensors
         """
-        return self._sensors.copy()
+        return dict(self._sensors)
+
+    def view_all(self) -> Mapping[str, "Sensor"]:
+        """
+        Return a read-only, live view of all registered sensors.
+
+        Unlike list_all(), this does not copy the registry, so it is cheaper
+        for frequent lookups, but it reflects later additions and removals.
+
+        Returns:
+            A read-only mapping of sensor names to sensors
+        """
+        return self._sensors_view
 
     def clear(self) -> None:
         """
@@ -7,11 +7,13 @@ import logging
 import time
 import signal
 import sys
-from typing import Dict, Callable, Deque, Tuple, Set, List
+from typing import Any, Dict, Callable, Deque, Optional, Tuple, Set, List
 from collections import deque
 
 from spaxiom.events import EVENT_HANDLERS
-from spaxiom.core import SensorRegistry, Sensor
+from spaxiom.core import SensorRegistry, Sensor, advance_tick, reset_tick
+from spaxiom.logic import ThresholdBatch
+from spaxiom.temporal import RingHistory, time_until_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +38,73 @@ RUNTIME_TASK = None
 # Flag to track if plugins have been initialized
 PLUGINS_INITIALIZED = False
 
+# Callbacks invoked once per global poll tick
+TICK_CALLBACKS: List[Callable[[], Any]] = []
+
+# Set by the sensor polling tasks after each read so condition evaluation
+# wakes up on new readings instead of polling on a fixed interval
+SENSORS_UPDATED: Optional[asyncio.Event] = None
+
+# Multiplier applied to the global poll period while no condition changes,
+# doubled after every QUIET_EVALUATIONS quiet evaluations up to
+# MAX_POLL_SCALE and reset to 1 on any change (see start_runtime's max_poll_ms)
+POLL_SCALE = 1.0
+MAX_POLL_SCALE = 1.0
+QUIET_EVALUATIONS = 10
+
+
+def on_tick(callback: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Register a function to be called once per runtime tick.
+
+    The runtime calls tick callbacks every poll_ms milliseconds on a fixed
+    schedule, so periodic work such as model inference shares the runtime's
+    cadence instead of running its own sleep loop. Can be used as a decorator.
+
+    Args:
+        callback: A callable taking no arguments
+
+    Returns:
+        The callback, unchanged
+
+    Example:
+        ```python
+        on_tick(detector.update)
+        ```
+    """
+    TICK_CALLBACKS.append(callback)
+    return callback
+
+
+def use_uvloop() -> bool:
+    """
+    Switch asyncio to the uvloop event loop if it is installed.
+
+    uvloop has noticeably lower per-iteration overhead than the default loop,
+    which matters for the runtime's frequent sensor polls and condition checks.
+    Must be called before the event loop is created (e.g. before asyncio.run).
+
+    Returns:
+        True if uvloop is now the event loop policy, False if it is unavailable
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 def format_sensor_value(sensor: Sensor, value) -> str:
     """
     Format a sensor value respecting privacy settings.
 
+    The privacy check is done once per sensor: the first call picks a
+    formatter for the sensor's privacy level and stores it on the sensor, so
+    later calls go straight to it.
+
     Args:
         sensor: The sensor whose value is being formatted
         value: The value to format
@@ -48,32 +112,70 @@ def format_sensor_value(sensor: Sensor, value) -> str:
     Returns:
         The formatted value as a string, or "***" if the sensor is private
     """
-    if sensor.privacy == "private":
+    formatter = getattr(sensor, "_format", None)
+    if formatter is None:
+        formatter = sensor._format = _value_formatter(sensor)
+    return formatter(value)
+
+
+def _value_formatter(sensor: Sensor) -> Callable[[Any], str]:
+    """
+    Build the function that formats values of a sensor.
+
+    Args:
+        sensor: The sensor whose values will be formatted
+
+    Returns:
+        str for public sensors, or a function redacting every value for
+        private sensors
+    """
+    # For public sensors, format as normal
+    if sensor.privacy != "private":
+        return str
+
+    name = sensor.name
+
+    def redact(value) -> str:
         # Check if we've warned about this sensor already
-        if sensor.name not in PRIVATE_SENSORS_WARNED:
+        if name not in PRIVATE_SENSORS_WARNED:
             logger.warning(
-                f"Sensor '{sensor.name}' is marked as private. Its values will be redacted."
+                f"Sensor '{name}' is marked as private. Its values will be redacted."
             )
-            PRIVATE_SENSORS_WARNED.add(sensor.name)
+            PRIVATE_SENSORS_WARNED.add(name)
 
         return "***"  # Redact private values
 
-    # For public sensors, format as normal
-    return str(value)
+    return redact
 
 
-async def _poll_sensor(sensor: Sensor) -> None:
+def wake() -> None:
+    """
+    Re-evaluate conditions now instead of at the next poll.
+
+    Event-driven sensors can call this when their state changes so that
+    conditions react immediately rather than after up to poll_ms. Does nothing
+    while the runtime is not running.
+    """
+    if SENSORS_UPDATED is not None:
+        SENSORS_UPDATED.set()
+
+
+async def _poll_sensor(sensor: Sensor, adaptive: bool = False) -> None:
     """
     Continuously poll a sensor at its specified sample rate.
 
     Args:
         sensor: The sensor to poll
+        adaptive: Whether to stretch the sample period by POLL_SCALE while the
+                  conditions are quiet
     """
     try:
         while True:
             try:
                 # Read and update the sensor's last_value
                 sensor.read()
+                if SENSORS_UPDATED is not None:
+                    SENSORS_UPDATED.set()
             except Exception as e:
                 # Redact error messages for private sensors
                 error_msg = str(e)
@@ -90,7 +192,10 @@ async def _poll_sensor(sensor: Sensor) -> None:
                 logger.error(f"Error reading sensor {sensor.name}: {error_msg}")
 
             # Sleep for the configured sample period
-            await asyncio.sleep(sensor.sample_period_s)
+            if adaptive:
+                await asyncio.sleep(sensor.sample_period_s * POLL_SCALE)
+            else:
+                await asyncio.sleep(sensor.sample_period_s)
     except asyncio.CancelledError:
         logger.debug(f"Polling task for sensor {sensor.name} cancelled")
     except Exception as e:
@@ -99,12 +204,77 @@ async def _poll_sensor(sensor: Sensor) -> None:
         )
 
 
-async def _evaluate_conditions(history_length: int) -> None:
+async def _run_tick_callbacks(period_s: float) -> None:
+    """
+    Call all registered tick callbacks every period_s seconds.
+
+    Deadlines advance by a fixed period rather than sleeping for period_s after
+    each round, so the time spent in callbacks does not accumulate as drift.
+
+    Args:
+        period_s: Tick period in seconds
+    """
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
+
+    try:
+        while True:
+            for callback in TICK_CALLBACKS:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(
+                        f"Error in tick callback {getattr(callback, '__name__', callback)}: {str(e)}"
+                    )
+
+            next_deadline += period_s
+            now = loop.time()
+            if next_deadline < now:
+                # Fell behind (e.g. a slow callback); skip the missed ticks
+                next_deadline = now
+            await asyncio.sleep(next_deadline - now)
+    except asyncio.CancelledError:
+        logger.debug("Tick callback task cancelled")
+
+
+def _update_poll_scale(changed: bool, quiet: int) -> int:
+    """
+    Widen or reset the global poll period after a condition evaluation.
+
+    Args:
+        changed: Whether any condition changed value in the evaluation
+        quiet: Number of quiet evaluations since the scale last changed
+
+    Returns:
+        The updated count of quiet evaluations
+    """
+    global POLL_SCALE
+
+    if changed:
+        POLL_SCALE = 1.0
+        return 0
+
+    quiet += 1
+    if quiet < QUIET_EVALUATIONS:
+        return quiet
+    POLL_SCALE = min(POLL_SCALE * 2, MAX_POLL_SCALE)
+    return 0
+
+
+async def _evaluate_conditions(history_length: int, max_wait_s: float = 0.01) -> None:
     """
     Continuously evaluate all conditions and trigger callbacks on rising edges.
 
+    Conditions are re-evaluated whenever a sensor polling task has taken a new
+    reading, when a temporal window is due to complete, and at least every
+    max_wait_s seconds so that time-based conditions keep advancing while no
+    readings arrive. Each pass runs in its
+    own tick (see spaxiom.core.advance_tick), so a sensor used by several
+    conditions is read once per pass.
+
     Args:
         history_length: Maximum number of history entries to keep per condition
+        max_wait_s: Longest time to wait for new readings between evaluations
     """
     # Track which conditions were true in the previous iteration
     # to detect rising edges (false -> true transitions)
@@ -113,15 +283,43 @@ async def _evaluate_conditions(history_length: int) -> None:
     # Create a mapping of conditions to their unique IDs for history tracking
     condition_ids: Dict[Callable[[], bool], int] = {}
 
+    # Each condition's own history, kept in a preallocated ring buffer so it
+    # does not have to be filtered out of GLOBAL_HISTORY on every evaluation
+    histories: Dict[int, RingHistory] = {}
+
     # Initialize all conditions as False and assign unique IDs
     for i, (condition, _) in enumerate(EVENT_HANDLERS):
         previous_states[condition] = False
         condition_ids[condition] = i
+        histories[i] = RingHistory(history_length)
+
+    # Threshold conditions are evaluated together in one vectorized pass
+    thresholds = ThresholdBatch.from_conditions(
+        condition for condition, _ in EVENT_HANDLERS
+    )
+
+    quiet = 0
 
     try:
         while True:
             # Get current timestamp using monotonic time (doesn't go backwards)
             current_time = time.monotonic()
+            changed = False
+            # Callbacks of conditions that rose during this pass, run once the
+            # pass (and its tick) is over so they see fresh sensor readings
+            fired: List[Callable[[], Any]] = []
+            advance_tick()
+
+            threshold_states: Dict[Callable[[], bool], bool] = {}
+            if thresholds.conditions:
+                try:
+                    results = thresholds.evaluate(current_time)
+                    threshold_states = dict(
+                        zip(thresholds.conditions, results.tolist())
+                    )
+                except Exception as e:
+                    # Fall back to evaluating each condition on its own
+                    logger.error(f"Error in threshold conditions: {str(e)}")
 
             # Check all event handlers for rising edges
             for condition, callback in EVENT_HANDLERS:
@@ -129,39 +327,39 @@ async def _evaluate_conditions(history_length: int) -> None:
                     # Get the condition ID
                     condition_id = condition_ids[condition]
 
-                    # Filter history for this condition
-                    condition_history = [
-                        (timestamp, value)
-                        for timestamp, cid, value in GLOBAL_HISTORY
-                        if cid == condition_id
-                    ]
-
-                    # Prepare kwargs for condition evaluation
-                    kwargs = {"now": current_time}
-
-                    # Only include history if we have entries for this condition
-                    if condition_history:
-                        kwargs["history"] = deque(
-                            condition_history, maxlen=history_length
-                        )
-
-                    # Evaluate the condition via its __call__ method
-                    try:
-                        current_state = bool(condition(**kwargs))
-                    except TypeError:
-                        # If it fails with kwargs, try with no arguments
-                        current_state = bool(condition())
+                    if condition in threshold_states:
+                        # Already evaluated in the vectorized threshold pass
+                        current_state = threshold_states[condition]
+                    else:
+                        # Prepare kwargs for condition evaluation
+                        kwargs = {"now": current_time}
+
+                        # Only include history if we have entries for this
+                        # condition; within() and sequence() conditions track
+                        # their base conditions themselves instead
+                        if histories[condition_id] and not getattr(
+                            condition, "_stateful", False
+                        ):
+                            kwargs["history"] = histories[condition_id]
+
+                        # Evaluate the condition via its __call__ method
+                        try:
+                            current_state = bool(condition(**kwargs))
+                        except TypeError:
+                            # If it fails with kwargs, try with no arguments
+                            current_state = bool(condition())
 
                     # Add to global history
                     GLOBAL_HISTORY.append((current_time, condition_id, current_state))
+                    histories[condition_id].push(current_time, current_state)
 
                     # Check for rising edge (false -> true)
                     if current_state and not previous_states[condition]:
-                        # We don't redact callback names as they don't contain sensor values
-                        print(f"[Spaxiom] Fired {callback.__name__}")
-                        await asyncio.create_task(asyncio.to_thread(callback))
+                        fired.append(callback)
 
                     # Update the previous state
+                    if current_state != previous_states[condition]:
+                        changed = True
                     previous_states[condition] = current_state
 
                 except Exception as e:
@@ -169,9 +367,38 @@ async def _evaluate_conditions(history_length: int) -> None:
                         f"Error in condition or callback {callback.__name__}: {str(e)}"
                     )
 
-            # Small delay to prevent CPU hogging (much shorter than previous global poll)
-            await asyncio.sleep(0.01)  # 10ms
+            # Polling tasks and callbacks sample fresh readings between passes
+            reset_tick()
+
+            for callback in fired:
+                try:
+                    # We don't redact callback names as they don't contain sensor values
+                    print(f"[Spaxiom] Fired {callback.__name__}")
+                    await asyncio.create_task(asyncio.to_thread(callback))
+                except Exception as e:
+                    logger.error(
+                        f"Error in condition or callback {callback.__name__}: {str(e)}"
+                    )
+
+            if MAX_POLL_SCALE > 1:
+                quiet = _update_poll_scale(changed, quiet)
+
+            # Sleep until a sensor has a new reading (or the wait times out),
+            # waking early when a within() window is due to complete
+            wait_s = max_wait_s
+            deadline_s = time_until_deadline(time.monotonic())
+            if deadline_s is not None:
+                wait_s = min(wait_s, deadline_s)
+            if SENSORS_UPDATED is None:
+                await asyncio.sleep(wait_s)
+            else:
+                try:
+                    await asyncio.wait_for(SENSORS_UPDATED.wait(), wait_s)
+                except asyncio.TimeoutError:
+                    pass
+                SENSORS_UPDATED.clear()
     except asyncio.CancelledError:
+        reset_tick()
         logger.debug("Condition evaluation task cancelled")
 
 
@@ -230,7 +457,9 @@ async def shutdown():
 
 
 async def start_runtime(
-    poll_ms: int = 100, history_length: int = MAX_HISTORY_LENGTH
+    poll_ms: int = 100,
+    history_length: int = MAX_HISTORY_LENGTH,
+    max_poll_ms: Optional[int] = None,
 ) -> None:
     """
     Start the Spaxiom runtime that reads sensors and processes events asynchronously.
@@ -238,6 +467,11 @@ async def start_runtime(
     Args:
         poll_ms: The polling interval in milliseconds (for backward compatibility, only used for sensors with sample_period_s=0)
         history_length: Maximum number of history entries to keep per condition
+        max_poll_ms: If set, sensors on the global poll rate are polled less
+                     often while no condition changes value: the interval
+                     doubles after every QUIET_EVALUATIONS quiet evaluations,
+                     up to max_poll_ms, and drops back to poll_ms as soon as a
+                     condition changes
 
     This function:
     1. Loads and initializes plugins
@@ -251,7 +485,7 @@ async def start_runtime(
 
     Terminate with KeyboardInterrupt (Ctrl+C).
     """
-    global GLOBAL_HISTORY, PRIVATE_SENSORS_WARNED, ACTIVE_TASKS, SHUTDOWN_INITIATED, RUNTIME_TASK, PLUGINS_INITIALIZED
+    global GLOBAL_HISTORY, PRIVATE_SENSORS_WARNED, ACTIVE_TASKS, SHUTDOWN_INITIATED, RUNTIME_TASK, PLUGINS_INITIALIZED, SENSORS_UPDATED, POLL_SCALE, MAX_POLL_SCALE
 
     # Store reference to this task
     RUNTIME_TASK = asyncio.current_task()
@@ -265,6 +499,13 @@ async def start_runtime(
     # Clear the warned sensors set at the beginning of each run
     PRIVATE_SENSORS_WARNED.clear()
 
+    # Fresh wake-up event for this run's event loop
+    SENSORS_UPDATED = asyncio.Event()
+
+    # Adaptive polling starts at the base rate
+    POLL_SCALE = 1.0
+    MAX_POLL_SCALE = max(max_poll_ms / poll_ms, 1.0) if max_poll_ms else 1.0
+
     # Clear any existing tasks
     for task in ACTIVE_TASKS:
         if not task.done():
@@ -320,7 +561,9 @@ async def start_runtime(
                 sensor._original_sample_period_s = sensor.sample_period_s
                 # Set the sample period temporarily for this run
                 sensor.sample_period_s = adjusted_period
-                task = asyncio.create_task(_poll_sensor(sensor))
+                task = asyncio.create_task(
+                    _poll_sensor(sensor, adaptive=MAX_POLL_SCALE > 1)
+                )
                 ACTIVE_TASKS.append(task)
 
         print(
@@ -328,8 +571,15 @@ async def start_runtime(
         )
         print("[Spaxiom] Press Ctrl+C to stop")
 
+        # Run tick callbacks at the global poll rate
+        if TICK_CALLBACKS:
+            tick_task = asyncio.create_task(_run_tick_callbacks(poll_ms / 1000))
+            ACTIVE_TASKS.append(tick_task)
+
         # Create and start the condition evaluation task
-        evaluation_task = asyncio.create_task(_evaluate_conditions(history_length))
+        evaluation_task = asyncio.create_task(
+            _evaluate_conditions(history_length, poll_ms / 1000)
+        )
         ACTIVE_TASKS.append(evaluation_task)
 
         # Wait until interrupted
@@ -344,7 +594,9 @@ async def start_runtime(
 
 
 def start_blocking(
-    poll_ms: int = 100, history_length: int = MAX_HISTORY_LENGTH
+    poll_ms: int = 100,
+    history_length: int = MAX_HISTORY_LENGTH,
+    max_poll_ms: Optional[int] = None,
 ) -> None:
     """
     Start the Spaxiom runtime in a blocking manner (wrapper for async start_runtime).
@@ -352,9 +604,11 @@ def start_blocking(
     Args:
         poll_ms: The polling interval in milliseconds (for sensors with sample_period_s=0)
         history_length: Maximum number of history entries to keep per condition
+        max_poll_ms: Longest polling interval while conditions are quiet (see start_runtime)
     """
+    use_uvloop()
     try:
-        asyncio.run(start_runtime(poll_ms, history_length))
+        asyncio.run(start_runtime(poll_ms, history_length, max_poll_ms))
     except KeyboardInterrupt:
         # This will be caught by asyncio.run and the event loop will be closed
         pass
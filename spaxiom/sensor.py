@@ -2,21 +2,73 @@
 Sensor module for Spaxiom DSL.
 """
 
-from typing import Optional, Dict, Any, Tuple
+from typing import Callable, Optional, Dict, Any, List, Tuple
 import numpy as np
 import time
 
 from spaxiom.core import Sensor
 
 
+class BufferedDraws:
+    """
+    Hands out random values one at a time from blocks drawn in one call.
+
+    Each block is drawn with a single vectorized call and converted to Python
+    floats once, so taking a value is a list lookup rather than a call into
+    the generator. The first block is drawn on the first take().
+
+    Example:
+        ```python
+        noise = BufferedDraws(np.random.default_rng().standard_normal)
+        value = true_value + noise_stddev * noise.take()
+        ```
+    """
+
+    def __init__(self, draw: Callable[[int], np.ndarray], size: int = 1024):
+        """
+        Initialize the buffer.
+
+        Args:
+            draw: Function returning an array of the given number of values,
+                  e.g. a Generator's standard_normal or random method
+            size: Number of values drawn per block
+        """
+        self._draw = draw
+        self.size = size
+        self._buffer: List[float] = []
+        self._cursor = 0
+
+    def take(self) -> float:
+        """
+        Return the next value, drawing a new block when the buffer is used up.
+
+        Returns:
+            The next random value
+        """
+        if self._cursor == len(self._buffer):
+            self._buffer = self._draw(self.size).tolist()
+            self._cursor = 0
+        value = self._buffer[self._cursor]
+        self._cursor += 1
+        return value
+
+
 class RandomSensor(Sensor):
     """
     A sensor that returns random values when read.
 
+    By default each read draws from NumPy's global random state, so
+    np.random.seed() makes the readings reproducible. When a seed or a
+    Generator is given, values are instead drawn from that generator into a
+    buffer that is refilled with one vectorized call every `buffer_size`
+    reads.
+
     Attributes:
         hz: Frequency in Hz at which the sensor should be polled (sets sample_period_s)
     """
 
+    buffer_size = 1024
+
     def __init__(
         self,
         name: str,
@@ -24,6 +76,8 @@ class RandomSensor(Sensor):
         hz: float = 1.0,
         privacy: str = "public",
         metadata: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
     ):
         # Calculate sample period from frequency
         sample_period = 1.0 / hz if hz > 0 else 0.0
@@ -36,6 +90,11 @@ class RandomSensor(Sensor):
             sample_period_s=sample_period,
             metadata=metadata,
         )
+        if rng is None and seed is not None:
+            rng = np.random.default_rng(seed)
+        self._draws = (
+            None if rng is None else BufferedDraws(rng.random, self.buffer_size)
+        )
 
     def _read_raw(self) -> float:
         """
@@ -44,7 +103,9 @@ class RandomSensor(Sensor):
         Returns:
             A random float between 0 and 1.
         """
-        return float(np.random.random())
+        if self._draws is None:
+            return float(np.random.random())
+        return self._draws.take()
 
     def __repr__(self):
         return f"RandomSensor(name='{self.name}', location={self.location}, privacy='{self.privacy}')"
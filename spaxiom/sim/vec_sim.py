@@ -5,17 +5,47 @@ This module provides a SimVector class that efficiently generates multiple
 virtual sensors with sinusoidal data patterns.
 """
 
+import functools
+import importlib.util
 import math
 import time
 import asyncio
 import threading
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Callable, List, Tuple, Optional, Dict, Any
 
 import numpy as np
 
 from spaxiom.core import Sensor
 
 
+@functools.lru_cache(maxsize=None)
+def _load_step() -> Tuple[Optional[Callable[..., np.ndarray]], float]:
+    """
+    Compile the numba kernel used for mixed-frequency reads, if numba is installed.
+
+    numba is imported on first use rather than at module import, since importing
+    it noticeably slows down ``import spaxiom``.
+
+    Returns:
+        Tuple of (kernel or None, largest slice size the kernel should be used for)
+    """
+    if importlib.util.find_spec("numba") is None:
+        return None, 0
+
+    import numba
+
+    @numba.njit(nogil=True, fastmath=True, cache=True)
+    def _step(omega, amplitude, phase, offset, t, out):
+        for i in range(out.size):
+            out[i] = offset[i] + amplitude[i] * np.sin(omega[i] * t + phase[i])
+        return out
+
+    # Without SVML the compiled loop calls the scalar libm sin, which NumPy's
+    # SIMD sin overtakes on long arrays; above this size the ufuncs are used
+    max_size = float("inf") if numba.config.USING_SVML else 2048
+    return _step, max_size
+
+
 class SimSensor(Sensor):
     """
     A sensor that provides simulated sinusoidal data.
@@ -60,8 +90,39 @@ class SimSensor(Sensor):
         self.amplitude = amplitude
         self.phase = phase
         self.offset = offset
+        # The SimVector this sensor belongs to, if any
+        self.vector: Optional["SimVector"] = None
+
+        # The current value lives in a float buffer so that a SimVector can
+        # store the values of all its sensors in one contiguous array
+        self._bind(np.empty(1, dtype=np.float64), 0)
         self.current_value = offset
 
+    def _bind(self, values: np.ndarray, index: int) -> None:
+        """
+        Store this sensor's current value in slot `index` of `values`.
+
+        Args:
+            values: Contiguous float array holding sensor values
+            index: Position of this sensor's value in the array
+        """
+        self._values = memoryview(values)
+        self._index = index
+
+    @property
+    def index(self) -> int:
+        """Position of this sensor's value in its SimVector's values."""
+        return self._index
+
+    @property
+    def current_value(self) -> float:
+        """The most recently simulated value."""
+        return self._values[self._index]
+
+    @current_value.setter
+    def current_value(self, value: float) -> None:
+        self._values[self._index] = value
+
     def _read_raw(self) -> float:
         """
         Return the current value without updating it.
@@ -70,7 +131,7 @@ class SimSensor(Sensor):
         Returns:
             The current sensor value
         """
-        return self.current_value
+        return self._values[self._index]
 
     def calculate_value(self, t: float) -> float:
         """
@@ -110,6 +171,7 @@ class SimVector:
         phase_range: Tuple[float, float] = (0, 2 * math.pi),
         offset_range: Tuple[float, float] = (-0.5, 0.5),
         privacy: str = "public",
+        dtype: Any = np.float64,
     ):
         """
         Initialize a vector of simulated sensors.
@@ -125,13 +187,18 @@ class SimVector:
             phase_range: Range of random phases in radians (min, max)
             offset_range: Range of random vertical offsets (min, max)
             privacy: Privacy level for all sensors ('public' or 'private')
+            dtype: Floating point type of the computed values. np.float32 halves
+                the memory traffic and doubles the SIMD width of the sine at the
+                cost of precision (about 1e-4 relative over the first hours)
         """
         self.n = n
+        self.dtype = np.dtype(dtype)
         self.hz = hz
         self.update_period = 1.0 / hz if hz > 0 else 0.1
         self.sensors: List[SimSensor] = []
         self.running = False
         self._update_task = None
+        self._start_time = time.time()
 
         # Create the sensors
         for i in range(n):
@@ -158,6 +225,128 @@ class SimVector:
 
             self.sensors.append(sensor)
 
+        # Keep sensor parameters and values as contiguous arrays (structure of
+        # arrays) so that all values can be computed with a single vectorized
+        # expression; parameters are captured here at construction time, in
+        # float64 and then rounded once to the requested dtype
+        self._omega = (
+            2 * np.pi * np.array([s.frequency for s in self.sensors], dtype=float)
+        ).astype(self.dtype)
+        self._amplitude = np.array(
+            [s.amplitude for s in self.sensors], dtype=self.dtype
+        )
+        self._phase = np.array([s.phase for s in self.sensors], dtype=self.dtype)
+        self._offset = np.array([s.offset for s in self.sensors], dtype=self.dtype)
+
+        # When every sensor shares one frequency, expand
+        #   offset + A*sin(w*t + phase) = sin(w*t)*A*cos(phase) + cos(w*t)*A*sin(phase) + offset
+        # so a read needs two scalar trig calls and one small matrix product
+        # instead of n sines
+        self._shared_omega = None
+        if n > 0 and np.all(self._omega == self._omega[0]):
+            self._shared_omega = 2 * np.pi * float(self.sensors[0].frequency)
+            self._basis = np.vstack(
+                [
+                    self._amplitude * np.cos(self._phase),
+                    self._amplitude * np.sin(self._phase),
+                    self._offset,
+                ]
+            )
+            self._step, self._step_max_size = None, 0
+        else:
+            # Mixed frequencies use the compiled kernel when numba is available
+            self._step, self._step_max_size = _load_step()
+
+        self._values = self._offset.copy()
+        self._scratch = np.empty_like(self._values)
+
+        # Sensors read their current value straight out of the shared array
+        for i, sensor in enumerate(self.sensors):
+            sensor._bind(self._values, i)
+            sensor.vector = self
+
+    def values_view(self) -> np.ndarray:
+        """
+        Return a read-only view of the current values of all sensors.
+
+        The view shares memory with the vector, so it reflects every update
+        without copying; entry i is the value sensors[i] returns when read.
+
+        Returns:
+            Array of current sensor values, in the same order as sensors
+        """
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    def read_all(
+        self, t: Optional[float] = None, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate the values of all sensors at once.
+
+        Args:
+            t: Time in seconds (defaults to the time elapsed since start())
+            out: Optional array of length n and the vector's dtype to write into
+
+        Returns:
+            Array of sensor values, one per sensor, in the same order as sensors
+        """
+        return self.read_slice(0, self.n, t, out)
+
+    def read_slice(
+        self,
+        start: int,
+        stop: int,
+        t: Optional[float] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Calculate the values of the sensors in sensors[start:stop] at once.
+
+        The parameter arrays are sliced without copying, so disjoint slices can be
+        evaluated from separate threads; NumPy releases the GIL while the ufuncs
+        run. When numba is installed, sensors with differing frequencies are
+        evaluated by a compiled kernel instead of a chain of ufuncs.
+
+        Args:
+            start: Index of the first sensor
+            stop: Index one past the last sensor
+            t: Time in seconds (defaults to the time elapsed since start())
+            out: Optional array of length stop - start and the vector's dtype
+
+        Returns:
+            Array of values for the selected sensors
+        """
+        if t is None:
+            t = time.time() - self._start_time
+
+        if self._shared_omega is not None:
+            wt = self._shared_omega * t
+            weights = np.array([math.sin(wt), math.cos(wt), 1.0], dtype=self.dtype)
+            return np.dot(weights, self._basis[:, start:stop], out=out)
+
+        if self._step is not None and stop - start <= self._step_max_size:
+            # Compiled loop, one pass over the arrays with the GIL released
+            if out is None:
+                out = np.empty(stop - start, dtype=self.dtype)
+            return self._step(
+                self._omega[start:stop],
+                self._amplitude[start:stop],
+                self._phase[start:stop],
+                self._offset[start:stop],
+                self.dtype.type(t),
+                out,
+            )
+
+        # Evaluate in place to avoid allocating a temporary per operation
+        values = np.multiply(self._omega[start:stop], self.dtype.type(t), out=out)
+        np.add(values, self._phase[start:stop], out=values)
+        np.sin(values, out=values)
+        np.multiply(values, self._amplitude[start:stop], out=values)
+        np.add(values, self._offset[start:stop], out=values)
+        return values
+
     def start(self) -> None:
         """
         Start the simulation update task.
@@ -168,6 +357,10 @@ class SimVector:
         self.running = True
         self._start_time = time.time()
 
+        # Evaluate once up front so the numba kernel, if used, is compiled (or
+        # loaded from its cache) here rather than delaying the first update
+        self.read_all(0.0, out=self._scratch)
+
         # Create and start the update thread
         self._update_thread = threading.Thread(target=self._run_async_loop, daemon=True)
         self._update_thread.start()
@@ -205,9 +398,9 @@ class SimVector:
             while self.running:
                 t = time.time() - self._start_time
 
-                # Update all sensors efficiently in a single loop
-                for sensor in self.sensors:
-                    sensor.current_value = sensor.calculate_value(t)
+                # Compute into a scratch buffer, then publish all values at once
+                # so readers never observe a partially evaluated expression
+                self._values[:] = self.read_all(t, out=self._scratch)
 
                 # Wait until next update
                 await asyncio.sleep(self.update_period)
@@ -3,8 +3,8 @@ Summarize module for statistical analysis of sensor readings in Spaxiom DSL.
 """
 
 from collections import deque
-from typing import Optional, Union, Deque
-import statistics
+from typing import Optional, Tuple, Union, Deque
+import math
 import numpy as np
 
 
@@ -15,6 +15,12 @@ class RollingSummary:
     Keeps track of the last N readings and provides methods to get statistics
     and a human-readable text summary including trend information.
 
+    The statistics are maintained incrementally as readings are added, so each
+    add() and each getter is O(1) (amortized) rather than a scan of the window:
+    a running sum gives the average, and the minimum and maximum are kept at
+    the front of monotonic deques (the sliding window minimum algorithm), and a
+    running position-weighted sum gives the least squares slope.
+
     Attributes:
         window: Number of readings to keep in the rolling window
         readings: Deque containing the most recent readings
@@ -35,6 +41,16 @@ class RollingSummary:
 
         self.window = window
         self.readings: Deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        # Sum of position * value, positions numbered 0..n-1 from the oldest
+        # reading in the window, for the least squares slope
+        self._weighted_sum = 0.0
+        # Number of readings ever added, used to index the monotonic deques
+        self._count = 0
+        # (index, value) pairs with increasing values for the minimum and
+        # decreasing values for the maximum; the front is the current extreme
+        self._min_queue: Deque[Tuple[int, float]] = deque()
+        self._max_queue: Deque[Tuple[int, float]] = deque()
 
     def add(self, value: Union[float, int, np.ndarray]) -> None:
         """
@@ -50,11 +66,50 @@ class RollingSummary:
             value = float(value[0])
 
         # Convert to float to ensure consistency
-        self.readings.append(float(value))
+        value = float(value)
+
+        size = len(self.readings)
+        if size == self.window:
+            # Dropping the oldest reading moves every other one down a position
+            evicted = self.readings[0]
+            self._weighted_sum -= self._sum - evicted
+            size -= 1
+        else:
+            evicted = 0.0
+        self.readings.append(value)
+        self._count += 1
+
+        if self._count % self.window == 0:
+            # Resynchronize once per window so rounding errors cannot accumulate
+            self._sum = math.fsum(self.readings)
+            self._weighted_sum = math.fsum(
+                position * reading for position, reading in enumerate(self.readings)
+            )
+        else:
+            self._sum += value - evicted
+            self._weighted_sum += size * value
+
+        index = self._count
+        oldest = index - self.window
+        min_queue, max_queue = self._min_queue, self._max_queue
+        while min_queue and min_queue[-1][1] >= value:
+            min_queue.pop()
+        min_queue.append((index, value))
+        if min_queue[0][0] <= oldest:
+            min_queue.popleft()
+        while max_queue and max_queue[-1][1] <= value:
+            max_queue.pop()
+        max_queue.append((index, value))
+        if max_queue[0][0] <= oldest:
+            max_queue.popleft()
 
     def clear(self) -> None:
         """Clear all readings from the window."""
         self.readings.clear()
+        self._sum = 0.0
+        self._weighted_sum = 0.0
+        self._min_queue.clear()
+        self._max_queue.clear()
 
     def is_empty(self) -> bool:
         """Check if there are any readings in the window."""
@@ -69,7 +124,7 @@ class RollingSummary:
         """
         if not self.readings:
             return None
-        return statistics.mean(self.readings)
+        return self._sum / len(self.readings)
 
     def get_max(self) -> Optional[float]:
         """
@@ -80,7 +135,7 @@ class RollingSummary:
         """
         if not self.readings:
             return None
-        return max(self.readings)
+        return self._max_queue[0][1]
 
     def get_min(self) -> Optional[float]:
         """
@@ -91,7 +146,27 @@ class RollingSummary:
         """
         if not self.readings:
             return None
-        return min(self.readings)
+        return self._min_queue[0][1]
+
+    def get_slope(self) -> Optional[float]:
+        """
+        Get the least squares slope of the readings against their position.
+
+        The slope is computed in closed form from running sums, since the
+        positions are always 0..n-1, so it costs O(1) however large the window.
+
+        Returns:
+            The change in value per reading, or None if not enough readings
+        """
+        n = len(self.readings)
+        if n < 2:
+            return None
+
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        return (n * self._weighted_sum - sum_x * self._sum) / (
+            n * sum_xx - sum_x * sum_x
+        )
 
     def get_trend(self) -> Optional[str]:
         """
@@ -103,12 +178,12 @@ class RollingSummary:
         if len(self.readings) < 2:
             return None
 
-        readings_list = list(self.readings)
+        first, last = self.readings[0], self.readings[-1]
 
         # Use the first and last readings to determine the overall trend
-        if readings_list[-1] > readings_list[0]:
+        if last > first:
             return "rising"
-        elif readings_list[-1] < readings_list[0]:
+        elif last < first:
             return "falling"
         else:
             return "stable"
@@ -2,10 +2,52 @@
 Temporal module for time-based condition evaluation in Spaxiom DSL.
 """
 
-from typing import Deque, Tuple, List, Dict
+from typing import (
+    Callable,
+    Deque,
+    Iterator,
+    Tuple,
+    List,
+    Dict,
+    Optional,
+    Sequence,
+)
+import functools
+import importlib.util
 import time
+import weakref
+
+import numpy as np
 
 from spaxiom.condition import Condition
+from spaxiom.logic import ThresholdBatch
+
+# Every live TemporalWindow, so loops can find the next window deadline
+_WINDOWS: "weakref.WeakSet[TemporalWindow]" = weakref.WeakSet()
+
+
+def time_until_deadline(now: float) -> Optional[float]:
+    """
+    Return the number of seconds until the next temporal window can complete.
+
+    Useful as a timeout for loops that block until something changes, so that
+    a within() condition whose base stays true is re-evaluated as soon as its
+    window has elapsed rather than at the next sensor update.
+
+    Args:
+        now: Current time, on the same clock as the timestamps the windows
+             were evaluated with
+
+    Returns:
+        Seconds until the earliest deadline still ahead of now, or None if no
+        window has one
+    """
+    deadlines = [
+        window.deadline
+        for window in _WINDOWS
+        if window.deadline is not None and window.deadline > now
+    ]
+    return min(deadlines) - now if deadlines else None
 
 
 class TemporalWindow:
@@ -28,6 +70,45 @@ class TemporalWindow:
         """
         self.duration_s = duration_s
         self.base = base
+        # Start of the base condition's current true run, or None if false
+        self._since: Optional[float] = None
+        _WINDOWS.add(self)
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """
+        The time at which the current true run fills the window.
+
+        None while the base condition is false. The time is on the clock of
+        the timestamps passed to update() or evaluate().
+        """
+        if self._since is None:
+            return None
+        return self._since + self.duration_s
+
+    def update(self, now: float) -> bool:
+        """
+        Evaluate the base condition and check how long it has been true.
+
+        Used when no history is available (e.g. with events.process_events).
+        Only the start of the current true run is kept, so each call costs one
+        evaluation of the base condition. Loops that block between calls can
+        use time_until_deadline() to wake up when the window completes.
+
+        Args:
+            now: Current timestamp in seconds
+
+        Returns:
+            True if the base condition has been true since at least
+            duration_s seconds ago, False otherwise
+        """
+        if not self.base():
+            self._since = None
+            return False
+
+        if self._since is None:
+            self._since = now
+        return now - self._since >= self.duration_s
 
     def evaluate(self, now: float, history: Deque[Tuple[float, bool]]) -> bool:
         """
@@ -40,6 +121,7 @@ class TemporalWindow:
         Returns:
             True if the base condition has been continuously true for duration_s seconds, False otherwise
         """
+        self._since = None
         if not history:
             return False
 
@@ -51,12 +133,14 @@ class TemporalWindow:
         # We need all entries to be True for at least duration_s seconds
         earliest_required_time = now - self.duration_s
 
-        # Find the most recent False value
+        # Find the most recent False value, and the first True entry after it,
+        # which starts the current true run
         most_recent_false_time = None
         for timestamp, value in reversed(history):
             if not value:
                 most_recent_false_time = timestamp
                 break
+            self._since = timestamp
 
         # If we found a False value, check when it occurred
         if most_recent_false_time is not None:
@@ -77,6 +161,195 @@ class TemporalWindow:
         return has_early_enough_reading
 
 
+@functools.lru_cache(maxsize=None)
+def _load_last_edge() -> Optional[Callable[..., float]]:
+    """
+    Compile the numba kernel that finds the last rising edge in a ring buffer.
+
+    numba is imported on first use, as in spaxiom.sim.vec_sim, so that it does
+    not slow down ``import spaxiom``.
+
+    Returns:
+        The compiled kernel, or None if numba is not installed
+    """
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    import numba
+
+    @numba.njit(nogil=True, cache=True)
+    def _last_edge(ts, val, head, size):
+        # Walk the ring backwards from the newest entry; the first
+        # False -> True step found is the most recent rising edge
+        capacity = ts.size
+        slot = (head - 1) % capacity
+        for _ in range(size - 1):
+            previous = (slot - 1) % capacity
+            if val[slot] and not val[previous]:
+                return ts[slot]
+            slot = previous
+        return np.nan
+
+    return _last_edge
+
+
+class RingHistory:
+    """
+    A fixed-capacity history of (timestamp, value) entries stored in NumPy arrays.
+
+    A drop-in replacement for ``deque(maxlen=capacity)`` of (timestamp, bool)
+    tuples: it supports append, len, indexing and iteration in the same
+    chronological order, but keeps timestamps and values in two preallocated
+    ring buffers instead of one tuple per entry, so appending allocates
+    nothing and scans such as rising_edges() run vectorized.
+
+    Timestamps are expected to be appended in non-decreasing order.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity: Maximum number of entries; the oldest entries are
+                      overwritten once it is reached
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("RingHistory capacity must be positive")
+
+        self.capacity = capacity
+        self.ts = np.empty(capacity, dtype=np.float64)
+        self.val = np.zeros(capacity, dtype=bool)
+        self.head = 0  # Slot the next entry is written to
+        self.size = 0
+
+    def push(self, timestamp: float, value: bool) -> None:
+        """
+        Add an entry, overwriting the oldest one if the history is full.
+
+        Args:
+            timestamp: Time of the entry in seconds
+            value: The condition value at that time
+        """
+        self.ts[self.head] = timestamp
+        self.val[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    # deque-compatible name, so existing code appending tuples keeps working
+    def append(self, entry: Tuple[float, bool]) -> None:
+        """
+        Add a (timestamp, value) entry.
+
+        Args:
+            entry: The (timestamp, value) tuple to add
+        """
+        self.push(entry[0], entry[1])
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the timestamps and values in chronological order.
+
+        Returns:
+            Tuple of (timestamps, values) arrays; copies when the buffer has
+            wrapped around, views otherwise
+        """
+        if self.size < self.capacity:
+            return self.ts[: self.size], self.val[: self.size]
+        order = np.r_[self.head : self.capacity, 0 : self.head]
+        return self.ts[order], self.val[order]
+
+    def rising_edges(self, since: float = -np.inf) -> np.ndarray:
+        """
+        Return the timestamps of False -> True transitions.
+
+        Args:
+            since: Only report transitions at or after this time
+
+        Returns:
+            Array of transition timestamps in chronological order
+        """
+        ts, val = self.arrays()
+        # Entries before `since` can be skipped, except the one just before
+        # the window, which decides whether the first entry in it is an edge
+        start = max(int(np.searchsorted(ts, since, side="left")) - 1, 0)
+        ts, val = ts[start:], val[start:]
+        return ts[1:][val[1:] & ~val[:-1]]
+
+    def last_rising_edge(self) -> Optional[float]:
+        """
+        Return the timestamp of the most recent False -> True transition.
+
+        With numba installed the ring buffer is scanned in place from the
+        newest entry, stopping at the first edge found, instead of reordering
+        the buffer and computing every edge.
+
+        Returns:
+            The timestamp of the transition, or None if there is none
+        """
+        kernel = _load_last_edge()
+        if kernel is None:
+            edges = self.rising_edges()
+            return float(edges[-1]) if edges.size else None
+
+        edge = kernel(self.ts, self.val, self.head, self.size)
+        return None if np.isnan(edge) else float(edge)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return self.size
+
+    def __getitem__(self, index: int) -> Tuple[float, bool]:
+        """
+        Return the entry at a chronological index (negative indices allowed).
+
+        Args:
+            index: Position of the entry, 0 being the oldest
+
+        Returns:
+            The (timestamp, value) tuple
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("RingHistory index out of range")
+        slot = (self.head - self.size + index) % self.capacity
+        return float(self.ts[slot]), bool(self.val[slot])
+
+    def __iter__(self) -> Iterator[Tuple[float, bool]]:
+        """Iterate over the entries from oldest to newest."""
+        ts, val = self.arrays()
+        return zip(ts.tolist(), val.tolist())
+
+    def __reversed__(self) -> Iterator[Tuple[float, bool]]:
+        """Iterate over the entries from newest to oldest."""
+        ts, val = self.arrays()
+        return zip(ts[::-1].tolist(), val[::-1].tolist())
+
+
+def _last_rising_edge(history: Sequence[Tuple[float, bool]]) -> Optional[float]:
+    """
+    Find the most recent False -> True transition in a history.
+
+    Args:
+        history: Chronological (timestamp, value) entries
+
+    Returns:
+        The timestamp of the transition, or None if there is none
+    """
+    if isinstance(history, RingHistory):
+        return history.last_rising_edge()
+
+    for i in range(len(history) - 1, 0, -1):
+        if history[i][1] and not history[i - 1][1]:
+            return history[i][0]
+    return None
+
+
 class SequencePattern:
     """
     A pattern that evaluates whether a sequence of conditions has occurred in order
@@ -106,6 +379,56 @@ class SequencePattern:
         self._last_matched_indices: Dict[int, float] = (
             {}
         )  # Maps condition index to timestamp of last match
+        # State for event-driven matching with advance(): the index of the
+        # next condition to match, when the current partial match started,
+        # and each condition's value at the previous call
+        self._step = 0
+        self._started = 0.0
+        self._previous: List[bool] = [False] * len(conditions)
+        # Threshold conditions such as ``lambda: door.read() > 0.5`` are
+        # evaluated together, reading each sensor once per call
+        self._batch: Optional[ThresholdBatch] = None
+        if all(getattr(c, "_threshold", None) is not None for c in conditions):
+            self._batch = ThresholdBatch(conditions)
+
+    def advance(self, now: float) -> bool:
+        """
+        Advance the match by one event, without keeping condition histories.
+
+        Call this whenever something the conditions depend on has changed.
+        Each call evaluates the conditions once; a condition that turned true
+        since the previous call moves the match forward if it is the next one
+        expected, and a new rising edge of the first condition restarts it.
+        Call it once before the first event to record the initial values.
+
+        Args:
+            now: Current timestamp in seconds
+
+        Returns:
+            True if this event completed the sequence within within_s seconds
+        """
+        if self._batch is not None:
+            values = self._batch.evaluate(now).tolist()
+        else:
+            values = [bool(condition()) for condition in self.conditions]
+        rising = [
+            value and not previous for value, previous in zip(values, self._previous)
+        ]
+        self._previous = values
+
+        # A partial match that has run out of time is abandoned
+        if self._step and now - self._started > self.within_s:
+            self._step = 0
+
+        if self._step and rising[self._step]:
+            self._step += 1
+        elif rising[0]:
+            self._step, self._started = 1, now
+
+        if self._step == len(self.conditions):
+            self._step = 0
+            return True
+        return False
 
     def evaluate(self, now: float, histories: List[Deque[Tuple[float, bool]]]) -> bool:
         """
@@ -125,50 +448,30 @@ class SequencePattern:
         earliest_allowed_time = now - self.within_s
         matched_indices = {}  # Temporary storage for matched timestamps
 
-        # Look for pattern start (first condition) first
-        first_condition_history = histories[0]
-        first_match_time = None
-
-        # Search backwards through history for the most recent transition to true for the first condition
-        for i in range(len(first_condition_history) - 1, 0, -1):
-            current = first_condition_history[i]
-            previous = first_condition_history[i - 1]
-
-            # Found a transition to true (previous=False, current=True)
-            if current[1] and not previous[1]:
-                # If this transition occurred within our time window
-                if current[0] >= earliest_allowed_time:
-                    first_match_time = current[0]
-                    matched_indices[0] = first_match_time
-                    break
+        # Look for pattern start (first condition) first: its most recent
+        # transition to true must lie within our time window
+        first_match_time = _last_rising_edge(histories[0])
 
         # If we didn't find the first condition, the sequence can't match
-        if first_match_time is None:
+        if first_match_time is None or first_match_time < earliest_allowed_time:
             return False
+        matched_indices[0] = first_match_time
 
         # Now check the rest of the conditions in order
         last_match_time = first_match_time
 
         for i in range(1, len(self.conditions)):
-            condition_history = histories[i]
-            match_found = False
-
-            # Search for transitions to true that occurred after the previous match
-            for j in range(len(condition_history) - 1, 0, -1):
-                current = condition_history[j]
-                previous = condition_history[j - 1]
-
-                # Found a transition to true that happened after the previous condition matched
-                if current[1] and not previous[1] and current[0] > last_match_time:
-                    matched_indices[i] = current[0]
-                    last_match_time = current[0]
-                    match_found = True
-                    break
+            # The most recent transition to true must come after the previous
+            # condition matched; earlier transitions are older still
+            match_time = _last_rising_edge(histories[i])
 
             # If any condition in the sequence didn't match, the whole sequence fails
-            if not match_found:
+            if match_time is None or match_time <= last_match_time:
                 return False
 
+            matched_indices[i] = match_time
+            last_match_time = match_time
+
         # If we made it here, we found matches for all conditions in sequence
         # Final check: is the entire sequence within our time window?
         total_sequence_time = last_match_time - first_match_time
@@ -200,16 +503,21 @@ def within(seconds: float, cond: Condition) -> Condition:
     """
     window = TemporalWindow(seconds, cond)
 
-    # The runtime will inject now and history when evaluating this condition
+    # Given the base condition's history the window is checked against it;
+    # without history (as in the runtime) the window tracks the base itself
     def temporal_condition(now=None, history=None):
         if now is None:
             now = time.time()
         if history is None:
-            return False
+            return window.update(now)
 
         return window.evaluate(now, history)
 
-    return Condition(temporal_condition)
+    condition = Condition(temporal_condition)
+    # The runtime keeps histories of each condition's own output, which is not
+    # what the window needs, so it passes this condition only now
+    condition._stateful = True
+    return condition
 
 
 def sequence(*conditions: Condition, within_s: float) -> Condition:
@@ -239,13 +547,17 @@ def sequence(*conditions: Condition, within_s: float) -> Condition:
 
     pattern = SequencePattern(list(conditions), within_s)
 
-    # The runtime will inject now and all condition histories
+    # Given all condition histories the whole sequence is matched against
+    # them; without histories the pattern advances one evaluation at a time
     def sequence_condition(now=None, histories=None):
         if now is None:
             now = time.time()
         if histories is None:
-            return False
+            return pattern.advance(now)
 
         return pattern.evaluate(now, histories)
 
-    return Condition(sequence_condition)
+    condition = Condition(sequence_condition)
+    # Advanced one evaluation at a time by the runtime, see within()
+    condition._stateful = True
+    return condition
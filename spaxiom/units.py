@@ -2,20 +2,102 @@
 Units module for handling physical quantities in Spaxiom DSL.
 """
 
-from typing import Any, Union
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+import math
 import pint
 
 # Create a global unit registry
 ureg = pint.UnitRegistry()
 
 
-def Quantity(value: Union[int, float], unit_str: str) -> Any:
+@lru_cache(maxsize=256)
+def resolve_unit(unit_str: str) -> Any:
+    """
+    Parse a unit string into a Pint Unit, caching the result.
+
+    Sensors are typically read in the same few units over and over, so parsing
+    each unit string once saves the registry lookup on every read.
+
+    Args:
+        unit_str: String representation of the unit (e.g., 'm', 'degC')
+
+    Returns:
+        The Pint Unit object for the string
+
+    Raises:
+        pint.UndefinedUnitError: If the unit is not defined in the registry
+    """
+    return ureg.Unit(unit_str)
+
+
+@lru_cache(maxsize=256)
+def resolve_conversion(
+    source: Union[str, Any], target: Union[str, Any]
+) -> Tuple[Optional[float], float, Any]:
+    """
+    Work out how to convert values from one unit to another, caching the result.
+
+    Linear conversions (including offset units such as degC -> degF) reduce to
+    ``value * scale + offset``, so once resolved a conversion costs one multiply
+    and add instead of a pass through Pint's unit graph.
+
+    Args:
+        source: The unit to convert from, as a string or Pint Unit
+        target: The unit to convert to, as a string or Pint Unit
+
+    Returns:
+        Tuple of (scale, offset, target unit); scale is None when the
+        conversion is not linear
+
+    Raises:
+        pint.DimensionalityError: If the units are not compatible
+    """
+    if isinstance(source, str):
+        source = resolve_unit(source)
+    if isinstance(target, str):
+        target = resolve_unit(target)
+    if source == target:
+        return 1.0, 0.0, target
+
+    offset = ureg.Quantity(0.0, source).to(target).magnitude
+    scale = ureg.Quantity(1.0, source).to(target).magnitude - offset
+
+    # Confirm the conversion is linear before relying on it
+    probe = ureg.Quantity(100.0, source).to(target).magnitude
+    if not math.isclose(probe, 100.0 * scale + offset, rel_tol=1e-9, abs_tol=1e-9):
+        return None, 0.0, target
+    return scale, offset, target
+
+
+def convert(quantity: Any, unit: Union[str, Any]) -> Any:
+    """
+    Convert a Quantity to another unit using a cached conversion factor.
+
+    Equivalent to ``quantity.to(unit)``, but the conversion is resolved once
+    per pair of units (see resolve_conversion) rather than on every call.
+
+    Args:
+        quantity: The Pint Quantity to convert
+        unit: The unit to convert to, as a string or Pint Unit
+
+    Returns:
+        A new Quantity in the requested unit
+    """
+    scale, offset, target = resolve_conversion(quantity.units, unit)
+    if scale is None:
+        return quantity.to(target)
+    return ureg.Quantity(quantity.magnitude * scale + offset, target)
+
+
+def Quantity(value: Union[int, float], unit_str: Union[str, Any]) -> Any:
     """
     Create a Pint Quantity with the given value and unit.
 
     Args:
         value: Numeric value
-        unit_str: String representation of the unit (e.g., 'm', 'kg', 's')
+        unit_str: String representation of the unit (e.g., 'm', 'kg', 's'),
+                  or a Pint Unit
 
     Returns:
         Pint Quantity object that combines the value and unit
@@ -28,6 +110,8 @@ def Quantity(value: Union[int, float], unit_str: str) -> Any:
         ```
     """
     # Always use Quantity constructor for all units to handle offset units properly
+    if isinstance(unit_str, str):
+        unit_str = resolve_unit(unit_str)
     return ureg.Quantity(value, unit_str)
 
 
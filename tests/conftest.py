@@ -0,0 +1,17 @@
+"""
+Shared fixtures for the Spaxiom tests.
+"""
+
+import pytest
+
+from spaxiom.core import SensorRegistry, reset_tick
+
+
+@pytest.fixture
+def clean_sensor_registry():
+    """Clear the sensor registry and end any tick before and after each test."""
+    SensorRegistry().clear()
+    reset_tick()
+    yield
+    SensorRegistry().clear()
+    reset_tick()
@@ -194,6 +194,29 @@ class TestCLI(unittest.TestCase):
         # Verify that start_blocking was not called (since we had a main function)
         mock_start_blocking.assert_not_called()
 
+    @patch("spaxiom.cli.importlib.util.spec_from_file_location")
+    @patch("spaxiom.cli.importlib.util.module_from_spec")
+    @patch("spaxiom.cli.start_blocking")
+    @patch("spaxiom.cli.load_sensors_from_yaml", return_value=[])
+    def test_run_config_cache_is_opt_in(self, mock_load, *mocks):
+        """Test that the JSON config cache is only used when requested."""
+        script_path = os.path.join(self.temp_path, "test_config_run.py")
+        config_path = os.path.join(self.temp_path, "sensors.yaml")
+        for path in (script_path, config_path):
+            with open(path, "w") as f:
+                f.write("\n")
+
+        result = self.runner.invoke(cli, ["run", script_path, "--config", config_path])
+        self.assertEqual(result.exit_code, 0)
+        mock_load.assert_called_once_with(config_path, json_cache=False)
+
+        mock_load.reset_mock()
+        result = self.runner.invoke(
+            cli, ["run", script_path, "--config", config_path, "--config-cache"]
+        )
+        self.assertEqual(result.exit_code, 0)
+        mock_load.assert_called_once_with(config_path, json_cache=True)
+
 
 if __name__ == "__main__":
     unittest.main()
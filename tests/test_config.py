@@ -2,6 +2,7 @@
 Tests for the Spaxiom configuration module.
 """
 
+import json
 import os
 import pytest
 import yaml
@@ -13,6 +14,7 @@ from spaxiom import (
     load_sensors_from_yaml,
     SensorRegistry,
 )
+from spaxiom.config import _yaml_cache, clear_yaml_cache, load_yaml_cached
 
 
 class TestConfig:
@@ -58,6 +60,60 @@ class TestConfig:
         with pytest.raises(FileNotFoundError):
             load_yaml("non_existent_file.yaml")
 
+    def test_load_yaml_cache(self):
+        """Test that load_yaml reuses parsed files until they change."""
+        clear_yaml_cache()
+        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
+            tmp.write("value: 1\n")
+            tmp_path = tmp.name
+
+        try:
+            first = load_yaml(tmp_path)
+            assert first == {"value": 1}
+            assert os.path.abspath(tmp_path) in _yaml_cache
+
+            # Callers get independent copies of the cached configuration
+            first["value"] = 99
+            assert load_yaml(tmp_path) == {"value": 1}
+
+            # A change in the file's size or mtime invalidates the entry
+            with open(tmp_path, "w") as f:
+                f.write("value: 22\n")
+            assert load_yaml(tmp_path) == {"value": 22}
+        finally:
+            clear_yaml_cache()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def test_load_yaml_cached_sidecar(self):
+        """Test that load_yaml_cached writes and reuses a JSON sidecar."""
+        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
+            tmp.write("sensors:\n  - name: a\n    type: random\n")
+            tmp_path = tmp.name
+        sidecar = tmp_path + ".cache.json"
+
+        try:
+            config = load_yaml_cached(tmp_path)
+            assert config == {"sensors": [{"name": "a", "type": "random"}]}
+            assert os.path.exists(sidecar)
+
+            # The sidecar is used while the YAML file is unchanged
+            with open(sidecar) as f:
+                cached = json.load(f)
+            cached["config"]["from_sidecar"] = True
+            with open(sidecar, "w") as f:
+                json.dump(cached, f)
+            assert load_yaml_cached(tmp_path)["from_sidecar"] is True
+
+            # Changing the YAML file invalidates the sidecar
+            with open(tmp_path, "w") as f:
+                f.write("sensors: []\n")
+            assert load_yaml_cached(tmp_path) == {"sensors": []}
+        finally:
+            for path in (tmp_path, sidecar):
+                if os.path.exists(path):
+                    os.remove(path)
+
     def test_load_yaml_invalid_yaml(self):
         """Test load_yaml with invalid YAML content."""
         # Create a temporary file with invalid YAML
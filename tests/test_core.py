@@ -0,0 +1,49 @@
+"""
+Tests for the per-tick read cache in the core module.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from spaxiom.core import Sensor, advance_tick, reset_tick
+from spaxiom.logic import Condition
+
+
+@pytest.mark.usefixtures("clean_sensor_registry")
+class TestTickCache(unittest.TestCase):
+    """Test per-tick caching of sensor reads and condition results."""
+
+    def test_sensor_reads_once_per_tick(self):
+        """Test that a sensor samples its hardware once per tick."""
+        sensor = Sensor(name="counter", sensor_type="test", location=(0, 0, 0))
+        sensor._read_raw = MagicMock(side_effect=range(100))
+
+        # Without ticks every read samples the sensor
+        self.assertEqual([0, 1], [sensor.read(), sensor.read()])
+
+        advance_tick()
+        self.assertEqual([2, 2], [sensor.read(), sensor.read()])
+        advance_tick()
+        self.assertEqual(3, sensor.read())
+        self.assertEqual(3, sensor.read(unit="m").magnitude)
+
+        reset_tick()
+        self.assertEqual(4, sensor.read())
+
+    def test_condition_evaluates_once_per_tick(self):
+        """Test that a condition calls its function once per tick."""
+        fn = MagicMock(side_effect=[True, False])
+        condition = Condition(lambda: fn())
+
+        advance_tick()
+        self.assertTrue(condition())
+        self.assertTrue(condition())
+        advance_tick()
+        self.assertFalse(condition())
+        self.assertEqual(2, fn.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
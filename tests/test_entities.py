@@ -78,6 +78,12 @@ def test_entity_set_add_remove(clean_registry):
     with pytest.raises(KeyError):
         entity_set.remove(entity)
 
+    # Discarding a non-existent entity is a no-op
+    entity_set.add(entity)
+    entity_set.discard(entity)
+    entity_set.discard(entity)
+    assert len(entity_set) == 0
+
 
 def test_entity_set_iteration(clean_registry):
     """Test iterating over entities in an EntitySet."""
@@ -4,9 +4,12 @@ Unit tests for the FileSensor class.
 
 import os
 import csv
+import importlib.util
 import unittest
 import tempfile
-from spaxiom import FileSensor
+from unittest.mock import patch
+
+from spaxiom import FileSensor, MultiColumnFileSensor
 
 
 class TestFileSensor(unittest.TestCase):
@@ -74,6 +77,24 @@ class TestFileSensor(unittest.TestCase):
         value_f = value.to("degF")
         self.assertAlmostEqual(value_f.magnitude, 72.5, places=1)
 
+    def test_unit_conversion(self):
+        """Test reading in a unit other than the sensor's own unit."""
+        sensor = FileSensor(
+            name="conversion_sensor",
+            file_path=self.csv_path,
+            column_name="temperature",
+            unit="degC",
+        )
+
+        value_f = sensor.read(unit="degF")
+        self.assertAlmostEqual(72.5, value_f.magnitude, places=9)
+        self.assertEqual("degree_Fahrenheit", str(value_f.units))
+
+        value_k = sensor.read(unit="K")
+        self.assertAlmostEqual(296.15, value_k.magnitude, places=9)
+
+        self.assertAlmostEqual(23.5, sensor.read(unit="degC").magnitude)
+
     def test_looping(self):
         """Test looping behavior."""
         sensor = FileSensor(
@@ -221,6 +242,105 @@ class TestFileSensor(unittest.TestCase):
         self.assertIn("file='test_data.csv'", repr_str)
         self.assertIn("column='temperature'", repr_str)
 
+    def test_stream_mode(self):
+        """Test that stream mode reads the same values as the default mode."""
+        sensor = FileSensor(
+            name="stream_sensor",
+            file_path=self.csv_path,
+            column_name="temperature",
+            loop=True,
+            stream=True,
+        )
+
+        self.assertEqual([], sensor.data)
+        values = [sensor.read() for _ in range(6)]
+        # The invalid row is skipped and reading loops back to the start
+        self.assertEqual([22.5, 23.0, 23.5, 24.0, 25.0, 22.5], values)
+        self.assertIn("row=1/6", repr(sensor))
+
+        sensor.reset()
+        self.assertEqual(22.5, sensor.read())
+
+        # Closing releases the mapped file; later reads find no rows
+        mapped = sensor._buffer
+        sensor.close()
+        self.assertTrue(mapped.closed)
+        self.assertIsNone(sensor.read())
+        sensor.close()
+
+        with FileSensor(
+            name="stream_context",
+            file_path=self.csv_path,
+            column_name="temperature",
+            stream=True,
+        ) as scoped:
+            self.assertEqual(22.5, scoped.read())
+        self.assertIsNone(scoped.read())
+
+        with self.assertRaises(ValueError):
+            FileSensor(
+                name="stream_missing_column",
+                file_path=self.csv_path,
+                column_name="pressure",
+                stream=True,
+            )
+
+    def test_multi_column(self):
+        """Test reading several columns of one file through column sensors."""
+        source = MultiColumnFileSensor(
+            file_path=self.csv_path,
+            columns=["temperature", "humidity"],
+            names=["multi_temperature", "multi_humidity"],
+            units={"temperature": "degC"},
+        )
+        temp, humidity = source.views()
+
+        self.assertIsInstance(temp, FileSensor)
+        self.assertEqual("multi_temperature", temp.name)
+        self.assertIs(humidity, source["humidity"])
+
+        # Each column skips its own invalid rows and keeps its own cursor
+        self.assertEqual([22.5, 23.0, 23.5, 24.0, 25.0], temp.data)
+        self.assertEqual([45.0, 45.5, 46.0, 46.5, 47.0, 47.5], humidity.data)
+        self.assertEqual(22.5, temp.read())
+        self.assertEqual(23.0, temp.read())
+        self.assertEqual(45.0, humidity.read())
+        self.assertAlmostEqual(74.3, temp.read(unit="degF").magnitude)
+
+        source.reset()
+        self.assertEqual(22.5, temp.read())
+        self.assertEqual(45.0, humidity.read())
+
+        with self.assertRaises(ValueError):
+            MultiColumnFileSensor(self.csv_path, ["temperature", "pressure"])
+        with self.assertRaises(ValueError):
+            MultiColumnFileSensor(self.csv_path, ["temperature"], names=["a", "b"])
+
+    @unittest.skipIf(importlib.util.find_spec("pandas") is None, "pandas not installed")
+    def test_pandas_loading(self):
+        """Test that the pandas fast path loads the same data as the csv path."""
+        clean_path = os.path.join(self.test_dir.name, "clean_data.csv")
+        with open(clean_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["timestamp", "temperature"])
+            for i in range(5):
+                writer.writerow([f"2023-01-01 00:0{i}:00", str(20.0 + i / 3)])
+
+        with patch("spaxiom.adaptors.file_sensor.PANDAS_MIN_FILE_SIZE", 0):
+            sensor = FileSensor(
+                name="pandas_sensor", file_path=clean_path, column_name="temperature"
+            )
+            # Invalid rows fall back to the csv path, which skips them
+            fallback = FileSensor(
+                name="pandas_fallback_sensor",
+                file_path=self.csv_path,
+                column_name="temperature",
+            )
+
+        self.assertEqual([20.0 + i / 3 for i in range(5)], sensor.data)
+        self.assertEqual(1, sensor.column_index)
+        self.assertEqual([22.5, 23.0, 23.5, 24.0, 25.0], fallback.data)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,9 +2,13 @@
 Tests for the fusion module in Spaxiom DSL.
 """
 
+import importlib.util
 import pytest
 import uuid
+import numpy as np
+from spaxiom.core import SensorRegistry
 from spaxiom.fusion import weighted_average, WeightedFusion
+from spaxiom.sim.vec_sim import SimSensor, SimVector
 from spaxiom.sensor import Sensor
 
 
@@ -192,6 +196,90 @@ class TestWeightedFusion:
         with pytest.raises(ValueError):
             WeightedFusion(unique_fusion_name(), sensors, weights)
 
+    def test_error_on_zero_weight_sum_read(self):
+        """Test that reading a fusion whose weights sum to zero raises ValueError."""
+        sensors = [MockSensor("s1", 10.0), MockSensor("s2", 20.0)]
+        fusion = WeightedFusion(unique_fusion_name(), sensors, [1.0, -1.0])
+
+        with pytest.raises(ValueError):
+            fusion.read()
+
+    def test_error_on_non_numeric_reading(self):
+        """Test that a non-numeric component reading raises ValueError."""
+        sensors = [MockSensor("s1", 10.0), MockSensor("s2", "open")]
+        fusion = WeightedFusion(unique_fusion_name(), sensors, [1.0, 1.0])
+
+        with pytest.raises(ValueError):
+            fusion.read()
+
+    def test_numpy_fallback_matches_kernel(self):
+        """Test that reads without numba match the compiled kernel."""
+        sensors = [MockSensor(f"s{i}", float(i) * 1.5 - 4.0) for i in range(50)]
+        weights = [float(i % 7) + 0.5 for i in range(50)]
+        fusion = WeightedFusion(unique_fusion_name(), sensors, weights)
+        compiled = fusion.read()
+
+        fusion._weighted_sum = None
+        assert fusion.read() == pytest.approx(compiled)
+        assert compiled == pytest.approx(
+            weighted_average([s.value for s in sensors], weights)
+        )
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("numba") is None, reason="numba not installed"
+    )
+    def test_uses_compiled_kernel(self):
+        """Test that the fused reading comes from the numba kernel when available."""
+        sensors = [MockSensor("s1", 10.0), MockSensor("s2", 20.0)]
+        fusion = WeightedFusion(unique_fusion_name(), sensors, [1.0, 3.0])
+
+        assert fusion._weighted_sum is not None
+        assert fusion.read() == pytest.approx(17.5)
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    def test_sim_vector_readings_gathered(self, dtype):
+        """Test that SimVector sensors are gathered from their shared array."""
+        prefix = f"gather_{uuid.uuid4().hex[:6]}"
+        sim_vec = SimVector(n=6, hz=10.0, name_prefix=prefix, dtype=dtype)
+        try:
+            sim_vec.read_all(1.3, out=sim_vec._values)
+            sensors = [sim_vec[4], sim_vec[0], sim_vec[2]]
+            weights = [1.0, 2.0, 3.0]
+            fusion = WeightedFusion(unique_fusion_name(), sensors, weights)
+
+            assert np.shares_memory(fusion._shared_values, sim_vec._values)
+            assert not fusion._shared_values.flags.writeable
+            expected = weighted_average([s.read() for s in sensors], weights)
+            assert fusion.read() == pytest.approx(expected, rel=1e-6)
+
+            # The view follows later updates of the vector
+            sim_vec._values[:] = sim_vec.read_all(2.1)
+            expected = weighted_average([s.read() for s in sensors], weights)
+            assert fusion.read() == pytest.approx(expected, rel=1e-6)
+
+            # Mixing in a sensor with its own storage falls back to reading each
+            mixed = WeightedFusion(
+                unique_fusion_name(), [sim_vec[1], MockSensor("s", 2.0)], [1.0, 1.0]
+            )
+            assert mixed._shared_values is None
+            assert mixed.read() == pytest.approx((sim_vec[1].read() + 2.0) / 2)
+
+            # Subclasses may override read(), so they are read one by one
+            class OffsetSimSensor(SimSensor):
+                def _read_raw(self):
+                    return super()._read_raw() + 10.0
+
+            sim_vec[3].__class__ = OffsetSimSensor
+            subclassed = WeightedFusion(
+                unique_fusion_name(), [sim_vec[3], sim_vec[5]], [1.0, 1.0]
+            )
+            assert subclassed._shared_values is None
+            assert subclassed.read() == pytest.approx(
+                (sim_vec[3].read() + sim_vec[5].read()) / 2
+            )
+        finally:
+            SensorRegistry().clear()
+
     def test_repr(self):
         """Test string representation of fusion sensor."""
         sensors = [
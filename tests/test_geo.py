@@ -3,7 +3,11 @@ Unit tests for the geometry module.
 """
 
 import unittest
-from spaxiom import Zone, intersection, union
+
+import numpy as np
+
+from spaxiom import Zone, ZoneIndex, intersection, union, intersect_many
+from spaxiom.geo import zones_to_array
 
 
 class TestGeometry(unittest.TestCase):
@@ -96,6 +100,51 @@ class TestGeometry(unittest.TestCase):
         result = z3 & z4
         self.assertIsNone(result)
 
+    def test_intersect_many(self):
+        """Test batched intersections against the scalar intersection()."""
+        a = [Zone(0, 0, 10, 10), Zone(0, 0, 5, 5), Zone(0, 0, 20, 20)]
+        b = [Zone(5, 5, 15, 15), Zone(10, 10, 15, 15), Zone(5, 5, 15, 15)]
+
+        corners, valid = intersect_many(a, b)
+        self.assertEqual([True, False, True], valid.tolist())
+        for row, ok, z1, z2 in zip(corners, valid, a, b):
+            if ok:
+                expected = intersection(z1, z2)
+                self.assertEqual(
+                    [expected.x1, expected.y1, expected.x2, expected.y2], row.tolist()
+                )
+            else:
+                self.assertIsNone(intersection(z1, z2))
+
+        # A single zone is broadcast against an array of zones
+        corners, valid = intersect_many(zones_to_array(a), np.array([4, 4, 6, 6]))
+        self.assertEqual([True, True, True], valid.tolist())
+        self.assertEqual([4, 4, 5, 5], corners[1].tolist())
+
+        # Integer grid zones stay integers
+        grid_a = np.array([[0, 0, 10, 10], [0, 0, 5, 5]], dtype=np.int32)
+        grid_b = np.array([[5, 5, 15, 15], [6, 6, 8, 8]], dtype=np.int32)
+        corners, valid = intersect_many(grid_a, grid_b)
+        self.assertEqual(np.int32, corners.dtype)
+        self.assertEqual([True, False], valid.tolist())
+        self.assertEqual([5, 5, 10, 10], corners[0].tolist())
+
+    def test_zone_index(self):
+        """Test that ZoneIndex lookups match a linear scan."""
+        zones = [
+            Zone(x, y, x + 3, y + 3) for x in range(0, 40, 4) for y in range(0, 40, 4)
+        ]
+        index = ZoneIndex(zones)
+        self.assertEqual(len(zones), len(index))
+
+        for query in (Zone(0, 0, 5, 5), Zone(3, 3, 4, 4), Zone(100, 100, 101, 101)):
+            expected = [z for z in zones if intersection(z, query) is not None]
+            self.assertEqual(expected, index.query(query))
+
+        for point in ((1.0, 1.0), (3.0, 3.0), (3.5, 3.5)):
+            expected = [z for z in zones if z.contains(point)]
+            self.assertEqual(expected, index.containing(point))
+
 
 if __name__ == "__main__":
     unittest.main()
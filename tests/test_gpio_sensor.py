@@ -179,6 +179,49 @@ class TestGPIODigitalSensor:
         assert sensor._read_raw() is False
         assert sensor.is_active() is False
 
+    def test_wait_for_edge(self):
+        """Test blocking until the GPIO pin changes state."""
+        from spaxiom.adaptors.gpio_sensor import GPIODigitalSensor
+
+        sensor = GPIODigitalSensor(name="edge_sensor", pin=17)
+        device = sensor._input_device
+
+        # No edge yet, so the wait times out
+        assert sensor.wait_for_edge(timeout=0) is False
+
+        # gpiozero calls these from its edge-detection thread
+        device.value = 1
+        device.when_activated()
+        assert sensor.wait_for_edge(timeout=0) is True
+        assert sensor.wait_for_edge(timeout=0) is False
+
+        device.value = 0
+        device.when_deactivated()
+        assert sensor.wait_for_edge(timeout=0) is True
+
+    def test_on_edge(self):
+        """Test that edge callbacks receive the new state."""
+        from spaxiom.adaptors.gpio_sensor import GPIODigitalSensor
+
+        sensor = GPIODigitalSensor(name="on_edge_sensor", pin=17)
+        device = sensor._input_device
+        states = []
+
+        @sensor.on_edge
+        def record(active):
+            states.append(active)
+
+        assert record is not None
+        device.when_activated()
+        device.when_deactivated()
+        assert states == [True, False]
+
+        # Repeated reports of the same state are not edges
+        device.when_deactivated()
+        assert states == [True, False]
+        assert sensor.wait_for_edge(timeout=0) is True
+        assert sensor.wait_for_edge(timeout=0) is False
+
     def test_cleanup(self):
         """Test resource cleanup when the object is deleted."""
         from spaxiom.adaptors.gpio_sensor import GPIODigitalSensor
@@ -3,7 +3,26 @@ Tests for the Condition module logical operations.
 """
 
 import time
-from spaxiom.logic import Condition, transitioned_to_true
+
+import pytest
+
+from spaxiom.core import SensorRegistry
+from spaxiom.events import (
+    EVENT_HANDLERS,
+    SCHEDULED,
+    cancel,
+    on,
+    process_events,
+    schedule,
+    time_until_scheduled,
+)
+from spaxiom.logic import (
+    Condition,
+    ThresholdBatch,
+    ThresholdCondition,
+    transitioned_to_true,
+)
+from spaxiom.sensor import RandomSensor
 
 
 def test_condition_basic():
@@ -253,3 +272,239 @@ def test_transitioned_to_true():
     # It shouldn't register as a transition anymore
     assert test_condition.transitioned_to_true(t3) is False
     assert transitioned_to_true(test_condition, t3) is False
+
+
+class _FixedSensor(RandomSensor):
+    """Random sensor whose reading can be set directly."""
+
+    value = 0.0
+
+    def _read_raw(self):
+        return self.value
+
+
+def test_threshold_condition():
+    """Test that ThresholdCondition compares the sensor reading."""
+    SensorRegistry().clear()
+    sensor = _FixedSensor(name="threshold_test", location=(0, 0, 0))
+
+    high = ThresholdCondition(sensor, ">", 800)
+    sensor.value = 500.0
+    assert high() is False
+    sensor.value = 900.0
+    assert high() is True
+    assert "threshold_test > 800" in repr(high)
+
+    with pytest.raises(ValueError):
+        ThresholdCondition(sensor, "=>", 800)
+
+    SensorRegistry().clear()
+
+
+def test_threshold_batch_matches_scalar():
+    """Test that batched evaluation agrees with evaluating each condition."""
+    SensorRegistry().clear()
+    a = _FixedSensor(name="batch_a", location=(0, 0, 0))
+    b = _FixedSensor(name="batch_b", location=(1, 0, 0))
+    a.value, b.value = 10.0, 20.0
+
+    conditions = [
+        ThresholdCondition(a, op, value)
+        for op in (">", ">=", "<", "<=", "==", "!=")
+        for value in (5.0, 10.0, 15.0)
+    ] + [ThresholdCondition(b, ">", 15.0), ThresholdCondition(b, "<", 15.0)]
+    batch = ThresholdBatch(conditions)
+
+    assert len(batch.sensors) == 2
+    results = batch.evaluate(now=1.0)
+    assert results.tolist() == [condition.fn() for condition in conditions]
+    # Timestamp bookkeeping is updated as by Condition.evaluate
+    for condition, result in zip(conditions, results.tolist()):
+        assert condition.last_value is result
+        if result:
+            assert condition.last_changed == 1.0
+
+    SensorRegistry().clear()
+
+
+def test_threshold_batch_missing_reading():
+    """Test that a missing reading never satisfies a threshold."""
+    SensorRegistry().clear()
+    sensor = _FixedSensor(name="batch_none", location=(0, 0, 0))
+    sensor.value = None
+
+    conditions = [ThresholdCondition(sensor, "!=", 1.0)]
+    assert ThresholdBatch(conditions).evaluate().tolist() == [False]
+    assert conditions[0]() is False
+
+    SensorRegistry().clear()
+
+
+def test_plain_lambdas_are_not_batched():
+    """Test that only ThresholdConditions take part in threshold batching."""
+    SensorRegistry().clear()
+    sensor = _FixedSensor(name="lambda_threshold", location=(0, 0, 0))
+
+    try:
+        plain = Condition(lambda: sensor.read() >= 0.5)
+        explicit = ThresholdCondition(sensor, ">=", 0.5)
+        assert plain._threshold is None
+        assert (explicit & plain)._threshold is None
+
+        batch = ThresholdBatch.from_conditions([plain, explicit, explicit])
+        assert batch.conditions == [explicit]
+        sensor.value = 3.0
+        assert batch.evaluate().tolist() == [True]
+        assert explicit.last_value is True
+    finally:
+        SensorRegistry().clear()
+
+
+def test_process_events_with_thresholds():
+    """Test that process_events batches threshold conditions with the rest."""
+    SensorRegistry().clear()
+    EVENT_HANDLERS.clear()
+    sensor = _FixedSensor(name="events_threshold", location=(0, 0, 0))
+    fired = []
+
+    try:
+        high = ThresholdCondition(sensor, ">", 10.0)
+        on(high)(lambda: fired.append("high"))
+        on(high)(lambda: fired.append("high again"))
+        on(Condition(lambda: sensor.read() < 0))(lambda: fired.append("negative"))
+
+        sensor.value = 5.0
+        process_events()
+        assert fired == []
+
+        sensor.value = 20.0
+        process_events()
+        assert fired == ["high", "high again"]
+
+        sensor.value = -1.0
+        process_events()
+        assert fired == ["high", "high again", "negative"]
+    finally:
+        EVENT_HANDLERS.clear()
+        SensorRegistry().clear()
+
+
+def test_compile_fuses_combined_conditions():
+    """Test that compile() fuses a condition tree without changing its result."""
+    SensorRegistry().clear()
+    a = _FixedSensor(name="fused_a", location=(0, 0, 0))
+    b = _FixedSensor(name="fused_b", location=(1, 0, 0))
+    toggled = {"value": False}
+
+    a_high = Condition(lambda: a.read() > 0.5)
+    b_high = Condition(lambda: b.read() > 0.5)
+    other = Condition(lambda: toggled["value"])
+    tree = (a_high & ~b_high) | other
+    fused = ((a_high & ~b_high) | other).compile()
+
+    assert fused.fn.__name__ == "fused_condition"
+    assert fused.compile() is fused
+    assert a_high.compile() is a_high
+    # The tree itself is not modified
+    assert tree.fn.__name__ == "combined_condition"
+
+    for a.value in (0.0, 1.0):
+        for b.value in (0.0, 1.0):
+            for toggled["value"] in (False, True):
+                assert fused() is tree()
+
+    # Leaf conditions still record their own state in the fused path
+    a.value = 1.0
+    b.value = 0.0
+    a_high.last_value = b_high.last_value = True
+    b_high.last_changed = 0.0
+    fused()
+    assert a_high.last_value is True
+    assert b_high.last_value is False
+    assert b_high.last_changed > 0.0
+
+    # on() registers a fused copy and leaves the caller's condition alone
+    EVENT_HANDLERS.clear()
+    on(tree)(lambda: None)
+    registered, _ = EVENT_HANDLERS[0]
+    assert registered is not tree
+    assert registered.fn.__name__ == "fused_condition"
+    assert tree.fn.__name__ == "combined_condition"
+    EVENT_HANDLERS.clear()
+
+    # Reads are short-circuited like the tree walk
+    reads = []
+    b._read_raw = lambda: reads.append("b") or 0.0
+    a.value = 0.0
+    fused()
+    assert reads == []
+
+    SensorRegistry().clear()
+
+
+def test_schedule_runs_from_process_events(monkeypatch):
+    """Test that scheduled calls run once their delay has passed."""
+    EVENT_HANDLERS.clear()
+    SCHEDULED.clear()
+    clock = {"now": 100.0}
+    monkeypatch.setattr(time, "monotonic", lambda: clock["now"])
+    calls = []
+
+    try:
+        schedule(3.0, lambda: calls.append("late"))
+        schedule(1.0, lambda: calls.append("early"))
+        cancelled = schedule(2.0, lambda: calls.append("cancelled"))
+        cancel(cancelled)
+        assert time_until_scheduled() == 1.0
+
+        process_events()
+        assert calls == []
+
+        clock["now"] = 102.5
+        process_events()
+        assert calls == ["early"]
+        assert time_until_scheduled() == 0.5
+
+        clock["now"] = 103.0
+        process_events()
+        assert calls == ["early", "late"]
+        assert time_until_scheduled() is None
+    finally:
+        SCHEDULED.clear()
+
+
+def test_condition_group_shares_reading():
+    """Test that grouped conditions share one read per round of evaluations."""
+    SensorRegistry().clear()
+    sensor = _FixedSensor(name="grouped", location=(0, 0, 0))
+    reads = []
+    sensor._read_raw = lambda: reads.append(sensor.value) or sensor.value
+
+    positive, negative = Condition.group(
+        [lambda value: value > 0, lambda value: value < 0], source=sensor.read
+    )
+
+    sensor.value = 1.0
+    assert positive() is True
+    assert negative() is False
+    assert len(reads) == 1
+
+    # Evaluating a member again starts a new round with a fresh reading
+    sensor.value = -1.0
+    assert negative() is True
+    assert positive() is False
+    assert len(reads) == 2
+
+    SensorRegistry().clear()
+
+
+def test_process_events_without_handlers(monkeypatch):
+    """Test that process_events does no work when nothing is registered."""
+    EVENT_HANDLERS.clear()
+    SCHEDULED.clear()
+    monkeypatch.setattr(
+        "spaxiom.events._threshold_plan",
+        lambda: pytest.fail("threshold plan built with no handlers"),
+    )
+
+    process_events()
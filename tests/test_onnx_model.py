@@ -18,12 +18,15 @@ except ImportError:
 from spaxiom import OnnxModel
 
 
-def create_simple_onnx_model(path):
+def create_simple_onnx_model(path, elem_type=None):
     """Create a simple ONNX model that adds two inputs and saves it to the specified path."""
+    if elem_type is None:
+        elem_type = TensorProto.FLOAT
+
     # Create the graph with one add operation
-    X = helper.make_tensor_value_info("X", TensorProto.FLOAT, [1, 3])
-    Y = helper.make_tensor_value_info("Y", TensorProto.FLOAT, [1, 3])
-    Z = helper.make_tensor_value_info("output", TensorProto.FLOAT, [1, 3])
+    X = helper.make_tensor_value_info("X", elem_type, [1, 3])
+    Y = helper.make_tensor_value_info("Y", elem_type, [1, 3])
+    Z = helper.make_tensor_value_info("output", elem_type, [1, 3])
 
     # Create an Add node (Z = X + Y)
     node_def = helper.make_node(
@@ -100,6 +103,19 @@ class TestOnnxModel(unittest.TestCase):
         # Session should be loaded after prediction
         self.assertIsNotNone(model._session)
 
+    def test_predict_float16_model(self):
+        """Test that float32 inputs are converted for a float16 model."""
+        fp16_path = os.path.join(self.temp_dir.name, "fp16_model.onnx")
+        create_simple_onnx_model(fp16_path, TensorProto.FLOAT16)
+        model = OnnxModel("fp16_model", fp16_path, ["X", "Y"])
+
+        X = np.array([[1.0, 2.0, 3.0]], dtype=np.float32)
+        Y = np.array([[4.0, 5.0, 6.0]], dtype=np.float32)
+        result = model.predict(X=X, Y=Y)
+
+        self.assertEqual(np.float16, result.dtype)
+        np.testing.assert_allclose(result, [[5.0, 7.0, 9.0]])
+
     def test_missing_input(self):
         """Test that predict raises ValueError when input is missing."""
         model = OnnxModel("test_model", self.model_path, ["X", "Y"])
@@ -2,12 +2,17 @@
 Tests for the plugins module.
 """
 
+import importlib.metadata
+import json
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from spaxiom.plugins import (
+    load_entry_point_plugins,
+    load_plugin,
     register_plugin,
     reset_plugins,
+    ENTRY_POINT_GROUP,
     PLUGINS,
 )
 
@@ -70,6 +75,37 @@ class TestPlugins(unittest.TestCase):
         # Verify plugins were cleared
         self.assertEqual(0, len(PLUGINS))
 
+    def test_load_plugin_is_cached(self):
+        """Test that a plugin module is only imported once."""
+        with patch("importlib.import_module", return_value=json) as import_module:
+            self.assertIs(json, load_plugin("json"))
+            self.assertIs(json, load_plugin("json"))
+
+        import_module.assert_called_once_with("json")
+
+    def test_load_entry_point_plugins(self):
+        """Test that plugin functions advertised as entry points are registered."""
+
+        def entry_point_plugin():
+            pass
+
+        entry_point = MagicMock()
+        entry_point.name = "example"
+        entry_point.value = "example_package:entry_point_plugin"
+        entry_point.load.return_value = entry_point_plugin
+        entry_points = MagicMock()
+        entry_points.select.return_value = [entry_point]
+
+        with patch.object(
+            importlib.metadata, "entry_points", return_value=entry_points
+        ):
+            load_entry_point_plugins()
+            load_entry_point_plugins()
+
+        entry_points.select.assert_called_with(group=ENTRY_POINT_GROUP)
+        entry_point.load.assert_called_once_with()
+        self.assertEqual([entry_point_plugin], PLUGINS)
+
 
 if __name__ == "__main__":
     unittest.main()
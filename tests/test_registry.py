@@ -5,8 +5,10 @@ Tests for the Sensor Registry module.
 import unittest
 from unittest.mock import MagicMock
 
+import pytest
+
 from spaxiom.registry import SensorRegistry
-from spaxiom.core import Sensor
+from spaxiom.core import Sensor, SensorRegistry as CoreSensorRegistry
 
 
 class TestSensorRegistry(unittest.TestCase):
@@ -97,6 +99,18 @@ class TestSensorRegistry(unittest.TestCase):
             self.assertIn(name, all_sensors)
             self.assertEqual(sensor, all_sensors[name])
 
+        # The result is a copy, while view_all() is read-only but live
+        view = registry.view_all()
+        all_sensors["list_test_new"] = sensors["list_test_0"]
+        self.assertNotIn("list_test_new", registry.list_all())
+        with self.assertRaises(TypeError):
+            view["list_test_new"] = sensors["list_test_0"]
+        sensor = MagicMock(spec=Sensor)
+        sensor.name = "list_test_3"
+        registry.add(sensor)
+        self.assertNotIn("list_test_3", all_sensors)
+        self.assertIn("list_test_3", view)
+
     def test_clear(self):
         """Test clearing all sensors from the registry."""
         registry = SensorRegistry()
@@ -117,5 +131,89 @@ class TestSensorRegistry(unittest.TestCase):
         self.assertEqual(0, len(registry.list_all()))
 
 
+@pytest.mark.usefixtures("clean_sensor_registry")
+class TestSensorFactories(unittest.TestCase):
+    """Test lazily created sensors in the core SensorRegistry."""
+
+    def test_factory_creates_sensor_on_first_get(self):
+        """Test that a factory runs once, on the first lookup."""
+        registry = CoreSensorRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return Sensor(name="lazy_sensor", sensor_type="test", location=(0, 0, 0))
+
+        registry.add_factory("lazy_sensor", factory)
+        self.assertEqual([], calls)
+        self.assertNotIn("lazy_sensor", registry.list_all())
+
+        sensor = registry.get("lazy_sensor")
+        self.assertIs(sensor, registry.get("lazy_sensor"))
+        self.assertEqual([1], calls)
+        self.assertIn("lazy_sensor", registry.list_public())
+
+    def test_duplicate_factory(self):
+        """Test that a factory name must not clash with existing sensors."""
+        registry = CoreSensorRegistry()
+        Sensor(name="eager_sensor", sensor_type="test", location=(0, 0, 0))
+        registry.add_factory("lazy_sensor", lambda: None)
+
+        with self.assertRaises(ValueError):
+            registry.add_factory("eager_sensor", lambda: None)
+        with self.assertRaises(ValueError):
+            registry.add_factory("lazy_sensor", lambda: None)
+
+        # A factory that doesn't create its sensor is reported as missing
+        with self.assertRaises(KeyError):
+            registry.get("lazy_sensor")
+
+
+@pytest.mark.usefixtures("clean_sensor_registry")
+class TestPrivacyViews(unittest.TestCase):
+    """Test listing sensors by privacy level in the core SensorRegistry."""
+
+    def test_list_public_and_private(self):
+        """Test that sensors are listed by privacy level as copies."""
+        registry = CoreSensorRegistry()
+        public = Sensor(name="public", sensor_type="test", location=(0, 0, 0))
+        private = Sensor(
+            name="private", sensor_type="test", location=(0, 0, 0), privacy="private"
+        )
+        public_sensors = registry.list_public()
+        private_sensors = registry.list_private()
+
+        self.assertEqual({"public": public}, public_sensors)
+        self.assertEqual({"private": private}, private_sensors)
+
+        # Changing the result or the registry does not affect the other
+        public_sensors["other"] = public
+        self.assertNotIn("other", registry.list_public())
+        registry.clear()
+        self.assertEqual(1, len(private_sensors))
+        self.assertEqual({}, registry.list_public())
+        self.assertEqual({}, registry.list_private())
+
+
+@pytest.mark.usefixtures("clean_sensor_registry")
+class TestReadMany(unittest.TestCase):
+    """Test batch reads from the core SensorRegistry."""
+
+    def test_read_many(self):
+        """Test reading named sensors and all sensors at once."""
+        registry = CoreSensorRegistry()
+        for name, value in (("a", 1.0), ("b", 2.0), ("c", 3.0)):
+            sensor = Sensor(name=name, sensor_type="test", location=(0, 0, 0))
+            sensor._read_raw = lambda value=value: value
+
+        self.assertEqual({"c": 3.0, "a": 1.0}, registry.read_many(["c", "a"]))
+        self.assertEqual(["c", "a"], list(registry.read_many(["c", "a"])))
+        self.assertEqual({"a": 1.0, "b": 2.0, "c": 3.0}, registry.read_many())
+        self.assertEqual(2.0, registry.get("b").last_value)
+
+        with self.assertRaises(KeyError):
+            registry.read_many(["a", "missing"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,9 +3,30 @@ Tests for the Spaxiom sensor scheduler system.
 """
 
 import asyncio
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
+import spaxiom.runtime as runtime
+from spaxiom.condition import Condition as TemporalCondition
+from spaxiom.events import EVENT_HANDLERS
+from spaxiom.logic import Condition
 from spaxiom.sensor import RandomSensor
-from spaxiom.runtime import _poll_sensor, shutdown, ACTIVE_TASKS
+from spaxiom.runtime import (
+    _evaluate_conditions,
+    _poll_sensor,
+    _run_tick_callbacks,
+    _update_poll_scale,
+    format_sensor_value,
+    on_tick,
+    shutdown,
+    use_uvloop,
+    wake,
+    ACTIVE_TASKS,
+    PRIVATE_SENSORS_WARNED,
+    TICK_CALLBACKS,
+)
 
 
 class TestScheduler:
@@ -124,6 +145,288 @@ class TestSchedulerIntegration:
         assert 3 <= ratio <= 6, f"Expected ratio of ~5, got {ratio}"
 
 
+class TestTickCallbacks:
+    """Test callbacks registered with on_tick."""
+
+    @pytest.mark.asyncio
+    async def test_tick_callback_rate(self):
+        """Test that tick callbacks run once per tick period."""
+        tick_count = 0
+
+        def count_tick():
+            nonlocal tick_count
+            tick_count += 1
+
+        on_tick(count_tick)
+        try:
+            # 0.1s period for 0.55s → ticks at 0.0, 0.1, ..., 0.5
+            tick_task = asyncio.create_task(_run_tick_callbacks(0.1))
+            await asyncio.sleep(0.55)
+            tick_task.cancel()
+            await tick_task
+        finally:
+            TICK_CALLBACKS.clear()
+
+        assert 5 <= tick_count <= 7, f"Expected ~6 ticks, got {tick_count}"
+
+    @pytest.mark.asyncio
+    async def test_tick_callback_error_does_not_stop_ticks(self):
+        """Test that a failing tick callback does not stop the others."""
+        calls = []
+
+        @on_tick
+        def failing():
+            raise RuntimeError("boom")
+
+        on_tick(lambda: calls.append(1))
+        try:
+            tick_task = asyncio.create_task(_run_tick_callbacks(0.05))
+            await asyncio.sleep(0.12)
+            tick_task.cancel()
+            await tick_task
+        finally:
+            TICK_CALLBACKS.clear()
+
+        assert len(calls) >= 2
+
+    @pytest.mark.asyncio
+    async def test_evaluation_wakes_on_sensor_update(self, monkeypatch):
+        """Test that conditions are re-evaluated as soon as a reading arrives."""
+        evaluations = 0
+
+        def count_evaluation():
+            nonlocal evaluations
+            evaluations += 1
+            return False
+
+        updated = asyncio.Event()
+        monkeypatch.setattr(runtime, "SENSORS_UPDATED", updated)
+        EVENT_HANDLERS.clear()
+        EVENT_HANDLERS.append((Condition(count_evaluation), lambda: None))
+        try:
+            # A long max wait, so only the update event can trigger evaluations
+            task = asyncio.create_task(_evaluate_conditions(10, max_wait_s=10.0))
+            await asyncio.sleep(0.05)
+            assert evaluations == 1
+
+            updated.set()
+            await asyncio.sleep(0.05)
+            assert evaluations == 2
+            assert not updated.is_set()
+
+            task.cancel()
+            await task
+        finally:
+            EVENT_HANDLERS.clear()
+
+    @pytest.mark.asyncio
+    async def test_evaluation_wakes_at_window_deadline(self, monkeypatch):
+        """Test that a within() condition fires once its window has elapsed."""
+        from spaxiom.temporal import within
+
+        monkeypatch.setattr(runtime, "SENSORS_UPDATED", asyncio.Event())
+        fired = []
+
+        EVENT_HANDLERS.clear()
+        EVENT_HANDLERS.append(
+            (
+                within(0.05, TemporalCondition(lambda: True)),
+                lambda: fired.append(time.monotonic()),
+            )
+        )
+        try:
+            # A long max wait, so only the window deadline can wake the loop
+            start = time.monotonic()
+            task = asyncio.create_task(_evaluate_conditions(10, max_wait_s=10.0))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            await task
+        finally:
+            EVENT_HANDLERS.clear()
+
+        assert len(fired) == 1
+        assert 0.05 <= fired[0] - start < 0.15
+
+    def test_wake_sets_update_event(self, monkeypatch):
+        """Test that wake() triggers an evaluation only while the runtime runs."""
+        monkeypatch.setattr(runtime, "SENSORS_UPDATED", None)
+        wake()
+
+        updated = asyncio.Event()
+        monkeypatch.setattr(runtime, "SENSORS_UPDATED", updated)
+        wake()
+        assert updated.is_set()
+
+    @pytest.mark.asyncio
+    async def test_evaluation_reads_each_sensor_once_per_pass(self):
+        """Test that conditions sharing a sensor trigger one read per pass."""
+        from spaxiom.core import SensorRegistry, current_tick
+
+        SensorRegistry().clear()
+        sensor = RandomSensor(name="shared_reads", location=(0, 0, 0))
+        reads = 0
+        raw = sensor._read_raw
+
+        def counted_read():
+            nonlocal reads
+            reads += 1
+            return raw()
+
+        sensor._read_raw = counted_read
+        EVENT_HANDLERS.clear()
+        # Plain conditions, so each one is evaluated on its own
+        EVENT_HANDLERS.append((Condition(lambda: sensor.read() > 2), lambda: None))
+        EVENT_HANDLERS.append((Condition(lambda: sensor.read() < -1), lambda: None))
+        try:
+            task = asyncio.create_task(_evaluate_conditions(10, max_wait_s=10.0))
+            await asyncio.sleep(0.05)
+            assert reads == 1
+            # Reads outside an evaluation pass are not cached
+            assert current_tick() is None
+
+            task.cancel()
+            await task
+        finally:
+            EVENT_HANDLERS.clear()
+            SensorRegistry().clear()
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_after_the_evaluation_tick(self):
+        """Test that callbacks read sensors afresh rather than from the pass's tick."""
+        from spaxiom.core import SensorRegistry
+
+        SensorRegistry().clear()
+        sensor = RandomSensor(name="actuated", location=(0, 0, 0))
+        values = iter([1.0, 2.0, 3.0])
+        sensor._read_raw = lambda: next(values)
+        seen = []
+
+        def callback():
+            seen.append(sensor.read())
+
+        EVENT_HANDLERS.clear()
+        EVENT_HANDLERS.append((Condition(lambda: sensor.read() + 0 > 0), callback))
+        try:
+            task = asyncio.create_task(_evaluate_conditions(10, max_wait_s=10.0))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            await task
+        finally:
+            EVENT_HANDLERS.clear()
+            SensorRegistry().clear()
+
+        assert seen == [2.0]
+
+    @pytest.mark.asyncio
+    async def test_evaluation_passes_condition_history(self, monkeypatch):
+        """Test that each condition receives a ring buffer of its own history."""
+        updated = asyncio.Event()
+        monkeypatch.setattr(runtime, "SENSORS_UPDATED", updated)
+        seen = []
+
+        def with_history(now=None, history=None):
+            seen.append(None if history is None else list(history))
+            return len(seen) % 2 == 0
+
+        EVENT_HANDLERS.clear()
+        EVENT_HANDLERS.append((Condition(lambda: True), lambda: None))
+        # The temporal Condition forwards now and history to its function
+        EVENT_HANDLERS.append((TemporalCondition(with_history), lambda: None))
+        try:
+            task = asyncio.create_task(_evaluate_conditions(2, max_wait_s=10.0))
+            for _ in range(3):
+                await asyncio.sleep(0.02)
+                updated.set()
+            await asyncio.sleep(0.02)
+            task.cancel()
+            await task
+        finally:
+            EVENT_HANDLERS.clear()
+
+        assert seen[0] is None
+        assert [value for _, value in seen[1]] == [False]
+        # Capped at history_length entries of this condition only
+        assert [value for _, value in seen[3]] == [True, False]
+
+
+class TestFormatSensorValue:
+    """Test privacy-aware formatting of sensor values."""
+
+    def test_public_and_private_values(self, caplog):
+        """Test that private values are redacted with a single warning."""
+        public = RandomSensor(name="format_public", location=(0, 0, 0))
+        private = RandomSensor(
+            name="format_private", location=(0, 0, 0), privacy="private"
+        )
+        PRIVATE_SENSORS_WARNED.clear()
+
+        try:
+            assert format_sensor_value(public, 0.25) == "0.25"
+            assert public._format is str
+
+            with caplog.at_level("WARNING", logger="spaxiom.runtime"):
+                assert format_sensor_value(private, 0.25) == "***"
+                assert format_sensor_value(private, 0.75) == "***"
+            assert len(caplog.records) == 1
+            assert "format_private" in PRIVATE_SENSORS_WARNED
+        finally:
+            PRIVATE_SENSORS_WARNED.clear()
+
+
+class TestAdaptivePolling:
+    """Test widening of the global poll period while conditions are quiet."""
+
+    def test_update_poll_scale(self, monkeypatch):
+        """Test that the scale doubles up to its cap and resets on a change."""
+        monkeypatch.setattr(runtime, "POLL_SCALE", 1.0)
+        monkeypatch.setattr(runtime, "MAX_POLL_SCALE", 5.0)
+        monkeypatch.setattr(runtime, "QUIET_EVALUATIONS", 2)
+
+        quiet = 0
+        scales = []
+        for _ in range(8):
+            quiet = _update_poll_scale(False, quiet)
+            scales.append(runtime.POLL_SCALE)
+        assert scales == [1.0, 2.0, 2.0, 4.0, 4.0, 5.0, 5.0, 5.0]
+
+        assert _update_poll_scale(True, quiet) == 0
+        assert runtime.POLL_SCALE == 1.0
+
+    @pytest.mark.asyncio
+    async def test_adaptive_poll_uses_scale(self, monkeypatch):
+        """Test that adaptive polling stretches the sample period."""
+        sensor = RandomSensor(name="adaptive_sensor", location=(0, 0, 0), hz=20.0)
+        monkeypatch.setattr(runtime, "POLL_SCALE", 4.0)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            raise asyncio.CancelledError
+
+        monkeypatch.setattr(runtime.asyncio, "sleep", fake_sleep)
+        await _poll_sensor(sensor, adaptive=True)
+        assert sleeps == [pytest.approx(0.2)]
+
+
+class TestUvloop:
+    """Test optional uvloop selection."""
+
+    def test_use_uvloop_without_uvloop(self):
+        """Test that the default loop is kept when uvloop is not installed."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert use_uvloop() is False
+
+    def test_use_uvloop_sets_policy(self):
+        """Test that the uvloop policy is installed when uvloop is available."""
+        fake_uvloop = MagicMock()
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}), patch(
+            "asyncio.set_event_loop_policy"
+        ) as set_policy:
+            assert use_uvloop() is True
+
+        set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy.return_value)
+
+
 class TestShutdown:
     """Test the graceful shutdown functionality."""
 
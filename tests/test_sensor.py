@@ -0,0 +1,68 @@
+"""
+Tests for the sensors and helpers in the sensor module.
+"""
+
+import unittest
+
+import numpy as np
+import pytest
+
+from spaxiom.sensor import BufferedDraws, RandomSensor
+
+
+@pytest.mark.usefixtures("clean_sensor_registry")
+class TestRandomSensor(unittest.TestCase):
+    """Test the buffered draws of RandomSensor."""
+
+    def test_reads_follow_global_seed(self):
+        """Test that reads use NumPy's global random state by default."""
+        sensor = RandomSensor(name="random_sensor", location=(0, 0, 0))
+
+        np.random.seed(7)
+        first = [sensor.read() for _ in range(3)]
+        np.random.seed(7)
+        second = [sensor.read() for _ in range(3)]
+
+        self.assertEqual(first, second)
+        self.assertIsNone(sensor._draws)
+
+    def test_seeded_reads_refill_buffer(self):
+        """Test that seeded reads walk the buffer and refill it when exhausted."""
+        sensor = RandomSensor(name="random_sensor", location=(0, 0, 0), seed=3)
+        self.assertEqual([], sensor._draws._buffer)
+
+        values = [sensor.read() for _ in range(RandomSensor.buffer_size + 1)]
+        expected = np.random.default_rng(3).random(2 * RandomSensor.buffer_size)
+
+        self.assertEqual(expected[: len(values)].tolist(), values)
+        self.assertEqual(1, sensor._draws._cursor)
+        self.assertTrue(all(isinstance(v, float) and 0 <= v < 1 for v in values))
+
+        other = RandomSensor(
+            name="other_sensor", location=(0, 0, 0), rng=np.random.default_rng(3)
+        )
+        self.assertEqual(values[0], other.read())
+
+
+class TestBufferedDraws(unittest.TestCase):
+    """Test drawing random values in blocks."""
+
+    def test_take_draws_blocks_lazily(self):
+        """Test that values come from blocks drawn only when needed."""
+        sizes = []
+
+        def draw(n):
+            sizes.append(n)
+            return np.arange(len(sizes) * 10, len(sizes) * 10 + n, dtype=float)
+
+        draws = BufferedDraws(draw, size=3)
+        self.assertEqual([], sizes)
+
+        values = [draws.take() for _ in range(4)]
+        self.assertEqual([10.0, 11.0, 12.0, 20.0], values)
+        self.assertEqual([3, 3], sizes)
+        self.assertTrue(all(type(value) is float for value in values))
+
+
+if __name__ == "__main__":
+    unittest.main()
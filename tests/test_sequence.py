@@ -203,7 +203,8 @@ class TestSequenceHelper:
         # Create a sequence condition
         seq_condition = sequence(cond1, cond2, within_s=5.0)
 
-        # Missing histories should return False
+        # Missing histories advance the pattern instead, which only records
+        # the initial states on the first call
         assert seq_condition(now=100.0) is False
 
         # Missing now should use current time
@@ -215,3 +216,96 @@ class TestSequenceHelper:
             assert (
                 False
             ), "sequence condition raised an exception with missing 'now' parameter"
+
+    def test_sequence_helper_without_histories(self):
+        """Test that the sequence condition advances itself when given no histories."""
+        state = {"a": False, "b": False}
+        seq_condition = sequence(
+            Condition(lambda: state["a"]), Condition(lambda: state["b"]), within_s=5.0
+        )
+
+        assert seq_condition(now=0.0) is False
+        state["a"] = True
+        assert seq_condition(now=1.0) is False
+        state["b"] = True
+        assert seq_condition(now=2.0) is True
+        # Fires once per completed sequence
+        assert seq_condition(now=3.0) is False
+
+    def test_advance_detects_sequence_from_events(self):
+        """Test that advance() tracks the sequence one event at a time."""
+        state = {"a": False, "b": False}
+        pattern = SequencePattern(
+            [Condition(lambda: state["a"]), Condition(lambda: state["b"])],
+            within_s=5.0,
+        )
+        assert pattern.advance(0.0) is False  # records the initial states
+
+        # Out of order: b before a does not complete the sequence
+        state["b"] = True
+        assert pattern.advance(1.0) is False
+        state["b"] = False
+        assert pattern.advance(1.5) is False
+
+        state["a"] = True
+        assert pattern.advance(2.0) is False
+        state["b"] = True
+        assert pattern.advance(3.0) is True
+
+    def test_advance_times_out(self):
+        """Test that advance() abandons a match that exceeds within_s."""
+        state = {"a": False, "b": False}
+        pattern = SequencePattern(
+            [Condition(lambda: state["a"]), Condition(lambda: state["b"])],
+            within_s=5.0,
+        )
+        pattern.advance(0.0)
+
+        state["a"] = True
+        assert pattern.advance(1.0) is False
+        state["b"] = True
+        assert pattern.advance(10.0) is False
+
+
+def test_advance_batches_threshold_conditions():
+    """Test that advance() evaluates threshold conditions in one batch."""
+    from spaxiom.core import Sensor, SensorRegistry
+    from spaxiom.logic import ThresholdCondition
+
+    SensorRegistry().clear()
+    door = Sensor(name="batch_door", sensor_type="test", location=(0, 0, 0))
+    door.value = 0.0
+    door._read_raw = lambda: door.value
+
+    opened = ThresholdCondition(door, ">", 0.5)
+    closed = ThresholdCondition(door, "<", 0.5)
+    pattern = SequencePattern([opened, closed], within_s=5.0)
+    assert pattern._batch is not None
+    assert len(pattern._batch.sensors) == 1
+
+    assert pattern.advance(0.0) is False
+    door.value = 1.0
+    assert pattern.advance(1.0) is False
+    door.value = 0.0
+    assert pattern.advance(2.0) is True
+    SensorRegistry().clear()
+
+
+def test_sensor_listeners():
+    """Test that notify() calls the listeners registered on a sensor."""
+    from spaxiom.core import Sensor, SensorRegistry
+
+    SensorRegistry().clear()
+    sensor = Sensor(name="listener_sensor", sensor_type="test", location=(0, 0, 0))
+    calls = []
+
+    @sensor.add_listener
+    def on_change():
+        calls.append(1)
+
+    sensor.notify()
+    sensor.remove_listener(on_change)
+    sensor.notify()
+
+    assert calls == [1]
+    SensorRegistry().clear()
@@ -2,9 +2,12 @@
 Tests for the SimVector module.
 """
 
+import importlib.util
 import unittest
 from unittest.mock import patch
 
+import numpy as np
+
 from spaxiom.sim.vec_sim import SimVector, SimSensor
 from spaxiom.core import SensorRegistry
 
@@ -88,6 +91,95 @@ class TestSimVector(unittest.TestCase):
         self.assertIn("hz=5.0", repr_str)
         self.assertIn("running=False", repr_str)
 
+    def test_read_all(self):
+        """Test that read_all matches the per-sensor calculation."""
+        sim_vec = SimVector(n=4, hz=10.0)
+
+        for t in (0.0, 0.3, 1.7):
+            values = sim_vec.read_all(t)
+            self.assertEqual((4,), values.shape)
+            for sensor, value in zip(sim_vec.sensors, values):
+                self.assertAlmostEqual(sensor.calculate_value(t), value, places=9)
+
+    def test_read_all_mixed_frequencies(self):
+        """Test read_all when sensors have different frequencies."""
+        # frequency, amplitude, phase, offset for each of the three sensors
+        self.mock_random.side_effect = (
+            [0.2, 1.0, 0.5, 0.0] + [0.7, 1.5, 2.0, 0.3] + [1.1, 0.8, 4.0, -0.2]
+        )
+        sim_vec = SimVector(n=3, hz=10.0)
+        self.assertIsNone(sim_vec._shared_omega)
+
+        values = sim_vec.read_all(0.9)
+        for sensor, value in zip(sim_vec.sensors, values):
+            self.assertAlmostEqual(sensor.calculate_value(0.9), value, places=9)
+
+    @unittest.skipIf(importlib.util.find_spec("numba") is None, "numba not installed")
+    def test_numba_step_matches_numpy(self):
+        """Test that the compiled kernel matches the NumPy expression."""
+        self.mock_random.side_effect = (
+            [0.2, 1.0, 0.5, 0.0] + [0.7, 1.5, 2.0, 0.3] + [1.1, 0.8, 4.0, -0.2]
+        )
+        sim_vec = SimVector(n=3, hz=10.0)
+        self.assertIsNotNone(sim_vec._step)
+
+        # start() runs the kernel once so it is compiled before the first update
+        with patch.object(sim_vec, "_step", wraps=sim_vec._step) as step, patch(
+            "threading.Thread"
+        ):
+            sim_vec.start()
+            sim_vec.stop()
+        step.assert_called_once()
+
+        values = sim_vec.read_all(2.3)
+        expected = sim_vec._offset + sim_vec._amplitude * np.sin(
+            sim_vec._omega * 2.3 + sim_vec._phase
+        )
+        np.testing.assert_allclose(values, expected, rtol=1e-12, atol=1e-12)
+
+    def test_read_all_float32(self):
+        """Test that a float32 vector stays close to the float64 values."""
+        for prefix, side_effect in (
+            ("shared", [0.2, 1.0, 0.5, 0.0] * 3),
+            (
+                "mixed",
+                [0.2, 1.0, 0.5, 0.0] + [0.7, 1.5, 2.0, 0.3] + [1.1, 0.8, 4.0, -0.2],
+            ),
+        ):
+            self.mock_random.side_effect = side_effect
+            sim_vec = SimVector(n=3, hz=10.0, name_prefix=prefix, dtype=np.float32)
+
+            values = sim_vec.read_all(12.5)
+            self.assertEqual(np.float32, values.dtype)
+            self.assertEqual(np.float32, sim_vec._values.dtype)
+            expected = [sensor.calculate_value(12.5) for sensor in sim_vec.sensors]
+            np.testing.assert_allclose(values, expected, atol=1e-4)
+
+            sim_vec[0].current_value = 0.25
+            self.assertEqual(0.25, sim_vec[0].read())
+
+    def test_read_slice(self):
+        """Test that read_slice matches the corresponding part of read_all."""
+        sim_vec = SimVector(n=5, hz=10.0)
+
+        expected = sim_vec.read_all(0.4)
+        values = sim_vec.read_slice(1, 4, 0.4)
+
+        self.assertEqual((3,), values.shape)
+        for i in range(3):
+            self.assertAlmostEqual(expected[i + 1], values[i], places=12)
+
+    def test_sensors_share_vector_storage(self):
+        """Test that sensor values are stored in the vector's shared array."""
+        sim_vec = SimVector(n=3, hz=10.0)
+
+        sim_vec[1].current_value = 2.5
+
+        self.assertEqual(2.5, sim_vec[1].read())
+        self.assertEqual(2.5, sim_vec._values[1])
+        self.assertEqual(0.0, sim_vec[0].read())
+        self.assertEqual(0.0, sim_vec[2].read())
+
     @patch("threading.Thread")
     @patch("time.time")
     def test_start_and_stop(self, mock_time, mock_thread):
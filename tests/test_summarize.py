@@ -128,3 +128,31 @@ class TestRollingSummary:
 
         summary.clear()
         assert summary.is_empty() is True
+
+    def test_incremental_statistics_match_window(self):
+        """Test that the incremental statistics match a scan of the window."""
+        rng = np.random.default_rng(0)
+        summary = RollingSummary(window=7)
+
+        for i, value in enumerate(rng.integers(-5, 5, size=200).astype(float)):
+            summary.add(value)
+            if i == 100:
+                summary.clear()
+                continue
+            readings = list(summary.readings)
+            assert summary.get_min() == min(readings)
+            assert summary.get_max() == max(readings)
+            assert summary.get_average() == pytest.approx(np.mean(readings))
+
+    def test_slope_matches_least_squares(self):
+        """Test that the incremental slope matches a least squares fit."""
+        rng = np.random.default_rng(2)
+        summary = RollingSummary(window=6)
+        summary.add(1.0)
+        assert summary.get_slope() is None
+
+        for value in rng.normal(size=50):
+            summary.add(value)
+            readings = list(summary.readings)
+            expected = np.polyfit(np.arange(len(readings)), readings, 1)[0]
+            assert summary.get_slope() == pytest.approx(expected)
@@ -5,8 +5,17 @@ Tests for the Temporal module functionality.
 from collections import deque
 import time
 
+import numpy as np
+
 from spaxiom.condition import Condition
-from spaxiom.temporal import TemporalWindow, within
+from spaxiom.events import SCHEDULED
+from spaxiom.temporal import (
+    RingHistory,
+    SequencePattern,
+    TemporalWindow,
+    time_until_deadline,
+    within,
+)
 
 
 def test_temporal_window_initialization():
@@ -211,3 +220,113 @@ def test_within_time_progression():
     t3 = base_time + 3.0
     history.append((t3, True))  # Still True at t=3
     assert temporal_cond(now=t3, history=history) is True
+
+
+def test_within_without_history():
+    """Test that within() tracks the base condition itself when given no history."""
+    state = {"value": True}
+    temporal_cond = within(2.0, Condition(lambda: state["value"]))
+    SCHEDULED.clear()
+
+    assert temporal_cond(now=1000.0) is False
+    # Nothing is scheduled; the window exposes its deadline instead
+    assert not SCHEDULED
+    assert time_until_deadline(1000.5) == 1.5
+    assert temporal_cond(now=1001.0) is False
+    assert temporal_cond(now=1002.0) is True
+    assert time_until_deadline(1002.0) is None
+
+    # A false reading restarts the run and clears the deadline
+    state["value"] = False
+    assert temporal_cond(now=1003.0) is False
+    assert time_until_deadline(1003.0) is None
+
+    state["value"] = True
+    assert temporal_cond(now=1004.0) is False
+    assert temporal_cond(now=1006.5) is True
+
+    # Marked so the runtime leaves the window to track its base itself, also
+    # when combined with other conditions
+    plain = Condition(lambda: True)
+    assert temporal_cond._stateful
+    assert (plain & ~temporal_cond)._stateful
+    assert not (plain | ~plain)._stateful
+
+
+def test_window_deadline_from_history():
+    """Test that evaluate() derives the window deadline from the history."""
+    window = TemporalWindow(2.0, Condition(lambda: True))
+    history = deque([(10.0, True), (11.0, False), (12.0, True), (13.0, True)])
+
+    assert window.evaluate(13.0, history) is False
+    assert window.deadline == 14.0
+    assert window.evaluate(14.0, history) is True
+
+    history.append((14.5, False))
+    assert window.evaluate(14.5, history) is False
+    assert window.deadline is None
+
+
+def test_ring_history():
+    """Test that RingHistory behaves like a bounded deque of (timestamp, value)."""
+    history = RingHistory(4)
+    reference = deque(maxlen=4)
+    entries = [
+        (1.0, False),
+        (2.0, True),
+        (3.0, True),
+        (4.0, False),
+        (5.0, True),
+        (6.0, False),
+    ]
+
+    for timestamp, value in entries:
+        history.push(timestamp, value)
+        reference.append((timestamp, value))
+        assert list(history) == list(reference)
+        assert list(reversed(history)) == list(reversed(reference))
+        assert history[-1] == reference[-1]
+        assert history[0] == reference[0]
+        assert len(history) == len(reference)
+
+    # Oldest entry (3.0, True) can't be an edge since its predecessor is gone
+    assert history.rising_edges().tolist() == [5.0]
+    assert history.rising_edges(since=5.5).tolist() == []
+
+    window = TemporalWindow(1.0, Condition(lambda: True))
+    assert window.evaluate(5.0, history) is False
+
+
+def test_sequence_with_ring_history():
+    """Test that SequencePattern gives the same result for RingHistory and deque."""
+    pattern = SequencePattern(
+        [Condition(lambda: True), Condition(lambda: True)], within_s=5.0
+    )
+    first = [(0.0, False), (1.0, True), (2.0, False)]
+    second = [(0.0, False), (1.5, False), (3.0, True)]
+
+    rings = []
+    for entries in (first, second):
+        ring = RingHistory(8)
+        for timestamp, value in entries:
+            ring.push(timestamp, value)
+        rings.append(ring)
+
+    for now in (3.0, 6.0, 7.0):
+        expected = pattern.evaluate(now, [deque(first), deque(second)])
+        assert pattern.evaluate(now, rings) is expected
+    assert pattern.evaluate(3.0, rings) is True
+    assert pattern.evaluate(7.0, rings) is False
+
+
+def test_ring_history_last_rising_edge():
+    """Test last_rising_edge against rising_edges, including wrapped buffers."""
+    rng = np.random.default_rng(1)
+    history = RingHistory(5)
+    assert history.last_rising_edge() is None
+
+    for i, value in enumerate(rng.random(40) < 0.5):
+        history.push(float(i), bool(value))
+        edges = history.rising_edges()
+        expected = float(edges[-1]) if edges.size else None
+        assert history.last_rising_edge() == expected
@@ -3,7 +3,10 @@ Unit tests for the units module.
 """
 
 import unittest
+import pint
+
 from spaxiom import Quantity
+from spaxiom.units import convert, resolve_conversion, resolve_unit
 from spaxiom.sensor import Sensor
 
 
@@ -115,6 +118,36 @@ class TestUnits(unittest.TestCase):
         self.assertEqual(value_cm.magnitude, 4200.0)
         self.assertEqual(str(value_cm.units), "centimeter")
 
+    def test_resolve_unit(self):
+        """Test that unit strings are parsed once and can be passed as Units."""
+        unit = resolve_unit("degC")
+        self.assertIs(unit, resolve_unit("degC"))
+
+        temp = Quantity(20, unit)
+        self.assertEqual(temp, Quantity(20, "degC"))
+        self.assertEqual(str(temp.units), "degree_Celsius")
+
+        with self.assertRaises(pint.UndefinedUnitError):
+            Quantity(1, "not_a_unit")
+
+    def test_convert(self):
+        """Test that cached conversions match Pint's own conversions."""
+        for value, source, target in (
+            (25.0, "degC", "degF"),
+            (33.7, "m", "ft"),
+            (6.74, "s", "minutes"),
+            (2.0, "m", "m"),
+        ):
+            quantity = Quantity(value, source)
+            converted = convert(quantity, target)
+            expected = quantity.to(target)
+            self.assertAlmostEqual(expected.magnitude, converted.magnitude)
+            self.assertEqual(expected.units, converted.units)
+
+        self.assertIs(resolve_conversion("m", "ft"), resolve_conversion("m", "ft"))
+        with self.assertRaises(pint.DimensionalityError):
+            convert(Quantity(1, "m"), "s")
+
 
 if __name__ == "__main__":
     unittest.main()